@@ -0,0 +1,283 @@
+"""
+Sustained concurrency: the Flask app against the ASGI app at increasing
+numbers of concurrent keep-alive connections.
+
+  flask  gunicorn, 1 worker, gthread with --threads threads (the production
+         setup: at most --threads requests in progress at once)
+  asgi   uvicorn, 1 worker, one event loop (productivity.asgi_factory);
+         inference on INFERENCE_WORKERS threads
+
+Async only pays off while requests wait on repository I/O, so the repository
+is either DynamoDB (--repo dynamodb: a moto server, or --dynamodb-endpoint) or
+the in-memory one with --io-latency-ms of simulated round-trip time added to
+every repository call (time.sleep under Flask, asyncio.sleep under ASGI).
+Load generation and per-route statistics are loadtest.py's; every connection
+is closed loop, so throughput ~= connections / latency until a server saturates.
+
+Run from the repo root:
+  PYTHONPATH=src python benchmarks/bench_async.py --io-latency-ms 10 --concurrency 8,32,128
+  PYTHONPATH=src python benchmarks/bench_async.py --repo dynamodb --threads 8 --out bench_async.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Any, Dict, List, Optional, Sequence
+
+from loadtest import DEFAULT_MIX, LoadRun, LocalDynamoDB, _free_port, build_report, parse_mix
+
+MODES = ("flask", "asgi")
+LATENCY_ENV = "BENCH_IO_LATENCY_MS"
+
+
+# -------------------------
+# Apps under test (imported by the server processes)
+# -------------------------
+
+class SleepyRepository:
+    """
+    Sync repository wrapper: `latency` seconds of blocking wait per call, like a network round trip.
+    """
+
+    def __init__(self, repo: Any, latency: float):
+        self._repo = repo
+        self._latency = latency
+
+    def save(self, employee):
+        time.sleep(self._latency)
+        return self._repo.save(employee)
+
+    def get(self, employee_id):
+        time.sleep(self._latency)
+        return self._repo.get(employee_id)
+
+    def save_many(self, employees):
+        time.sleep(self._latency)
+        return self._repo.save_many(employees)
+
+    def get_many(self, employee_ids):
+        time.sleep(self._latency)
+        return self._repo.get_many(employee_ids)
+
+    def query(self, query):
+        time.sleep(self._latency)
+        return self._repo.query(query)
+
+
+class AsyncSleepyRepository:
+    """
+    Async repository wrapper: `latency` seconds of non-blocking wait per call.
+    """
+
+    def __init__(self, repo: Any, latency: float):
+        self._repo = repo
+        self._latency = latency
+
+    async def save(self, employee):
+        await asyncio.sleep(self._latency)
+        return await self._repo.save(employee)
+
+    async def get(self, employee_id):
+        await asyncio.sleep(self._latency)
+        return await self._repo.get(employee_id)
+
+    async def save_many(self, employees):
+        await asyncio.sleep(self._latency)
+        return await self._repo.save_many(employees)
+
+    async def get_many(self, employee_ids):
+        await asyncio.sleep(self._latency)
+        return await self._repo.get_many(employee_ids)
+
+    async def query(self, query):
+        await asyncio.sleep(self._latency)
+        return await self._repo.query(query)
+
+
+def _latency() -> float:
+    return float(os.getenv(LATENCY_ENV, "0")) / 1e3
+
+
+def flask_app():
+    from productivity.app_factory import create_app
+
+    app = create_app()
+    if _latency() > 0:
+        service = app.config["EMPLOYEE_SERVICE"]
+        service._repo = SleepyRepository(service._repo, _latency())
+    return app
+
+
+def asgi_app():
+    from productivity.asgi_factory import create_asgi_app
+
+    app = create_asgi_app()
+    if _latency() > 0:
+        service = app.state.employee_service
+        service._repo = AsyncSleepyRepository(service._repo, _latency())
+    return app
+
+
+# -------------------------
+# Servers
+# -------------------------
+
+class Server:
+    """
+    One server process (gunicorn or uvicorn) on an ephemeral port.
+    """
+
+    def __init__(self, mode: str, env: Dict[str, str], threads: int):
+        self.mode = mode
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        bind = f"127.0.0.1:{self.port}"
+        if mode == "flask":
+            self.command = [
+                sys.executable, "-m", "gunicorn", "--workers", "1", "--worker-class", "gthread",
+                "--threads", str(threads), "--keep-alive", "75", "--backlog", "2048",
+                "--bind", bind, "--log-level", "warning", "bench_async:flask_app()",
+            ]
+        else:
+            self.command = [
+                sys.executable, "-m", "uvicorn", "--factory", "bench_async:asgi_app",
+                "--host", "127.0.0.1", "--port", str(self.port), "--backlog", "2048",
+                "--timeout-keep-alive", "75", "--log-level", "warning", "--no-access-log",
+            ]
+        here = os.path.dirname(os.path.abspath(__file__))
+        self.env = {
+            **os.environ,
+            **env,
+            "PYTHONPATH": os.pathsep.join([here, *filter(None, [os.getenv("PYTHONPATH")])]),
+        }
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> str:
+        self._process = subprocess.Popen(self.command, env=self.env)
+        deadline = time.monotonic() + 120  # model load + warm-up
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"{self.mode} server exited with {self._process.returncode}: {' '.join(self.command)}")
+            try:
+                with urllib.request.urlopen(f"{self.url}/health", timeout=1) as resp:
+                    if resp.status == 200:
+                        return self.url
+            except OSError:
+                time.sleep(0.2)
+        raise RuntimeError(f"{self.mode} server did not become healthy on {self.url}")
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+
+# -------------------------
+# Runs
+# -------------------------
+
+def run_mode(
+    mode: str, env: Dict[str, str], args: argparse.Namespace, concurrency_levels: Sequence[int]
+) -> List[Dict[str, Any]]:
+    reports = []
+    with Server(mode, env, args.threads) as url:
+        load = LoadRun(url, args.mix, concurrency_levels[0], seed=args.seed)
+        load.seed_employees(args.seed_employees)
+        ids = list(load.ids)
+        for concurrency in concurrency_levels:
+            load = LoadRun(url, args.mix, concurrency, seed=args.seed)
+            load.ids = list(ids)
+            print(f"{mode}: {concurrency} connections for {args.warmup:g}s warm-up + {args.duration:g}s", file=sys.stderr)
+            seconds = load.run(args.duration, args.warmup)
+            reports.append(build_report(load, seconds, {"mode": mode, "concurrency": concurrency}))
+    return reports
+
+
+def print_table(results: Dict[str, List[Dict[str, Any]]]) -> None:
+    print(f"{'mode':<8s}{'conns':>7s}{'req/s':>10s}{'p50 ms':>10s}{'p99 ms':>10s}{'errors':>9s}{'vs flask':>10s}")
+    flask_rps = {r["config"]["concurrency"]: r["overall"]["throughput_rps"] for r in results.get("flask", [])}
+    for mode, reports in results.items():
+        for report in reports:
+            s = report["overall"]
+            if not s["requests"]:
+                print(f"{mode:<8s}{report['config']['concurrency']:7d}{'-':>10s}")
+                continue
+            base = flask_rps.get(report["config"]["concurrency"])
+            ratio = f"{s['throughput_rps'] / base:9.2f}x" if base and mode != "flask" else f"{'':>10s}"
+            print(
+                f"{mode:<8s}{report['config']['concurrency']:7d}{s['throughput_rps']:10.1f}"
+                f"{s['latency_ms']['p50']:10.2f}{s['latency_ms']['p99']:10.2f}{s['error_rate']:9.2%}{ratio}"
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare sustained concurrency of the Flask and ASGI apps.")
+    parser.add_argument("--modes", default=",".join(MODES), help="comma-separated subset of flask,asgi")
+    parser.add_argument("--concurrency", default="8,32,128", help="comma-separated connection counts")
+    parser.add_argument("--threads", type=int, default=8, help="gunicorn gthread threads for the Flask app")
+    parser.add_argument("--inference-workers", type=int, default=4, help="INFERENCE_WORKERS for the ASGI app")
+    parser.add_argument("--repo", choices=("memory", "dynamodb"), default="memory")
+    parser.add_argument("--dynamodb-endpoint", default=None, help="e.g. DynamoDB Local; default: start a moto server")
+    parser.add_argument("--io-latency-ms", type=float, default=10.0,
+                        help="simulated latency per repository call (memory repo only)")
+    parser.add_argument("--model", default=None, help="MODEL_PATH for both apps (default: the apps' default)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"route weights (default {DEFAULT_MIX})")
+    parser.add_argument("--duration", type=float, default=15.0, help="measured seconds per level")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds of load before measuring")
+    parser.add_argument("--seed-employees", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_async.json", help="JSON results path")
+    args = parser.parse_args(argv)
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+    concurrency_levels = [int(c) for c in args.concurrency.split(",")]
+    if args.seed_employees < 1:
+        parser.error("--seed-employees must be at least 1")
+
+    env = {
+        "REPO_TYPE": args.repo,
+        "AGGREGATES_DAILY_RECOMPUTE": "0",
+        "INFERENCE_WORKERS": str(args.inference_workers),
+        LATENCY_ENV: str(args.io_latency_ms if args.repo == "memory" else 0),
+    }
+    if args.model:
+        env["MODEL_PATH"] = args.model
+
+    dynamodb = LocalDynamoDB(args.dynamodb_endpoint) if args.repo == "dynamodb" else None
+    if dynamodb is not None:
+        env.update(dynamodb.__enter__())
+    try:
+        results = {mode: run_mode(mode, env, args, concurrency_levels) for mode in modes}
+    finally:
+        if dynamodb is not None:
+            dynamodb.__exit__(None, None, None)
+
+    print_table(results)
+    config = {
+        "repo": args.repo,
+        "io_latency_ms": args.io_latency_ms if args.repo == "memory" else 0,
+        "threads": args.threads,
+        "inference_workers": args.inference_workers,
+        "mix": args.mix,
+        "duration": args.duration,
+        "warmup": args.warmup,
+    }
+    with open(args.out, "w") as f:
+        json.dump({"config": config, "results": results}, f, indent=2)
+    print(f"\nWrote {os.path.abspath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
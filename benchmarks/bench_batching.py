@@ -0,0 +1,94 @@
+"""
+Prediction micro-batching under concurrency: N threads call
+EmployeeService.predict_productivity back to back (prediction cache off, so
+every call reaches the model), once without a batcher and once per batching
+window, and report throughput, per-call latency and mean rows per model call.
+
+Run from the repo root:
+  PYTHONPATH=src python benchmarks/bench_batching.py --model src/ml/model.pkl --threads 32
+  PYTHONPATH=src python benchmarks/bench_batching.py --windows-ms 0.5,2,5 --max-rows 64 --duration 10
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from bench_create import PAYLOADS
+from ml.registry import ModelRegistry
+from productivity.persistence.in_memory_employee_repo import InMemoryEmployeeRepository
+from productivity.services.employee_service import EmployeeService
+from productivity.services.prediction_batcher import PredictionBatcher
+from productivity.services.prediction_cache import PredictionCache
+
+
+def run(service: EmployeeService, ids: List[str], threads: int, duration: float, warmup: float) -> Dict[str, Any]:
+    start = time.perf_counter()
+    warmup_until, stop_at = start + warmup, start + warmup + duration
+    latencies: List[List[float]] = [[] for _ in range(threads)]
+
+    def worker(index: int) -> None:
+        rng = random.Random(index)
+        local = latencies[index]
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                break
+            service.predict_productivity(rng.choice(ids))
+            if now >= warmup_until:
+                local.append(time.perf_counter() - now)
+
+    workers = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    all_ms = np.concatenate([np.asarray(l) for l in latencies]) * 1e3
+    p50, p99 = np.percentile(all_ms, [50, 99])
+    return {"calls_per_second": len(all_ms) / duration, "p50_ms": float(p50), "p99_ms": float(p99)}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Throughput of concurrent predict calls with and without micro-batching.")
+    parser.add_argument("--model", default="src/ml/model.pkl")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--windows-ms", default="1,2,5", help="comma-separated batching windows to try")
+    parser.add_argument("--max-rows", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=5.0, help="measured seconds per configuration")
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--employees", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    models = ModelRegistry()
+    models.load("current", args.model)
+    repo = InMemoryEmployeeRepository()
+    seeding = EmployeeService(repo, models=models)
+    ids = [seeding.create_employee(PAYLOADS[i % len(PAYLOADS)])["id"] for i in range(args.employees)]
+
+    print(f"{args.threads} threads, {args.model}, prediction cache off")
+    print(f"{'config':<22s}{'calls/s':>10s}{'p50 ms':>10s}{'p99 ms':>10s}{'rows/call':>11s}{'speedup':>9s}")
+    baseline = None
+    configs = [None] + [float(w) for w in args.windows_ms.split(",")]
+    for window_ms in configs:
+        batcher = None if window_ms is None else PredictionBatcher(max_delay=window_ms / 1e3, max_batch_rows=args.max_rows)
+        service = EmployeeService(repo, models=models, prediction_cache=PredictionCache(max_entries=0), batcher=batcher)
+        result = run(service, ids, args.threads, args.duration, args.warmup)
+        rows = "1.0"
+        if batcher is not None:
+            rows = f"{batcher.stats()['mean_batch_rows']:.1f}"
+            batcher.close()
+        baseline = baseline or result["calls_per_second"]
+        name = "unbatched" if window_ms is None else f"{window_ms:g} ms / {args.max_rows} rows"
+        print(
+            f"{name:<22s}{result['calls_per_second']:10.1f}{result['p50_ms']:10.2f}{result['p99_ms']:10.2f}"
+            f"{rows:>11s}{result['calls_per_second'] / baseline:8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Population-wide scoring / feature encoding: dict-of-objects repo vs columnar repo.
+
+  objects:  walk every domain object (EmployeeColumns.from_employees / encode_many)
+  columnar: ColumnarEmployeeRepository views (columns() / feature_columns())
+
+Run from the repo root:  PYTHONPATH=src python benchmarks/bench_columnar.py [rows]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import date
+
+import joblib
+import numpy as np
+
+from ml.dataset import _make_employee
+from ml.encoder import FeatureEncoder
+from productivity.analytics.productivity_engine import EmployeeColumns, estimate_productivity_batch
+from productivity.persistence.columnar_employee_repo import CATEGORIES, ColumnarEmployeeRepository
+from productivity.persistence.in_memory_employee_repo import InMemoryEmployeeRepository
+
+
+def _best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(rows: int = 100_000, model_path: str = "src/ml/model.pkl") -> None:
+    random.seed(0)
+    employees = [_make_employee(i) for i in range(rows)]
+
+    objects = InMemoryEmployeeRepository()
+    objects.save_many(employees)
+    columnar = ColumnarEmployeeRepository()
+    columnar.save_many(employees)
+
+    as_of = date.today()
+    stored = list(objects._store.values())
+
+    expected = estimate_productivity_batch(EmployeeColumns.from_employees(stored), as_of=as_of)
+    assert np.array_equal(expected, estimate_productivity_batch(columnar.columns(), as_of=as_of))
+
+    print(f"rows: {rows:,}")
+    t_obj = _best_of(lambda: estimate_productivity_batch(EmployeeColumns.from_employees(stored), as_of=as_of))
+    t_col = _best_of(lambda: estimate_productivity_batch(columnar.columns(), as_of=as_of))
+    print(f"score all   objects: {t_obj * 1e3:8.1f} ms   columnar: {t_col * 1e3:8.1f} ms   ({t_obj / t_col:.0f}x)")
+
+    try:
+        encoder = FeatureEncoder.from_pipeline(joblib.load(model_path))
+    except (OSError, ValueError):
+        print(f"(no model at {model_path}; skipping feature encoding)")
+        return
+
+    t_obj = _best_of(lambda: encoder.encode_many(stored, as_of=as_of), repeat=2)
+    t_col = _best_of(lambda: encoder.encode_columns(columnar.feature_columns(), CATEGORIES, as_of=as_of))
+    print(f"encode all  objects: {t_obj * 1e3:8.1f} ms   columnar: {t_col * 1e3:8.1f} ms   ({t_obj / t_col:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,80 @@
+"""
+Create-path microbenchmark: raw JSON dict -> validated request -> domain employee.
+
+  before: non-discriminated Union validate -> model_dump() -> EmployeeFactory.from_payload
+  after:  discriminated Union validate -> EmployeeFactory.from_request
+
+Run from the repo root:  PYTHONPATH=src python benchmarks/bench_create.py
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Any, Dict, List, Union
+
+from pydantic import TypeAdapter
+
+from productivity.factories.employee_factory import EmployeeFactory
+from productivity.schemas.employee_create import (
+    BenefitsEligibleEmployeeCreate,
+    CreateEmployeeRequest,
+    HourlyEmployeeCreate,
+    IndividualContributorCreate,
+    ManagerCreate,
+)
+
+LEGACY_ADAPTER = TypeAdapter(
+    Union[HourlyEmployeeCreate, BenefitsEligibleEmployeeCreate, ManagerCreate, IndividualContributorCreate]
+)
+ADAPTER = TypeAdapter(CreateEmployeeRequest)
+
+_COMMON: Dict[str, Any] = {
+    "contact": {
+        "name": {"first_name": "Ada", "last_name": "Lovelace"},
+        "address": "123 Main St",
+        "phone_number": "555-555-5555",
+        "email": "ada@example.com",
+        "emergency_contact": {"first_name": "Emergency", "last_name": "Contact"},
+    },
+    "employment_date": "2019-03-01",
+    "education_level": "MASTERS",
+    "employment_level": "SENIOR",
+    "last_year_earnings": 125000.0,
+    "overtime_earnings": 2500.0,
+    "bonus": 8000.0,
+}
+
+PAYLOADS: List[Dict[str, Any]] = [
+    {**_COMMON, "type": "hourly", "contractual_work_hours": 20.0, "actual_work_hours": 22.5, "hourly_earnings": 18.0},
+    {**_COMMON, "type": "benefits_eligible", "contractual_work_hours": 30.0, "actual_work_hours": 28.0},
+    {
+        **_COMMON, "type": "manager", "base_pay": 140000.0, "last_promotion_date": "2021-06-15",
+        "num_projects": 4, "num_employees": 12,
+    },
+    {
+        **_COMMON, "type": "individual_contributor", "base_pay": 130000.0, "last_promotion_date": "2020-01-10",
+        "num_projects": 3, "num_patents": 1, "num_publications": 6, "num_external_collaborations": 2,
+    },
+]
+
+
+def legacy_create(raw: Dict[str, Any]):
+    return EmployeeFactory.from_payload(LEGACY_ADAPTER.validate_python(raw).model_dump())
+
+
+def fast_create(raw: Dict[str, Any]):
+    return EmployeeFactory.from_request(ADAPTER.validate_python(raw))
+
+
+def main(number: int = 20_000) -> None:
+    for raw in PAYLOADS:
+        assert legacy_create(raw) == fast_create(raw), raw["type"]
+
+    print(f"{'type':<24}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for raw in PAYLOADS:
+        before = min(timeit.repeat(lambda: legacy_create(raw), number=number, repeat=3)) / number * 1e6
+        after = min(timeit.repeat(lambda: fast_create(raw), number=number, repeat=3)) / number * 1e6
+        print(f"{raw['type']:<24}{before:>14.2f}{after:>14.2f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
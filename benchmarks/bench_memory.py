@@ -0,0 +1,119 @@
+"""
+Memory per employee held in InMemoryEmployeeRepository.
+
+  before: regular (__dict__) dataclasses, a fresh Name/str per record
+  after:  the slotted domain classes, built by EmployeeFactory (interned Names/strings)
+
+Records arrive as NDJSON lines, so every record starts with its own string
+copies, like real HR data. "before" mirrors the domain classes with plain
+dataclasses of the same fields.
+
+Run from the repo root:  PYTHONPATH=src python benchmarks/bench_memory.py [rows]
+"""
+from __future__ import annotations
+
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import date
+from enum import Enum
+from typing import Any, Callable, Dict, List, get_type_hints
+
+from ml.dataset import _make_employee
+from productivity.domain.contact_info import ContactInfo
+from productivity.domain.name import Name
+from productivity.factories.employee_factory import EmployeeFactory
+from productivity.persistence.in_memory_employee_repo import InMemoryEmployeeRepository
+from productivity.serializers.employee_serializer import EmployeeSerializer
+
+_LEGACY: Dict[type, type] = {}
+_HINTS: Dict[type, Dict[str, Any]] = {}
+_TYPE_BY_CLASS = {model_cls: emp_type for emp_type, model_cls in EmployeeFactory.TYPE_MAP.items()}
+
+
+def _legacy_cls(cls: type) -> type:
+    """
+    Same fields as `cls`, but a regular dataclass with a per-instance __dict__.
+    """
+    legacy = _LEGACY.get(cls)
+    if legacy is None:
+        legacy = _LEGACY[cls] = make_dataclass(f"Legacy{cls.__name__}", [f.name for f in fields(cls)], eq=True)
+    return legacy
+
+
+def _legacy_build(cls: type, data: Dict[str, Any]) -> Any:
+    hints = _HINTS.get(cls)
+    if hints is None:
+        hints = _HINTS[cls] = get_type_hints(cls)
+    kwargs = {}
+    for f in fields(cls):
+        value, tp = data[f.name], hints[f.name]
+        if tp in (Name, ContactInfo):
+            value = _legacy_build(tp, value)
+        elif isinstance(tp, type) and issubclass(tp, Enum):
+            value = tp(value)
+        elif tp is date:
+            value = date.fromisoformat(value)
+        kwargs[f.name] = value
+    return _legacy_cls(cls)(**kwargs)
+
+
+def _records(rows: int) -> List[str]:
+    random.seed(42)
+    lines = []
+    for i in range(rows):
+        emp = _make_employee(i)
+        record = EmployeeSerializer.to_dict(emp)
+        record.pop("extra_earnings", None)
+        record["type"] = _TYPE_BY_CLASS[emp.__class__]
+        lines.append(json.dumps(record))
+    return lines
+
+
+def _bytes_per_employee(lines: List[str], build: Callable[[Dict[str, Any]], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    repo = InMemoryEmployeeRepository()
+    for i, line in enumerate(lines):
+        payload = json.loads(line)
+        emp = build(payload)
+        emp.id = f"emp-{i}"
+        repo.save(emp)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / len(lines)
+
+
+def _legacy_from_payload(payload: Dict[str, Any]) -> Any:
+    model_cls = EmployeeFactory.TYPE_MAP[payload.pop("type")]
+    payload.setdefault("id", "")
+    if "extra_earnings" in model_cls.__dataclass_fields__:
+        payload["extra_earnings"] = payload["bonus"] + payload["overtime_earnings"]
+    return _legacy_build(model_cls, payload)
+
+
+def main(rows: int = 20_000) -> None:
+    lines = _records(rows)
+
+    # behaviour check on a sample: same fields, equality and productivity
+    for line in lines[:500]:
+        emp = EmployeeFactory.from_payload(json.loads(line))
+        assert EmployeeFactory.from_payload(json.loads(line)) == emp
+        legacy = _legacy_from_payload(json.loads(line))
+        assert all(getattr(legacy, f.name) == getattr(emp, f.name) for f in fields(emp) if f.name != "contact")
+
+    before = _bytes_per_employee(lines, _legacy_from_payload)
+    after = _bytes_per_employee(lines, EmployeeFactory.from_payload)
+
+    print(f"rows: {rows:,}")
+    print(f"before (dict dataclasses, no interning): {before:,.0f} bytes/employee")
+    print(f"after  (slotted + interned):             {after:,.0f} bytes/employee")
+    print(f"saved: {before - after:,.0f} bytes/employee ({1 - after / before:.1%})")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,134 @@
+"""
+Inference cost of each model type in ml.train_model.MODEL_TYPES.
+
+For every type: train on generated rows, then report holdout MAE, artifact
+size, resident memory added by loading it, and serving-path latency
+(LoadedModel.predict: compiled encoder + model) for one row and a 10k batch.
+With --mae-budget, also names the fastest single-row model within the budget.
+
+Run from the repo root:  PYTHONPATH=src python benchmarks/bench_models.py [--rows 100000] [--mae-budget 0.25]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import joblib
+import numpy as np
+from sklearn.metrics import mean_absolute_error
+
+from ml.dataset import _make_employee
+from ml.generate_dataset import sample_chunk
+from ml.registry import LoadedModel
+from ml.schema import FEATURE_COLUMNS, TARGET_COLUMN
+from ml.train_model import MODEL_TYPES, build_pipeline
+
+BATCH_ROWS = 10_000
+
+
+def _rss_bytes() -> Optional[int]:
+    # resident set size from /proc (Linux); None elsewhere
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _median_of(fn, repeat: int = 300) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def bench(model_type: str, train_df, holdout_df, employees, n_estimators: int, tmp: Path) -> Dict[str, Any]:
+    pipeline = build_pipeline(model_type, n_jobs=-1, n_estimators=n_estimators)
+    start = time.perf_counter()
+    pipeline.fit(train_df[FEATURE_COLUMNS], train_df[TARGET_COLUMN])
+    fit_seconds = time.perf_counter() - start
+    model = pipeline.named_steps["model"]
+    if "n_jobs" in model.get_params():
+        model.set_params(n_jobs=None)  # as saved by train_model
+
+    mae = mean_absolute_error(holdout_df[TARGET_COLUMN], pipeline.predict(holdout_df[FEATURE_COLUMNS]))
+    path = tmp / f"{model_type}.pkl"
+    joblib.dump(pipeline, path)
+    del pipeline, model
+
+    gc.collect()
+    before = _rss_bytes()
+    loaded = LoadedModel.load(model_type, path)
+    after = _rss_bytes()
+    loaded.warm_up()
+
+    one = employees[:1]
+    return {
+        "model": model_type,
+        "mae": mae,
+        "fit_s": fit_seconds,
+        "artifact_mb": path.stat().st_size / 1e6,
+        "memory_mb": (after - before) / 1e6 if before is not None and after is not None else float("nan"),
+        "single_row_ms": _median_of(lambda: loaded.predict(one)) * 1e3,
+        "batch_10k_ms": _best_of(lambda: loaded.predict(employees)) * 1e3,
+        "compiled_encoder": loaded.encoder is not None,
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="training rows")
+    parser.add_argument("--n-estimators", type=int, default=150)
+    parser.add_argument("--mae-budget", type=float, default=None)
+    parser.add_argument("--types", nargs="+", choices=MODEL_TYPES, default=list(MODEL_TYPES))
+    args = parser.parse_args(argv)
+
+    as_of = date.today()
+    rng = np.random.default_rng(0)
+    train_df = sample_chunk(rng, args.rows, as_of, noise_std=0.15)
+    holdout_df = sample_chunk(rng, BATCH_ROWS, as_of, noise_std=0.15)
+    random.seed(0)
+    employees = [_make_employee(i) for i in range(BATCH_ROWS)]
+
+    print(f"training rows: {args.rows:,}  n_estimators: {args.n_estimators}  batch: {BATCH_ROWS:,}")
+    print(f"{'model':<12s}{'MAE':>8s}{'fit s':>9s}{'artifact MB':>13s}{'memory MB':>11s}{'1 row ms':>10s}{'10k ms':>9s}  encoder")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for model_type in args.types:
+            r = bench(model_type, train_df, holdout_df, employees, args.n_estimators, Path(tmp))
+            results.append(r)
+            print(
+                f"{r['model']:<12s}{r['mae']:8.4f}{r['fit_s']:9.2f}{r['artifact_mb']:13.1f}{r['memory_mb']:11.1f}"
+                f"{r['single_row_ms']:10.3f}{r['batch_10k_ms']:9.1f}  {'compiled' if r['compiled_encoder'] else 'DataFrame'}"
+            )
+
+    if args.mae_budget is not None:
+        within = [r for r in results if r["mae"] <= args.mae_budget]
+        if within:
+            best = min(within, key=lambda r: r["single_row_ms"])
+            print(f"\nfastest within MAE <= {args.mae_budget}: {best['model']} ({best['single_row_ms']:.3f} ms/row)")
+        else:
+            print(f"\nno model within MAE <= {args.mae_budget}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+"""
+HTTP load test for the app built by productivity.app_factory.create_app.
+
+Starts the app in a child process (werkzeug, threaded) backed by the
+in-memory repo or a local DynamoDB stand-in (a moto server, or any endpoint
+given with --dynamodb-endpoint), seeds employees, then keeps --concurrency
+keep-alive connections busy for --duration seconds with a weighted mix of:
+
+  create        POST /employees
+  get           GET  /employees/<id>
+  productivity  GET  /employees/<id>/productivity
+  predict       GET  /employees/<id>/productivity/predict
+
+and writes per-route throughput, p50/p95/p99 latency and error rate as JSON.
+--url targets an already running server instead (e.g. a production-like WSGI
+setup); --compare prints the change against an earlier result file.
+
+Run from the repo root:
+  PYTHONPATH=src python benchmarks/loadtest.py --duration 30 --concurrency 16 --out loadtest.json
+  PYTHONPATH=src python benchmarks/loadtest.py --repo dynamodb --mix get=8,create=1
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from bench_create import PAYLOADS
+
+ROUTES = {
+    "create": "POST /employees",
+    "get": "GET /employees/<id>",
+    "productivity": "GET /employees/<id>/productivity",
+    "predict": "GET /employees/<id>/productivity/predict",
+}
+DEFAULT_MIX = "create=1,get=4,productivity=3,predict=2"
+TABLE_NAME = "employees-loadtest"
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ROUTES:
+            raise argparse.ArgumentTypeError(f"unknown route {name!r} (expected one of {', '.join(ROUTES)})")
+        mix[name] = float(weight or 1)
+    if not any(w > 0 for w in mix.values()):
+        raise argparse.ArgumentTypeError("the mix needs at least one positive weight")
+    return mix
+
+
+# -------------------------
+# Server under test
+# -------------------------
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _serve(env: Dict[str, str], ports: Any) -> None:
+    """
+    Child process: build the app from env and serve it on an ephemeral port.
+    """
+    os.environ.update(env)
+    from werkzeug.serving import make_server
+
+    from productivity.app_factory import create_app
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)  # no per-request access log
+    server = make_server("127.0.0.1", 0, create_app(), threaded=True)
+    ports.put(server.server_port)
+    server.serve_forever()
+
+
+class LocalDynamoDB:
+    """
+    The employees table on a local stand-in: a moto server started for the run,
+    or an existing endpoint (DynamoDB Local). Entering returns the env the app needs.
+    """
+
+    def __init__(self, endpoint: Optional[str] = None):
+        self.endpoint = endpoint
+        self._moto = None
+
+    def __enter__(self) -> Dict[str, str]:
+        from productivity.persistence.dynamodb_employee_repo import create_table
+
+        env = {
+            "REPO_TYPE": "dynamodb",
+            "EMPLOYEES_TABLE_NAME": TABLE_NAME,
+            "AWS_REGION": os.getenv("AWS_REGION", "us-east-1"),
+            # local stand-ins accept any credentials
+            "AWS_ACCESS_KEY_ID": os.getenv("AWS_ACCESS_KEY_ID", "loadtest"),
+            "AWS_SECRET_ACCESS_KEY": os.getenv("AWS_SECRET_ACCESS_KEY", "loadtest"),
+        }
+        endpoint = self.endpoint
+        if endpoint is None:
+            from moto.server import ThreadedMotoServer
+
+            logging.getLogger("werkzeug").setLevel(logging.WARNING)
+            port = _free_port()
+            self._moto = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+            self._moto.start()
+            endpoint = f"http://127.0.0.1:{port}"
+        env["DYNAMODB_ENDPOINT_URL"] = endpoint
+
+        os.environ.update({k: v for k, v in env.items() if k.startswith("AWS_")})
+        try:
+            create_table(TABLE_NAME, region_name=env["AWS_REGION"], endpoint_url=endpoint)
+        except Exception as e:
+            if "ResourceInUse" not in type(e).__name__ + str(e):
+                raise
+        return env
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._moto is not None:
+            self._moto.stop()
+
+
+class LocalStack:
+    """
+    The app (and, for --repo dynamodb without an endpoint, a moto server) for the duration of a run.
+    """
+
+    def __init__(self, repo: str, model_path: Optional[str], dynamodb_endpoint: Optional[str]):
+        self.repo = repo
+        self.model_path = model_path
+        self._dynamodb = LocalDynamoDB(dynamodb_endpoint) if repo == "dynamodb" else None
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> str:
+        env = {"REPO_TYPE": self.repo, "AGGREGATES_DAILY_RECOMPUTE": "0"}
+        if self.model_path:
+            env["MODEL_PATH"] = self.model_path
+
+        if self._dynamodb is not None:
+            env.update(self._dynamodb.__enter__())
+
+        ctx = multiprocessing.get_context("spawn")
+        ports = ctx.Queue()
+        self._process = ctx.Process(target=_serve, args=(env, ports), daemon=True)
+        self._process.start()
+        port = ports.get(timeout=120)  # model load + warm-up happen before the port is published
+        return f"http://127.0.0.1:{port}"
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(timeout=10)
+        if self._dynamodb is not None:
+            self._dynamodb.__exit__(*exc)
+
+
+# -------------------------
+# Load generation
+# -------------------------
+
+@dataclass
+class RouteStats:
+    latencies: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+
+
+class Client:
+    """
+    One keep-alive connection; reconnects after a transport error.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        self._host, self._port, self._timeout = parts.hostname, parts.port, timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Tuple[int, bytes]:
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        try:
+            self._conn.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+            response = self._conn.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self._conn.close()
+            self._conn = None
+            raise
+
+
+class LoadRun:
+    def __init__(self, base_url: str, mix: Dict[str, float], concurrency: int, seed: int = 0):
+        self.base_url = base_url
+        self.routes = [name for name, w in mix.items() if w > 0]
+        self.weights = [mix[name] for name in self.routes]
+        self.concurrency = concurrency
+        self.seed = seed
+        self.ids: List[str] = []
+        self._ids_lock = threading.Lock()
+        self.stats: Dict[str, RouteStats] = {name: RouteStats() for name in self.routes}
+        self._stats_lock = threading.Lock()
+
+    def seed_employees(self, n: int) -> None:
+        client = Client(self.base_url)
+        for i in range(n):
+            status, body = client.request("POST", "/employees", PAYLOADS[i % len(PAYLOADS)])
+            if status != 201:
+                raise RuntimeError(f"Seeding failed: POST /employees -> {status} {body[:200]!r}")
+            self.ids.append(json.loads(body)["id"])
+
+    def _call(self, client: Client, route: str, rng: random.Random) -> Tuple[int, Optional[str]]:
+        if route == "create":
+            status, body = client.request("POST", "/employees", rng.choice(PAYLOADS))
+            return status, json.loads(body).get("id") if status == 201 else None
+        employee_id = rng.choice(self.ids)
+        path = {
+            "get": f"/employees/{employee_id}",
+            "productivity": f"/employees/{employee_id}/productivity",
+            "predict": f"/employees/{employee_id}/productivity/predict",
+        }[route]
+        return client.request("GET", path)[0], None
+
+    def _worker(self, index: int, warmup_until: float, stop_at: float) -> None:
+        rng = random.Random(self.seed * 1_000_003 + index)
+        client = Client(self.base_url)
+        local = {name: RouteStats() for name in self.routes}
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                break
+            route = rng.choices(self.routes, self.weights)[0]
+            try:
+                status, new_id = self._call(client, route, rng)
+                ok = 200 <= status < 300
+            except (OSError, http.client.HTTPException) as e:
+                status, new_id, ok = type(e).__name__, None, False
+            elapsed = time.perf_counter() - now
+            if new_id is not None:
+                with self._ids_lock:
+                    self.ids.append(new_id)
+            if now >= warmup_until:
+                stats = local[route]
+                stats.latencies.append(elapsed)
+                stats.statuses[str(status)] += 1
+                stats.errors += not ok
+
+        with self._stats_lock:
+            for name, stats in local.items():
+                total = self.stats[name]
+                total.latencies.extend(stats.latencies)
+                total.statuses.update(stats.statuses)
+                total.errors += stats.errors
+
+    def run(self, duration: float, warmup: float) -> float:
+        """
+        Closed loop: every worker sends its next request as soon as the previous one returns.
+        Returns the measured (post-warm-up) window in seconds.
+        """
+        start = time.perf_counter()
+        warmup_until, stop_at = start + warmup, start + warmup + duration
+        workers = [
+            threading.Thread(target=self._worker, args=(i, warmup_until, stop_at), daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return time.perf_counter() - warmup_until
+
+
+# -------------------------
+# Report
+# -------------------------
+
+def _summary(stats: RouteStats, seconds: float) -> Dict[str, Any]:
+    count = len(stats.latencies)
+    latencies_ms = np.asarray(stats.latencies) * 1e3
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99]) if count else (None, None, None)
+    return {
+        "requests": count,
+        "throughput_rps": round(count / seconds, 2) if seconds > 0 else None,
+        "errors": stats.errors,
+        "error_rate": round(stats.errors / count, 6) if count else None,
+        "latency_ms": {
+            "mean": round(float(latencies_ms.mean()), 3) if count else None,
+            "p50": None if p50 is None else round(float(p50), 3),
+            "p95": None if p95 is None else round(float(p95), 3),
+            "p99": None if p99 is None else round(float(p99), 3),
+            "max": round(float(latencies_ms.max()), 3) if count else None,
+        },
+        "status_codes": dict(sorted(stats.statuses.items())),
+    }
+
+
+def build_report(load: LoadRun, seconds: float, config: Dict[str, Any]) -> Dict[str, Any]:
+    overall = RouteStats()
+    routes = {}
+    for name, stats in load.stats.items():
+        routes[ROUTES[name]] = _summary(stats, seconds)
+        overall.latencies.extend(stats.latencies)
+        overall.statuses.update(stats.statuses)
+        overall.errors += stats.errors
+    return {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {"python": platform.python_version(), "machine": platform.machine(), "cpus": os.cpu_count()},
+        "config": config,
+        "measured_seconds": round(seconds, 3),
+        "routes": routes,
+        "overall": _summary(overall, seconds),
+    }
+
+
+def print_report(report: Dict[str, Any], previous: Optional[Dict[str, Any]] = None) -> None:
+    print(f"{'route':<42s}{'req/s':>9s}{'p50 ms':>9s}{'p95 ms':>9s}{'p99 ms':>9s}{'errors':>9s}")
+    rows = list(report["routes"].items()) + [("overall", report["overall"])]
+    for route, s in rows:
+        lat = s["latency_ms"]
+        if not s["requests"]:
+            print(f"{route:<42s}{'-':>9s}")
+            continue
+        print(
+            f"{route:<42s}{s['throughput_rps']:9.1f}{lat['p50']:9.2f}{lat['p95']:9.2f}{lat['p99']:9.2f}"
+            f"{s['error_rate']:9.2%}"
+        )
+        if previous is not None:
+            before = previous["routes"].get(route) if route != "overall" else previous.get("overall")
+            if before and before["requests"]:
+                print(
+                    f"{'  vs previous':<42s}{s['throughput_rps'] / before['throughput_rps']:8.2f}x"
+                    f"{lat['p50'] / before['latency_ms']['p50']:8.2f}x{lat['p95'] / before['latency_ms']['p95']:8.2f}x"
+                    f"{lat['p99'] / before['latency_ms']['p99']:8.2f}x"
+                )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the employee productivity API.")
+    parser.add_argument("--url", default=None, help="test a running server instead of starting one")
+    parser.add_argument("--repo", choices=("memory", "columnar", "dynamodb"), default="memory")
+    parser.add_argument("--dynamodb-endpoint", default=None, help="e.g. DynamoDB Local; default: start a moto server")
+    parser.add_argument("--model", default=None, help="MODEL_PATH for the started app (default: the app's default)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"route weights (default {DEFAULT_MIX})")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="seconds of load before measuring")
+    parser.add_argument("--seed-employees", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="loadtest.json", help="JSON report path")
+    parser.add_argument("--compare", default=None, help="earlier JSON report to compare against")
+    args = parser.parse_args(argv)
+    if args.seed_employees < 1 and any(name != "create" and w > 0 for name, w in args.mix.items()):
+        parser.error("--seed-employees must be at least 1 when the mix reads employees")
+
+    config = {
+        "url": args.url,
+        "repo": None if args.url else args.repo,
+        "mix": args.mix,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "warmup": args.warmup,
+        "seed_employees": args.seed_employees,
+    }
+
+    stack = None if args.url else LocalStack(args.repo, args.model, args.dynamodb_endpoint)
+    base_url = args.url or stack.__enter__()
+    try:
+        load = LoadRun(base_url, args.mix, args.concurrency, seed=args.seed)
+        load.seed_employees(args.seed_employees)
+        print(f"{base_url}: {args.seed_employees:,} employees seeded; "
+              f"{args.concurrency} connections for {args.warmup:g}s warm-up + {args.duration:g}s", file=sys.stderr)
+        seconds = load.run(args.duration, args.warmup)
+    finally:
+        if stack is not None:
+            stack.__exit__(None, None, None)
+
+    report = build_report(load, seconds, config)
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+    print_report(report, previous)
+
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {os.path.abspath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
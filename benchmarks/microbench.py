@@ -0,0 +1,329 @@
+"""
+Microbenchmark suite for the request hot paths, with stored baselines.
+
+Each group sets up its fixtures once (nothing touches the network: DynamoDB
+items are encoded/decoded in-process, the model is trained on generated rows)
+and times its cases with timeit: autorange to >= 0.2s per run, best of
+--repeat runs, reported per call. Results are compared against
+benchmarks/baselines.json; a case slower than baseline * --threshold is a
+regression and the run exits with status 1.
+
+Run from the repo root:
+  PYTHONPATH=src python benchmarks/microbench.py            # compare against baselines
+  PYTHONPATH=src python benchmarks/microbench.py --save     # record new baselines
+  PYTHONPATH=src python benchmarks/microbench.py -k repo    # only groups matching "repo"
+
+Baselines are machine-specific: record them on the machine you compare on.
+On shared or throttled machines, raise --threshold (e.g. 1.5) to stay above the noise.
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import platform
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from itertools import cycle
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from bench_create import PAYLOADS
+from ml.dataset import _make_employee
+from ml.features import employee_to_features
+from ml.generate_dataset import sample_chunk
+from ml.registry import ModelRegistry
+from ml.schema import FEATURE_COLUMNS, TARGET_COLUMN
+from ml.train_model import build_pipeline
+from productivity.api.employees import create_employee_adapter
+from productivity.factories.employee_factory import EmployeeFactory
+from productivity.observability.metrics import REGISTRY as METRICS_REGISTRY, MetricsRegistry
+from productivity.persistence.dynamodb_employee_repo import DynamoDBEmployeeRepository
+from productivity.persistence.in_memory_employee_repo import InMemoryEmployeeRepository
+from productivity.services.employee_service import EmployeeService
+from productivity.services.prediction_cache import PredictionCache
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+REPO_SIZES = {"1k": 1_000, "100k": 100_000, "1M": 1_000_000}
+
+Case = Tuple[str, Callable[[], Any]]
+GROUPS: Dict[str, Callable[[], Iterator[Case]]] = {}
+
+
+def group(name: str):
+    def register(fn: Callable[[], Iterator[Case]]) -> Callable[[], Iterator[Case]]:
+        GROUPS[name] = fn
+        return fn
+    return register
+
+
+def _one_of_each_type() -> Dict[str, Any]:
+    """
+    type name -> one domain employee of that type, built from the bench_create payloads.
+    """
+    return {raw["type"]: EmployeeFactory.from_payload({**raw, "id": f"bench-{raw['type']}"}) for raw in PAYLOADS}
+
+
+# -------------------------
+# Groups
+# -------------------------
+
+@group("factory")
+def _factory() -> Iterator[Case]:
+    for raw in PAYLOADS:
+        payload = dict(raw)
+        yield f"from_payload[{raw['type']}]", lambda payload=payload: EmployeeFactory.from_payload(payload)
+
+
+@group("validation")
+def _validation() -> Iterator[Case]:
+    for raw in PAYLOADS:
+        yield f"create_employee_adapter[{raw['type']}]", lambda raw=raw: create_employee_adapter.validate_python(raw)
+
+
+@group("serialize")
+def _serialize() -> Iterator[Case]:
+    service = EmployeeService(InMemoryEmployeeRepository())
+    for name, emp in _one_of_each_type().items():
+        yield f"service._to_dict[{name}]", lambda emp=emp: service._to_dict(emp)
+
+
+@group("engine")
+def _engine() -> Iterator[Case]:
+    for name, emp in _one_of_each_type().items():
+        yield f"estimate_productivity[{name}]", emp.estimate_productivity
+
+
+@group("features")
+def _features() -> Iterator[Case]:
+    for name, emp in _one_of_each_type().items():
+        yield f"employee_to_features[{name}]", lambda emp=emp: employee_to_features(emp)
+
+
+@group("predict")
+def _predict() -> Iterator[Case]:
+    """
+    EmployeeService.predict_productivity: repo get -> encode -> cache lookup -> model.
+    The model is a default rf pipeline trained on 5k generated rows (fixed seeds).
+    """
+    import tempfile
+
+    import joblib
+
+    rng = np.random.default_rng(0)
+    df = sample_chunk(rng, 5_000, datetime(2025, 1, 1).date(), noise_std=0.15)
+    pipeline = build_pipeline("rf", n_jobs=None).fit(df[FEATURE_COLUMNS], df[TARGET_COLUMN])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "model.pkl"
+        joblib.dump(pipeline, path)
+        models = ModelRegistry()
+        models.load("bench", path)
+
+    repo = InMemoryEmployeeRepository()
+    employees = _one_of_each_type()
+    repo.save_many(list(employees.values()))
+
+    uncached = EmployeeService(repo, models=models, prediction_cache=PredictionCache(max_entries=0))
+    cached = EmployeeService(repo, models=models)
+    for name, emp in employees.items():
+        yield f"predict_productivity[{name}]", lambda emp=emp: uncached.predict_productivity(emp.id)
+    emp = employees["manager"]
+    cached.predict_productivity(emp.id)
+    yield "predict_productivity[manager, cache hit]", lambda: cached.predict_productivity(emp.id)
+
+
+@group("dynamodb")
+def _dynamodb() -> Iterator[Case]:
+    """
+    Item mapping only: put_item's wire encoding of _employee_to_item, and get's
+    wire decoding + _item_to_employee rehydration. No table is contacted.
+    """
+    repo = DynamoDBEmployeeRepository(table_name="bench", region_name="us-east-1")
+    serializer, deserializer = TypeSerializer(), TypeDeserializer()
+
+    def encode(emp):
+        item = repo._employee_to_item(emp)
+        return {k: serializer.serialize(v) for k, v in item.items()}
+
+    def decode(wire):
+        return repo._item_to_employee({k: deserializer.deserialize(v) for k, v in wire.items()})
+
+    for name, emp in _one_of_each_type().items():
+        wire = encode(emp)
+        yield f"encode_item[{name}]", lambda emp=emp: encode(emp)
+        yield f"get_rehydrate[{name}]", lambda wire=wire: decode(wire)
+
+
+@group("metrics")
+def _metrics() -> Iterator[Case]:
+    """
+    Instrumentation overhead: what each timed stage / request adds.
+    """
+    registry = MetricsRegistry()
+    child = registry.histogram("bench_stage_seconds", "bench", labelnames=("stage",)).labels("bench")
+    counter = registry.counter("bench_requests_total", "bench", labelnames=("route",)).labels("bench")
+
+    def timed():
+        with child.time():
+            pass
+
+    yield "stage_timer", timed
+    yield "histogram.observe", lambda: child.observe(0.0005)
+    yield "counter.inc", counter.inc
+    yield "render[productivity]", METRICS_REGISTRY.render
+
+
+def _repo_group(size: int) -> Callable[[], Iterator[Case]]:
+    def cases() -> Iterator[Case]:
+        """
+        In-memory repo holding `size` employees: get by id, save as an upsert
+        of an existing employee (same index entries, and moved to another
+        employment date so its entries are removed and re-inserted), and
+        save_many of 1k moved employees. The prefill is in random order, like a
+        real bulk ingest.
+        """
+        random.seed(0)
+        base = [_make_employee(i) for i in range(min(size, 1_000))]
+        employees = []
+        for i in range(size):
+            emp = copy.copy(base[i % len(base)])
+            emp.id = f"emp-{i:08d}"
+            employees.append(emp)
+        random.shuffle(employees)
+        repo = InMemoryEmployeeRepository()
+        repo.save_many(employees)
+
+        sample = random.sample(employees, min(size, 1_000))
+        moved = [copy.copy(e) for e in sample]
+        for e in moved:
+            e.employment_date += timedelta(days=1)
+        ids = cycle([e.id for e in sample])
+        to_save = cycle(sample)
+        to_move = cycle([e for pair in zip(moved, sample) for e in pair])  # alternate between the two dates
+        batches = cycle([moved, sample])
+        yield "get", lambda: repo.get(next(ids))
+        yield "save", lambda: repo.save(next(to_save))
+        yield "save[moved]", lambda: repo.save(next(to_move))
+        yield "save_many[1k moved]", lambda: repo.save_many(next(batches))
+    return cases
+
+
+for _label, _size in REPO_SIZES.items():
+    group(f"repo[{_label}]")(_repo_group(_size))
+
+
+# -------------------------
+# Timing / baselines
+# -------------------------
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    """
+    Seconds per call: best of `repeat` runs of an autoranged loop.
+    """
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+def _environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "numpy": np.__version__,
+    }
+
+
+def load_baselines(path: Path) -> Dict[str, Any]:
+    if not path.is_file():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baselines(path: Path, results: Dict[str, float], merge_into: Dict[str, Any]) -> None:
+    # a filtered run (-k) only replaces the cases it ran
+    merged = {**merge_into.get("results", {}), **results}
+    data = {
+        "environment": _environment(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": dict(sorted(merged.items())),
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def run(patterns: List[str], repeat: int, threshold: float, baselines: Dict[str, Any]) -> Tuple[Dict[str, float], List[str]]:
+    recorded = baselines.get("results", {})
+    results: Dict[str, float] = {}
+    regressions: List[str] = []
+
+    print(f"{'case':<60s}{'time':>11s}{'baseline':>13s}{'ratio':>8s}")
+    for group_name, cases in GROUPS.items():
+        if patterns and not any(p in group_name for p in patterns):
+            continue
+        for case_name, fn in cases():
+            name = f"{group_name}/{case_name}"
+            seconds = results[name] = measure(fn, repeat)
+
+            line = f"{name:<60s}{_format_time(seconds):>11s}"
+            baseline = recorded.get(name)
+            if baseline:
+                ratio = seconds / baseline
+                status = ""
+                if ratio > threshold:
+                    status = "  REGRESSION"
+                    regressions.append(name)
+                elif ratio < 1 / threshold:
+                    status = "  faster"
+                line += f"{_format_time(baseline):>13s}{ratio:7.2f}x{status}"
+            print(line, flush=True)
+    return results, regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Hot-path microbenchmarks with baseline comparison.")
+    parser.add_argument("-k", dest="patterns", action="append", default=[], help="only groups whose name contains this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=1.25, help="slower than baseline * threshold is a regression")
+    parser.add_argument("--baselines", type=Path, default=BASELINES_PATH)
+    parser.add_argument("--save", action="store_true", help="record the results as the new baselines")
+    parser.add_argument("--list", action="store_true", help="list the groups and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(GROUPS))
+        return 0
+
+    baselines = load_baselines(args.baselines)
+    recorded_env = baselines.get("environment")
+    if recorded_env and recorded_env != _environment() and not args.save:
+        print(f"warning: baselines were recorded on a different environment: {recorded_env}\n")
+
+    results, regressions = run(args.patterns, args.repeat, args.threshold, baselines)
+
+    if args.save:
+        save_baselines(args.baselines, results, baselines)
+        print(f"\nSaved {len(results)} baselines to {args.baselines}")
+        return 0
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.2f}x: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
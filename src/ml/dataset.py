@@ -8,7 +8,7 @@ from typing import List, Dict, Any
 import pandas as pd
 
 from productivity.domain.contact_info import ContactInfo
-from productivity.domain.name import Name
+from productivity.domain.interning import intern_name
 from productivity.domain.enums import EducationLevel, EmploymentLevel
 from productivity.domain.employee_fulltime import Manager, IndividualContributor
 from productivity.domain.employee_parttime import HourlyEmployee, BenefitsEligibleEmployee
@@ -26,11 +26,11 @@ def _rand_date(start_year: int = 2010, end_year: int = 2025) -> date:
 def _fake_contact(i: int) -> ContactInfo:
     # make it deterministic-ish and unique enough
     return ContactInfo(
-        name=Name(first_name=f"Test{i}", last_name="User"),
+        name=intern_name(f"Test{i}", "User"),
         address="123 Main St",
         phone_number="555-555-5555",
         email=f"test{i}@example.com",
-        emergency_contact=Name(first_name="Emergency", last_name="Contact"),
+        emergency_contact=intern_name("Emergency", "Contact"),
     )
 
 
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from ml.features import TYPE_BY_CLASSNAME, _full_years_between
+from ml.schema import FEATURE_COLUMNS
+from productivity.analytics.productivity_engine import full_years_between
+from productivity.domain.employee_base import AbstractEmployee
+
+# columns that are not plain attributes of the domain object
+_DERIVED_COLUMNS = {"employee_type", "employment_level", "education_level", "years_since_promotion"}
+
+
+class FeatureEncoder:
+    """
+    Compiled FEATURE_COLUMNS -> model-input encoder.
+
+    Built once from the fitted preprocessor: the one-hot (or ordinal code)
+    layout, the most-frequent/median imputation constants and the output
+    column order are baked into a template row. Encoding an employee copies the template and
+    writes the present values straight into a float64 buffer - no feature
+    dict, no DataFrame, no ColumnTransformer dispatch.
+
+    Produces byte-identical output to preprocess.transform(DataFrame(rows)).
+    """
+
+    def __init__(
+        self,
+        n_outputs: int,
+        categorical: Sequence[Tuple[str, Dict[str, int], Optional[str]]],
+        numeric: Sequence[Tuple[str, int, float]],
+        ordinal: Sequence[Tuple[str, int, Dict[str, float], float]] = (),
+    ):
+        """
+        categorical: (column, {category: output index}, imputer fill value)
+        numeric: (column, output index, imputer fill value; NaN = passthrough)
+        ordinal: (column, output index, {category: code}, code for unknown/missing)
+        """
+        self.n_outputs = n_outputs
+        self._categorical = [(col, dict(index), fill) for col, index, fill in categorical]
+        self._numeric = [(col, int(j), float(fill)) for col, j, fill in numeric]
+        self._ordinal = [(col, int(j), {k: float(v) for k, v in codes.items()}, float(unknown)) for col, j, codes, unknown in ordinal]
+
+        # template = all one-hots off, every numeric imputed, every ordinal unknown
+        self._template = np.zeros(n_outputs, dtype=np.float64)
+        for _, j, fill in self._numeric:
+            self._template[j] = fill
+        for _, j, _, unknown in self._ordinal:
+            self._template[j] = unknown
+
+        self._numeric_index = {col: j for col, j, _ in self._numeric}
+        self._plans: Dict[Type[AbstractEmployee], List[Tuple[str, int]]] = {}
+
+    # -------------------------
+    # Construction
+    # -------------------------
+
+    @classmethod
+    def from_pipeline(cls, pipeline: Any) -> "FeatureEncoder":
+        """
+        Compile from a fitted Pipeline([("preprocess", ColumnTransformer), ...]).
+        Raises ValueError for preprocessing it does not know how to reproduce.
+        """
+        preprocessor = getattr(pipeline, "named_steps", {}).get("preprocess")
+        if preprocessor is None or not hasattr(preprocessor, "transformers_"):
+            raise ValueError("Pipeline has no fitted 'preprocess' ColumnTransformer")
+        if getattr(preprocessor, "sparse_output_", False):
+            raise ValueError("Sparse ColumnTransformer output is not supported")
+
+        categorical: List[Tuple[str, Dict[str, int], Optional[str]]] = []
+        numeric: List[Tuple[str, int, float]] = []
+        ordinal: List[Tuple[str, int, Dict[str, float], float]] = []
+
+        for name, transformer, columns in preprocessor.transformers_:
+            if _is_passthrough(transformer):
+                offset = preprocessor.output_indices_[name].start
+                numeric.extend((col, offset + k, np.nan) for k, col in enumerate(columns))
+                continue
+            if isinstance(transformer, str):
+                if transformer == "drop" or len(columns) == 0:
+                    continue
+                raise ValueError(f"Unsupported transformer {name}={transformer!r}")
+
+            if type(transformer).__name__ == "OrdinalEncoder":
+                ordinal.extend(cls._ordinal_columns(transformer, columns, preprocessor.output_indices_[name].start))
+                continue
+
+            steps = list(transformer.named_steps.values()) if hasattr(transformer, "named_steps") else [transformer]
+            offset = preprocessor.output_indices_[name].start
+            imputer = steps[0] if type(steps[0]).__name__ == "SimpleImputer" else None
+            if imputer is not None and imputer.add_indicator:
+                raise ValueError("SimpleImputer(add_indicator=True) is not supported")
+            rest = steps[1:] if imputer is not None else steps
+
+            if not rest:
+                if imputer is None or imputer.strategy not in ("median", "mean", "constant"):
+                    raise ValueError(f"Unsupported numeric transformer: {transformer!r}")
+                for k, col in enumerate(columns):
+                    numeric.append((col, offset + k, imputer.statistics_[k]))
+                continue
+
+            onehot = rest[0]
+            if len(rest) != 1 or type(onehot).__name__ != "OneHotEncoder":
+                raise ValueError(f"Unsupported categorical transformer: {transformer!r}")
+            if onehot.drop_idx_ is not None or getattr(onehot, "infrequent_categories_", None):
+                raise ValueError("OneHotEncoder with drop/infrequent categories is not supported")
+
+            for k, col in enumerate(columns):
+                cats = onehot.categories_[k]
+                fill = imputer.statistics_[k] if imputer is not None else None
+                categorical.append((col, {c: offset + i for i, c in enumerate(cats)}, fill))
+                offset += len(cats)
+
+        encoded = {c for c, _, _ in categorical} | {c for c, _, _ in numeric} | {c for c, _, _, _ in ordinal}
+        if encoded != set(FEATURE_COLUMNS):
+            raise ValueError("Preprocessor columns do not match FEATURE_COLUMNS")
+
+        n_outputs = max(indices.stop for indices in preprocessor.output_indices_.values())
+        return cls(n_outputs=n_outputs, categorical=categorical, numeric=numeric, ordinal=ordinal)
+
+    @staticmethod
+    def _ordinal_columns(encoder: Any, columns: Sequence[str], offset: int) -> List[Tuple[str, int, Dict[str, float], float]]:
+        """
+        OrdinalEncoder -> (column, output index, {category: code}, unknown code) per column.
+        Only the configuration where unknown and missing values encode the same way is supported.
+        """
+        unknown = encoder.unknown_value if encoder.handle_unknown == "use_encoded_value" else None
+        missing = encoder.encoded_missing_value
+        same = unknown is not None and (unknown == missing or (unknown != unknown and missing != missing))
+        if not same or getattr(encoder, "infrequent_categories_", None):
+            raise ValueError(f"Unsupported OrdinalEncoder configuration: {encoder!r}")
+        return [
+            (col, offset + k, {c: float(i) for i, c in enumerate(encoder.categories_[k])}, float(unknown))
+            for k, col in enumerate(columns)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-safe preprocessing constants (inverse of from_dict).
+        """
+        return {
+            "n_outputs": self.n_outputs,
+            "categorical": [
+                {"column": col, "index": {str(k): int(j) for k, j in index.items()}, "fill": None if fill is None else str(fill)}
+                for col, index, fill in self._categorical
+            ],
+            "numeric": [{"column": col, "index": j, "fill": fill} for col, j, fill in self._numeric],
+            "ordinal": [
+                {"column": col, "index": j, "codes": codes, "unknown": unknown}
+                for col, j, codes, unknown in self._ordinal
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeatureEncoder":
+        return cls(
+            n_outputs=int(data["n_outputs"]),
+            categorical=[(c["column"], c["index"], c["fill"]) for c in data["categorical"]],
+            numeric=[(c["column"], c["index"], c["fill"]) for c in data["numeric"]],
+            ordinal=[(c["column"], c["index"], c["codes"], c["unknown"]) for c in data.get("ordinal", [])],
+        )
+
+    # -------------------------
+    # Encoding
+    # -------------------------
+
+    def encode(self, emp: AbstractEmployee, out: Optional[np.ndarray] = None, as_of: Optional[date] = None) -> np.ndarray:
+        """
+        Encode one employee into `out` (a float64 row of n_outputs), allocating if not given.
+        """
+        if out is None:
+            out = np.empty(self.n_outputs, dtype=np.float64)
+        out[:] = self._template
+
+        # categoricals: one index per column (unknown => all zeros, like handle_unknown="ignore")
+        for col, index, fill in self._categorical:
+            value = self._categorical_value(emp, col)
+            j = index.get(fill if value is None else value)
+            if j is not None:
+                out[j] = 1.0
+
+        for col, j, codes, unknown in self._ordinal:
+            value = self._categorical_value(emp, col)
+            out[j] = codes.get(value, unknown)
+
+        # numerics present on this class; absent ones keep the imputed template value
+        for attr, j in self._plan(emp.__class__):
+            v = getattr(emp, attr)
+            if v is not None and v == v:
+                out[j] = v
+
+        j = self._numeric_index.get("years_since_promotion")
+        if j is not None:
+            last_promo = getattr(emp, "last_promotion_date", None)
+            if last_promo is not None:
+                out[j] = _full_years_between(last_promo, as_of or date.today())
+
+        return out
+
+    def encode_many(self, employees: Sequence[AbstractEmployee], as_of: Optional[date] = None) -> np.ndarray:
+        """
+        Encode a batch into one preallocated (n, n_outputs) float64 matrix.
+        """
+        as_of = as_of or date.today()
+        X = np.empty((len(employees), self.n_outputs), dtype=np.float64)
+        for i, emp in enumerate(employees):
+            self.encode(emp, out=X[i], as_of=as_of)
+        return X
+
+    def encode_columns(
+        self,
+        columns: Mapping[str, np.ndarray],
+        categories: Mapping[str, Sequence[str]],
+        as_of: Optional[date] = None,
+    ) -> np.ndarray:
+        """
+        Encode a column store (e.g. ColumnarEmployeeRepository.feature_columns()) without
+        building domain objects. Categorical columns are int codes into `categories[col]`,
+        numerics are float64 with NaN for missing, and years_since_promotion is derived
+        from the "last_promotion_date" ordinal column (0 = no promotion date).
+        Same output as encode_many over the equivalent employees.
+        """
+        as_of = as_of or date.today()
+        n = len(next(iter(columns.values()))) if columns else 0
+        X = np.broadcast_to(self._template, (n, self.n_outputs)).copy()
+        rows = np.arange(n)
+
+        # codes are never missing, so the categorical imputer constants don't apply here
+        for col, index, _ in self._categorical:
+            # code -> output index (-1 = not a known category, left all zeros)
+            lookup = np.array([index.get(value, -1) for value in categories[col]], dtype=np.int64)
+            out_index = lookup[columns[col]]
+            known = out_index >= 0
+            X[rows[known], out_index[known]] = 1.0
+
+        for col, j, codes, unknown in self._ordinal:
+            lookup = np.array([codes.get(value, unknown) for value in categories[col]], dtype=np.float64)
+            X[:, j] = lookup[columns[col]]
+
+        for col, j, _ in self._numeric:
+            if col in _DERIVED_COLUMNS:
+                continue
+            values = columns.get(col)
+            if values is not None:
+                present = ~np.isnan(values)
+                X[present, j] = values[present]
+
+        j = self._numeric_index.get("years_since_promotion")
+        ordinals = columns.get("last_promotion_date")
+        if j is not None and ordinals is not None:
+            present = ordinals != 0
+            X[present, j] = np.maximum(full_years_between(ordinals[present], as_of), 0)
+
+        return X
+
+    @staticmethod
+    def _categorical_value(emp: AbstractEmployee, col: str) -> Optional[str]:
+        if col == "employee_type":
+            name = emp.__class__.__name__
+            return TYPE_BY_CLASSNAME.get(name, name.lower())
+        value = getattr(emp, col, None)
+        return None if value is None else value.value
+
+    def _plan(self, emp_cls: Type[AbstractEmployee]) -> List[Tuple[str, int]]:
+        """
+        Per-class list of (attribute, output index) for plain numeric columns, built once.
+        """
+        plan = self._plans.get(emp_cls)
+        if plan is None:
+            names = set(getattr(emp_cls, "__dataclass_fields__", ()))
+            plan = [
+                (col, j)
+                for col, j in self._numeric_index.items()
+                if col not in _DERIVED_COLUMNS and col in names
+            ]
+            self._plans[emp_cls] = plan
+        return plan
+
+
+def _is_passthrough(transformer: Any) -> bool:
+    # fitted ColumnTransformers hold "passthrough" as an identity FunctionTransformer
+    if isinstance(transformer, str):
+        return transformer == "passthrough"
+    return type(transformer).__name__ == "FunctionTransformer" and transformer.func is None
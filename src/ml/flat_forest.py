@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import joblib
+import numpy as np
+
+from ml.encoder import FeatureEncoder
+from ml.model import DEFAULT_MODEL_PATH
+from productivity.domain.employee_base import AbstractEmployee
+
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+ARRAYS = ("roots", "feature", "threshold", "children", "value")
+
+# rows per traversal block; bounds the (rows x trees) node-index matrix
+_BLOCK_ROWS = 1024
+
+
+class FlatForest:
+    """
+    RandomForestRegressor pipeline compiled to flat node arrays.
+
+    All trees live in one set of contiguous arrays (global node ids):
+      feature (int32), threshold (float32), children (int32, [left, right]
+      per node), value (float32)
+    plus roots (int32, one per tree). Leaves point to themselves, so a batch
+    is evaluated by stepping every (row, tree) pair one level at a time with
+    pure NumPy gathers - no per-tree or per-row Python loop.
+
+    The artifact is a directory of .npy files + manifest.json (which also holds
+    the FeatureEncoder constants), so arrays can be memory-mapped on load.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], max_depth: int, encoder: Optional[FeatureEncoder] = None):
+        self.roots = arrays["roots"]
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.children = arrays["children"]
+        self.value = arrays["value"]
+        self.max_depth = int(max_depth)
+        self.encoder = encoder
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    # -------------------------
+    # Compile / save / load
+    # -------------------------
+
+    @classmethod
+    def from_pipeline(cls, pipeline: Any) -> "FlatForest":
+        """
+        Compile a fitted Pipeline(preprocess -> RandomForestRegressor).
+        """
+        forest = pipeline[-1]
+        estimators = getattr(forest, "estimators_", None)
+        if not estimators or getattr(forest, "n_outputs_", 1) != 1:
+            raise ValueError("Expected a fitted single-output forest as the final pipeline step")
+
+        roots, features, thresholds, children, values = [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for est in estimators:
+            tree = est.tree_
+            n = tree.node_count
+            node_ids = np.arange(offset, offset + n, dtype=np.int64)
+            is_leaf = tree.children_left < 0
+
+            feature = np.where(is_leaf, 0, tree.feature)
+            # sklearn compares float32 X against float64 thresholds; round thresholds
+            # *down* to float32 so `x <= t32` decides exactly like `x <= t64`
+            t32 = tree.threshold.astype(np.float32)
+            too_high = t32.astype(np.float64) > tree.threshold
+            t32[too_high] = np.nextafter(t32[too_high], np.float32(-np.inf))
+
+            roots.append(offset)
+            features.append(feature)
+            thresholds.append(np.where(is_leaf, np.float32(0.0), t32))
+            children.append(
+                np.column_stack([
+                    np.where(is_leaf, node_ids, tree.children_left + offset),
+                    np.where(is_leaf, node_ids, tree.children_right + offset),
+                ])
+            )
+            values.append(tree.value[:, 0, 0])
+
+            offset += n
+            max_depth = max(max_depth, tree.max_depth)
+
+        arrays = {
+            "roots": np.asarray(roots, dtype=np.int32),
+            "feature": np.concatenate(features).astype(np.int32),
+            "threshold": np.concatenate(thresholds).astype(np.float32),
+            "children": np.concatenate(children).astype(np.int32),
+            "value": np.concatenate(values).astype(np.float32),
+        }
+
+        try:
+            encoder = FeatureEncoder.from_pipeline(pipeline)
+        except ValueError:
+            encoder = None
+
+        return cls(arrays, max_depth=max_depth, encoder=encoder)
+
+    def save(self, out_dir: str | Path) -> Path:
+        out = Path(out_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            np.save(out / f"{name}.npy", np.ascontiguousarray(getattr(self, name)))
+
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "n_trees": self.n_trees,
+            "n_nodes": self.n_nodes,
+            "max_depth": self.max_depth,
+            "encoder": self.encoder.to_dict() if self.encoder is not None else None,
+        }
+        (out / MANIFEST).write_text(json.dumps(manifest, indent=2))
+        return out
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "FlatForest":
+        path = Path(path)
+        manifest = json.loads((path / MANIFEST).read_text())
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported flat forest format: {manifest.get('format_version')}")
+
+        mode = "r" if mmap else None
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode=mode) for name in ARRAYS}
+        encoder = FeatureEncoder.from_dict(manifest["encoder"]) if manifest.get("encoder") else None
+        return cls(arrays, max_depth=manifest["max_depth"], encoder=encoder)
+
+    # -------------------------
+    # Inference
+    # -------------------------
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Mean leaf value over all trees for each row of the encoded matrix X.
+        X must already be preprocessed (imputed, no NaN).
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[None, :]
+
+        n_features = X.shape[1]
+        children = self.children.reshape(-1)  # [left0, right0, left1, right1, ...]
+
+        out = np.empty(len(X), dtype=np.float64)
+        for start in range(0, len(X), _BLOCK_ROWS):
+            block = X[start:start + _BLOCK_ROWS]
+            flat_block = block.reshape(-1)
+            row_base = (np.arange(len(block)) * n_features)[:, None]
+
+            # (rows, trees) matrix of current node ids, stepped level by level;
+            # child slot is 0 (left) when x <= threshold, 1 (right) otherwise
+            node = np.broadcast_to(self.roots, (len(block), self.n_trees)).copy()
+            for _ in range(self.max_depth):
+                go_right = flat_block[row_base + self.feature[node]] > self.threshold[node]
+                step = children[2 * node + go_right]
+                if np.array_equal(step, node):
+                    break  # every pair already sits on a leaf
+                node = step
+
+            out[start:start + len(block)] = self.value[node].mean(axis=1, dtype=np.float64)
+        return out
+
+    def predict_employees(self, employees: Sequence[AbstractEmployee], as_of: Optional[date] = None) -> np.ndarray:
+        if self.encoder is None:
+            raise ValueError("Flat forest was exported without preprocessing constants")
+        return self.predict(self.encoder.encode_many(employees, as_of=as_of))
+
+
+def export_pipeline(model_path: str | Path, out_dir: str | Path) -> Path:
+    """
+    joblib pipeline -> flat forest artifact directory.
+    """
+    return FlatForest.from_pipeline(joblib.load(model_path)).save(out_dir)
+
+
+def main(model_path: str | Path = DEFAULT_MODEL_PATH, out_dir: str = "src/ml/model_flat") -> None:
+    out = export_pipeline(model_path, out_dir)
+
+    flat = FlatForest.load(out)
+    pickle_bytes = Path(model_path).stat().st_size
+    flat_bytes = sum(p.stat().st_size for p in out.iterdir())
+
+    print(f"Exported {flat.n_trees} trees / {flat.n_nodes} nodes (max depth {flat.max_depth})")
+    print(f"pickle: {pickle_bytes:,} bytes -> flat: {flat_bytes:,} bytes ({flat_bytes / pickle_bytes:.1%})")
+    print(f"Saved flat forest to {out.resolve()}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
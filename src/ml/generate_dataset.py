@@ -0,0 +1,263 @@
+"""
+Vectorized, sharded version of ml.dataset.main for large datasets.
+
+Same sampling distributions as ml.dataset._make_employee and the same
+productivity rules (via the batch engine), but every column is drawn with
+NumPy for a whole chunk at once and each shard streams its chunks to its own
+Parquet/CSV file, so memory stays at one chunk per worker.
+
+Run from the repo root:
+  PYTHONPATH=src python -m ml.generate_dataset --rows 50000000 --out-dir data/employees
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ml.schema import FEATURE_COLUMNS, TARGET_COLUMN
+from productivity.analytics.productivity_engine import (
+    EMPLOYEE_TYPES,
+    EMPLOYMENT_LEVELS,
+    EmployeeColumns,
+    estimate_productivity_batch,
+    full_years_between,
+)
+from productivity.domain.enums import EducationLevel
+
+_DATE_LO = date(2010, 1, 1).toordinal()
+_DATE_HI = date(2025, 12, 31).toordinal()
+
+_TYPE_CODE = {name: code for code, name in enumerate(EMPLOYEE_TYPES)}
+_EDUCATION_VALUES = [level.value for level in EducationLevel]
+_EMPLOYMENT_VALUES = [level.value for level in EMPLOYMENT_LEVELS]
+
+MANIFEST = "_manifest.json"
+
+_CATEGORICAL_COLUMNS = ("employee_type", "employment_level", "education_level")
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    index: int
+    rows: int
+    seed: np.random.SeedSequence
+    path: Path
+    fmt: str
+    chunk_rows: int
+    noise_std: float
+    as_of: date
+
+
+def _count(rng: np.random.Generator, mean: float, std: float, n: int) -> np.ndarray:
+    # max(0, int(random.gauss(mean, std))): int() truncates toward zero
+    return np.maximum(0.0, np.trunc(rng.normal(mean, std, n)))
+
+
+def sample_chunk(rng: np.random.Generator, n: int, as_of: date, noise_std: float) -> pd.DataFrame:
+    """
+    One chunk of n training rows: FEATURE_COLUMNS + TARGET_COLUMN.
+    """
+    nan = np.full(n, np.nan)
+    cols: Dict[str, np.ndarray] = {name: nan.copy() for name in FEATURE_COLUMNS if name not in _CATEGORICAL_COLUMNS}
+
+    type_codes = rng.integers(0, len(EMPLOYEE_TYPES), n).astype(np.int8)
+    level_codes = rng.integers(0, len(EMPLOYMENT_LEVELS), n).astype(np.int8)
+    education_codes = rng.integers(0, len(_EDUCATION_VALUES), n)
+
+    cols["last_year_earnings"] = np.maximum(1.0, rng.normal(120_000, 40_000, n))
+    cols["overtime_earnings"] = np.maximum(0.0, rng.normal(4_000, 3_000, n))
+    cols["bonus"] = np.maximum(0.0, rng.normal(7_000, 5_000, n))
+    promotion_ordinal = np.zeros(n, dtype=np.int64)
+
+    # each type partition draws only the fields that type has
+    for name, code in _TYPE_CODE.items():
+        idx = np.flatnonzero(type_codes == code)
+        k = len(idx)
+        if name in ("manager", "individual_contributor"):
+            base_mean, base_std = (140_000, 35_000) if name == "manager" else (130_000, 30_000)
+            cols["base_pay"][idx] = np.maximum(30_000.0, rng.normal(base_mean, base_std, k))
+            promotion_ordinal[idx] = rng.integers(_DATE_LO, _DATE_HI + 1, k)
+            cols["num_projects"][idx] = _count(rng, 3, 2, k)
+            if name == "manager":
+                cols["num_employees"][idx] = _count(rng, 10, 6, k)
+            else:
+                cols["num_patents"][idx] = _count(rng, 2, 2, k)
+                cols["num_publications"][idx] = _count(rng, 4, 3, k)
+                cols["num_external_collaborations"][idx] = _count(rng, 2, 2, k)
+        else:
+            cols["contractual_work_hours"][idx] = np.maximum(5.0, rng.normal(20, 8, k))
+            actual_mean = 22 if name == "hourly" else 20
+            cols["actual_work_hours"][idx] = np.maximum(0.0, rng.normal(actual_mean, 10, k))
+            if name == "hourly":
+                cols["hourly_earnings"][idx] = np.maximum(5.0, rng.normal(18, 6, k))
+
+    full_time = promotion_ordinal != 0
+    cols["years_since_promotion"][full_time] = np.maximum(full_years_between(promotion_ordinal[full_time], as_of), 0)
+
+    target = estimate_productivity_batch(
+        EmployeeColumns(
+            employee_type=type_codes,
+            employment_level=level_codes,
+            last_year_earnings=cols["last_year_earnings"],
+            base_pay=cols["base_pay"],
+            num_projects=cols["num_projects"],
+            last_promotion_ordinal=promotion_ordinal,
+            num_employees=cols["num_employees"],
+            num_publications=cols["num_publications"],
+            contractual_work_hours=cols["contractual_work_hours"],
+            actual_work_hours=cols["actual_work_hours"],
+            hourly_earnings=cols["hourly_earnings"],
+        ),
+        as_of=as_of,
+    ) + rng.normal(0.0, noise_std, n)
+
+    # categoricals as dictionary-encoded columns (Parquet keeps the encoding)
+    data: Dict[str, Any] = {
+        "employee_type": pd.Categorical.from_codes(type_codes, categories=EMPLOYEE_TYPES),
+        "employment_level": pd.Categorical.from_codes(level_codes, categories=_EMPLOYMENT_VALUES),
+        "education_level": pd.Categorical.from_codes(education_codes, categories=_EDUCATION_VALUES),
+    }
+    data.update(cols)
+    data[TARGET_COLUMN] = target
+    return pd.DataFrame(data, columns=FEATURE_COLUMNS + [TARGET_COLUMN])
+
+
+def write_shard(spec: ShardSpec) -> Dict[str, Any]:
+    """
+    Generate one shard chunk by chunk, appending each chunk to the shard file.
+    """
+    rng = np.random.default_rng(spec.seed)
+    writer = None
+    written = 0
+    try:
+        while written < spec.rows:
+            n = min(spec.chunk_rows, spec.rows - written)
+            chunk = sample_chunk(rng, n, spec.as_of, spec.noise_std)
+            if spec.fmt == "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(spec.path, table.schema)
+                writer.write_table(table)  # one row group per chunk
+            else:
+                chunk.to_csv(spec.path, mode="a" if written else "w", header=not written, index=False)
+            written += n
+    finally:
+        if writer is not None:
+            writer.close()
+    return {"shard": spec.index, "path": spec.path.name, "rows": written}
+
+
+def generate(
+    out_dir: str | Path,
+    rows: int,
+    shards: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunk_rows: int = 1_000_000,
+    fmt: str = "parquet",
+    seed: int = 42,
+    noise_std: float = 0.15,
+    as_of: Optional[date] = None,
+) -> Dict[str, Any]:
+    """
+    Write `rows` rows as `shards` files under out_dir, generated by a process pool.
+
+    Shard i always gets rows // shards (+1 for the first rows % shards shards) and
+    the i-th child of SeedSequence(seed), so the output depends only on
+    (rows, shards, chunk_rows, seed, noise_std, as_of) - not on the worker count.
+    Also writes _manifest.json describing the run (the leading underscore keeps
+    Parquet dataset readers from treating it as data).
+    """
+    if fmt not in ("parquet", "csv"):
+        raise ValueError(f"Unsupported format: {fmt}")
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Parquet output needs pyarrow (pip install pyarrow) - or use fmt='csv'") from e
+
+    as_of = as_of or date.today()
+    shards = shards or max(1, min(64, -(-rows // chunk_rows)))
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    base, extra = divmod(rows, shards)
+    specs = [
+        ShardSpec(
+            index=i,
+            rows=base + (1 if i < extra else 0),
+            seed=child,
+            path=out / f"part-{i:05d}.{fmt}",
+            fmt=fmt,
+            chunk_rows=chunk_rows,
+            noise_std=noise_std,
+            as_of=as_of,
+        )
+        for i, child in enumerate(np.random.SeedSequence(seed).spawn(shards))
+    ]
+
+    started = time.perf_counter()
+    if workers == 1 or shards == 1:
+        results = [write_shard(spec) for spec in specs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(write_shard, specs))
+    elapsed = time.perf_counter() - started
+
+    manifest = {
+        "rows": rows,
+        "shards": results,
+        "format": fmt,
+        "seed": seed,
+        "chunk_rows": chunk_rows,
+        "noise_std": noise_std,
+        "as_of": as_of.isoformat(),
+        "columns": FEATURE_COLUMNS + [TARGET_COLUMN],
+        "elapsed_seconds": round(elapsed, 3),
+    }
+    (out / MANIFEST).write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a large synthetic training dataset.")
+    parser.add_argument("--out-dir", default="src/ml/employees_training")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--shards", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU")
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=("parquet", "csv"), default="parquet")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--noise-std", type=float, default=0.15)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="scoring date (default: today)")
+    args = parser.parse_args(argv)
+
+    manifest = generate(
+        args.out_dir,
+        rows=args.rows,
+        shards=args.shards,
+        workers=args.workers,
+        chunk_rows=args.chunk_rows,
+        fmt=args.format,
+        seed=args.seed,
+        noise_std=args.noise_std,
+        as_of=args.as_of,
+    )
+    seconds = manifest["elapsed_seconds"]
+    print(f"Wrote {manifest['rows']:,} rows in {len(manifest['shards'])} shards to {Path(args.out_dir).resolve()}")
+    print(f"{seconds:.1f}s ({manifest['rows'] / max(seconds, 1e-9):,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
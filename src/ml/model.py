@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Dict
+
 import joblib
 
-_MODEL = None
+# what `python -m ml.train_model` writes and the apps load unless MODEL_PATH says otherwise;
+# trained artifacts are build outputs, never committed (see .gitignore)
+DEFAULT_MODEL_PATH = Path("src/ml/model.pkl")
+
+_MODELS: Dict[Path, Any] = {}
 
 
 def load_model(model_path: str | Path):
-    global _MODEL
-    if _MODEL is None:
-        _MODEL = joblib.load(model_path)
-    return _MODEL
+    """
+    joblib.load with a per-path cache.
+    Serving code should go through ml.registry.ModelRegistry instead.
+    """
+    key = Path(model_path).resolve()
+    model = _MODELS.get(key)
+    if model is None:
+        model = _MODELS[key] = joblib.load(key)
+    return model
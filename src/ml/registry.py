@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from ml.encoder import FeatureEncoder
+from ml.features import employee_to_features
+from ml.flat_forest import MANIFEST, FlatForest
+from ml.schema import FEATURE_COLUMNS
+from productivity.domain.contact_info import ContactInfo
+from productivity.domain.employee_base import AbstractEmployee
+from productivity.domain.employee_fulltime import Manager
+from productivity.domain.enums import EducationLevel, EmploymentLevel
+from productivity.domain.name import Name
+from productivity.observability.metrics import stage
+
+logger = logging.getLogger(__name__)
+
+_revisions = itertools.count(1)
+
+_ENCODE = stage("encode")
+_FEATURES = stage("features")
+_DATAFRAME = stage("dataframe")
+_MODEL_PREDICT = stage("model_predict")
+
+
+class ModelNotLoadedError(LookupError):
+    """Raised when a prediction needs a model version that isn't loaded."""
+
+
+@dataclass
+class LoadedModel:
+    """
+    One loaded, warmed-up model version.
+    `predictor` is either the sklearn pipeline or a FlatForest.
+    """
+
+    version: str
+    path: Path
+    predictor: Any
+    encoder: Optional[FeatureEncoder]
+    artifact_bytes: int
+    load_seconds: float
+    warmup_seconds: float = 0.0
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # unique per load, so a reloaded version never matches results cached for the old artifact
+    revision: int = field(default_factory=lambda: next(_revisions))
+
+    @classmethod
+    def load(cls, version: str, path: str | Path) -> "LoadedModel":
+        """
+        Load a joblib pipeline (file) or a flat forest artifact (directory with manifest.json).
+        """
+        path = Path(path)
+        start = time.perf_counter()
+
+        if (path / MANIFEST).is_file():
+            predictor: Any = FlatForest.load(path)
+            encoder = predictor.encoder
+            if encoder is None:
+                raise ValueError(f"Flat forest artifact has no preprocessing constants: {path}")
+            artifact_bytes = sum(p.stat().st_size for p in path.iterdir() if p.is_file())
+        else:
+            predictor = joblib.load(path)
+            try:
+                encoder = FeatureEncoder.from_pipeline(predictor)
+            except ValueError:
+                encoder = None  # falls back to the DataFrame path
+            artifact_bytes = path.stat().st_size
+
+        return cls(
+            version=version,
+            path=path,
+            predictor=predictor,
+            encoder=encoder,
+            artifact_bytes=artifact_bytes,
+            load_seconds=time.perf_counter() - start,
+        )
+
+    def predict(self, employees: Sequence[AbstractEmployee], as_of: Optional[date] = None) -> np.ndarray:
+        """
+        One feature matrix, one predict call.
+        """
+        if not employees:
+            return np.empty(0, dtype=np.float64)
+        return self.predict_encoded(self.encode(employees, as_of=as_of))
+
+    def encode(self, employees: Sequence[AbstractEmployee], as_of: Optional[date] = None) -> Any:
+        """
+        Model input for `employees`: an encoded float64 matrix when the
+        preprocessing is compiled, otherwise the raw feature DataFrame.
+        """
+        if self.encoder is not None:
+            # fast path: encode straight into the model-input matrix, skip the ColumnTransformer
+            with _ENCODE.time():
+                return self.encoder.encode_many(employees, as_of=as_of)
+
+        # extract ML features; model expects a 2D structure
+        with _FEATURES.time():
+            rows = [employee_to_features(emp) for emp in employees]
+        with _DATAFRAME.time():
+            return pd.DataFrame(rows, columns=FEATURE_COLUMNS)
+
+    def predict_encoded(self, X: Any, rows: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Predict from encode() output, optionally only for the given row positions.
+        """
+        if rows is not None:
+            X = self.take_rows(X, rows)
+        with _MODEL_PREDICT.time():
+            if isinstance(self.predictor, FlatForest):
+                return self.predictor.predict(X)
+            if self.encoder is not None:
+                return self.predictor[-1].predict(X)
+            # DataFrame path: includes the pipeline's ColumnTransformer
+            return self.predictor.predict(X)
+
+    @staticmethod
+    def take_rows(X: Any, rows: Sequence[int]) -> Any:
+        """
+        The given row positions of encode() output.
+        """
+        return X.iloc[list(rows)] if isinstance(X, pd.DataFrame) else X[list(rows)]
+
+    @staticmethod
+    def concat_rows(parts: Sequence[Any]) -> Any:
+        """
+        Stack several encode() outputs of the same model into one model input.
+        """
+        if len(parts) == 1:
+            return parts[0]
+        if isinstance(parts[0], pd.DataFrame):
+            return pd.concat(parts, ignore_index=True)
+        return np.concatenate(parts)
+
+    @staticmethod
+    def row_digests(X: Any) -> List[bytes]:
+        """
+        Stable per-row fingerprint of encode() output (used as a cache key).
+        """
+        if isinstance(X, pd.DataFrame):
+            return [h.tobytes() for h in pd.util.hash_pandas_object(X, index=False).to_numpy()]
+        return [hashlib.blake2b(row.tobytes(), digest_size=16).digest() for row in X]
+
+    def warm_up(self) -> None:
+        """
+        Run one prediction through the full path so the first request doesn't pay for it.
+        """
+        start = time.perf_counter()
+        self.predict([_warmup_employee()])
+        self.warmup_seconds = time.perf_counter() - start
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "path": str(self.path),
+            "format": "flat_forest" if isinstance(self.predictor, FlatForest) else "joblib",
+            "compiled_encoder": self.encoder is not None,
+            "artifact_bytes": self.artifact_bytes,
+            "load_seconds": round(self.load_seconds, 6),
+            "warmup_seconds": round(self.warmup_seconds, 6),
+            "loaded_at": self.loaded_at.isoformat(),
+            "revision": self.revision,
+        }
+
+
+class ModelRegistry:
+    """
+    Holds several loaded model versions (e.g. "current" and "candidate")
+    and which one is active.
+
+    Loading and warm-up happen outside the lock; publishing a version or
+    switching the active one is a single reference swap under the lock, so
+    in-flight predictions keep the model they started with and a reload
+    never needs a restart.
+    """
+
+    def __init__(self) -> None:
+        self._models: Dict[str, LoadedModel] = {}
+        self._active: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def active_version(self) -> Optional[str]:
+        return self._active
+
+    def load(self, version: str, path: str | Path, activate: bool = False, warm_up: bool = True) -> LoadedModel:
+        """
+        Load (or reload) `version` from `path`. The first loaded version becomes active.
+        """
+        model = LoadedModel.load(version, path)
+        if warm_up:
+            model.warm_up()
+
+        with self._lock:
+            self._models[version] = model
+            if activate or self._active is None:
+                self._active = version
+
+        logger.info("Loaded model %s from %s in %.3fs", version, path, model.load_seconds)
+        return model
+
+    def activate(self, version: str) -> None:
+        with self._lock:
+            if version not in self._models:
+                raise ModelNotLoadedError(f"Model version not loaded: {version}")
+            self._active = version
+
+    def unload(self, version: str) -> None:
+        with self._lock:
+            if version == self._active:
+                raise ValueError("Cannot unload the active model version")
+            self._models.pop(version, None)
+
+    def get(self, version: Optional[str] = None) -> LoadedModel:
+        """
+        The requested version, or the active one.
+        """
+        models, key = self._models, version or self._active
+        model = models.get(key) if key is not None else None
+        if model is None:
+            raise ModelNotLoadedError(f"Model version not loaded: {key}" if key else "No model loaded")
+        return model
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            models = list(self._models.values())
+            active = self._active
+        return {
+            "active_version": active,
+            "versions": [m.stats() for m in models],
+        }
+
+
+def _warmup_employee() -> Manager:
+    name = Name(first_name="Warm", last_name="Up")
+    return Manager(
+        id="warmup",
+        contact=ContactInfo(name=name, address="", phone_number="", email="", emergency_contact=name),
+        employment_date=date(2020, 1, 1),
+        education_level=EducationLevel.BACHELORS,
+        employment_level=EmploymentLevel.MID,
+        last_year_earnings=100_000.0,
+        overtime_earnings=0.0,
+        bonus=0.0,
+        base_pay=100_000.0,
+        last_promotion_date=date(2020, 1, 1),
+        num_projects=1,
+        num_employees=1,
+    )
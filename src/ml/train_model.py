@@ -1,41 +1,166 @@
 from __future__ import annotations
 
+import argparse
+import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 import joblib
+from pandas.api.types import union_categoricals
 
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder
 from sklearn.impute import SimpleImputer
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_absolute_error, r2_score
 
+from ml.model import DEFAULT_MODEL_PATH
 from ml.schema import FEATURE_COLUMNS, TARGET_COLUMN
 
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
 
 DATA_PATH = Path("src/ml/employees_training.csv")
-MODEL_PATH = Path("src/ml/model.pkl")
+MODEL_PATH = DEFAULT_MODEL_PATH
+
+CATEGORICAL_COLUMNS = [
+    "employee_type",
+    "employment_level",
+    "education_level",
+]
+NUMERIC_COLUMNS = [c for c in FEATURE_COLUMNS if c not in CATEGORICAL_COLUMNS]
+
+MODEL_TYPES = ("rf", "rf-limited", "hgb")
+# tree size limits for "rf-limited"
+RF_LIMITS: Dict[str, Any] = {"max_depth": 14, "min_samples_leaf": 5}
+
+# rows per chunk when streaming CSV / Parquet record batches
+READ_CHUNK_ROWS = 1_000_000
+
+
+# -------------------------
+# Loading
+# -------------------------
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Categoricals as pandas category, everything numeric as float32.
+    """
+    dtypes = {c: "category" for c in CATEGORICAL_COLUMNS}
+    dtypes.update({c: np.float32 for c in NUMERIC_COLUMNS + [TARGET_COLUMN]})
+    return df.astype(dtypes)
+
+
+def _is_parquet(path: Path) -> bool:
+    return path.is_dir() or path.suffix == ".parquet"
+
+
+def _iter_chunks(path: Path) -> Iterator[pd.DataFrame]:
+    """
+    Stream the dataset in chunks, reading only FEATURE_COLUMNS + target.
+    A directory (or .parquet file) is read as a Parquet dataset, anything else as CSV.
+    """
+    columns = FEATURE_COLUMNS + [TARGET_COLUMN]
+    if _is_parquet(path):
+        try:
+            import pyarrow.dataset as ds
+        except ImportError as e:
+            raise ImportError("Reading Parquet needs pyarrow (pip install pyarrow)") from e
+
+        dataset = ds.dataset(path, format="parquet")
+        for batch in dataset.to_batches(columns=columns, batch_size=READ_CHUNK_ROWS):
+            yield _compact(batch.to_pandas())
+    else:
+        dtypes = {c: "category" for c in CATEGORICAL_COLUMNS}
+        dtypes.update({c: np.float32 for c in NUMERIC_COLUMNS + [TARGET_COLUMN]})
+        yield from pd.read_csv(path, usecols=columns, dtype=dtypes, chunksize=READ_CHUNK_ROWS)
 
-def main() -> None:
-    # 1) Load dataset
-    df = pd.read_csv(DATA_PATH)
 
-    X = df[FEATURE_COLUMNS]
-    y = df[TARGET_COLUMN]
+def _count_rows(path: Path) -> int:
+    if _is_parquet(path):
+        import pyarrow.dataset as ds
 
-    # 2) Identify column types
-    categorical_cols = [
-        "employee_type",
-        "employment_level",
-        "education_level",
-    ]
+        return ds.dataset(path, format="parquet").count_rows()
+    return _count_csv_rows(path)
 
-    numeric_cols = [c for c in FEATURE_COLUMNS if c not in categorical_cols]
 
-    # 3) Preprocessing pipelines
+def _count_csv_rows(path: Path) -> int:
+    """
+    Data rows of a CSV by counting newlines in 1 MiB blocks (header excluded). A raw
+    byte scan is far cheaper than parsing; the datasets here never quote newlines.
+    """
+    lines, last = 0, b"\n"
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            lines += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        lines += 1  # no trailing newline
+    return max(lines - 1, 0)
+
+
+def load_dataset(path: Path, max_rows: Optional[int] = None, seed: int = 42) -> pd.DataFrame:
+    """
+    Load the training table with compact dtypes.
+
+    With max_rows set, each chunk is Bernoulli-sampled down to about max_rows in
+    total while streaming, so peak memory is bounded by the sample plus one
+    chunk rather than the whole dataset. The total comes from Parquet metadata,
+    or a newline count for CSV, so the sample is spread over the whole file.
+    """
+    total = _count_rows(path) if max_rows else None
+    fraction = min(1.0, max_rows / total) if max_rows and total else 1.0
+    rng = np.random.default_rng(seed)
+
+    parts: List[pd.DataFrame] = []
+    kept = 0
+    for chunk in _iter_chunks(path):
+        if fraction < 1.0:
+            chunk = chunk[rng.random(len(chunk)) < fraction]
+        if max_rows is not None:
+            chunk = chunk.iloc[: max_rows - kept]
+        parts.append(chunk)
+        kept += len(chunk)
+        if max_rows is not None and kept >= max_rows:
+            break
+
+    return _compact(_concat(parts))
+
+
+def _concat(parts: List[pd.DataFrame]) -> pd.DataFrame:
+    if len(parts) == 1:
+        return parts[0].reset_index(drop=True)
+    # give every chunk the same categories, otherwise concat falls back to object columns
+    for col in CATEGORICAL_COLUMNS:
+        categories = union_categoricals([part[col] for part in parts]).categories
+        for part in parts:
+            part[col] = part[col].cat.set_categories(categories)
+    return pd.concat(parts, ignore_index=True)
+
+
+# -------------------------
+# Pipeline
+# -------------------------
+
+def _forest(n_jobs: Optional[int], n_estimators: int, random_state: int, **limits: Any) -> RandomForestRegressor:
+    return RandomForestRegressor(
+        n_estimators=n_estimators,
+        random_state=random_state,
+        n_jobs=n_jobs,
+        **limits,
+    )
+
+
+def _onehot_preprocessor() -> ColumnTransformer:
     categorical_pipeline = Pipeline(
         steps=[
             ("imputer", SimpleImputer(strategy="most_frequent")),
@@ -49,51 +174,185 @@ def main() -> None:
         ]
     )
 
-    preprocessor = ColumnTransformer(
+    return ColumnTransformer(
         transformers=[
-            ("cat", categorical_pipeline, categorical_cols),
-            ("num", numeric_pipeline, numeric_cols),
+            ("cat", categorical_pipeline, CATEGORICAL_COLUMNS),
+            ("num", numeric_pipeline, NUMERIC_COLUMNS),
         ]
     )
 
-    # 4) Model
-    model = RandomForestRegressor(
-        n_estimators=150,
-        random_state=42,
+
+def _ordinal_preprocessor() -> ColumnTransformer:
+    """
+    Categoricals as ordinal codes (unknown/missing -> NaN), numerics untouched:
+    HistGradientBoosting splits on categories natively and routes NaN itself.
+    """
+    ordinal = OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=np.nan, encoded_missing_value=np.nan)
+    return ColumnTransformer(
+        transformers=[
+            ("cat", ordinal, CATEGORICAL_COLUMNS),
+            ("num", "passthrough", NUMERIC_COLUMNS),
+        ]
     )
 
-    # 5) Full pipeline
-    pipeline = Pipeline(
+
+def build_pipeline(
+    model_type: str = "rf",
+    n_jobs: Optional[int] = -1,
+    n_estimators: int = 150,
+    random_state: int = 42,
+) -> Pipeline:
+    """
+    Pipeline(preprocess -> model) for one of MODEL_TYPES; all take FEATURE_COLUMNS.
+
+      rf          unbounded random forest (the original model)
+      rf-limited  depth/leaf-limited random forest: smaller trees, shorter traversals
+      hgb         histogram gradient boosting on ordinal-coded categoricals;
+                  n_estimators is the number of boosting iterations
+    """
+    if model_type == "rf":
+        preprocessor, model = _onehot_preprocessor(), _forest(n_jobs, n_estimators, random_state)
+    elif model_type == "rf-limited":
+        preprocessor, model = _onehot_preprocessor(), _forest(n_jobs, n_estimators, random_state, **RF_LIMITS)
+    elif model_type == "hgb":
+        preprocessor = _ordinal_preprocessor()
+        model = HistGradientBoostingRegressor(
+            max_iter=n_estimators,
+            categorical_features=list(range(len(CATEGORICAL_COLUMNS))),  # "cat" block comes first
+            random_state=random_state,
+        )
+    else:
+        raise ValueError(f"Unknown model type: {model_type} (expected one of {', '.join(MODEL_TYPES)})")
+
+    return Pipeline(
         steps=[
             ("preprocess", preprocessor),
             ("model", model),
         ]
     )
 
-    # 6) Train / test split
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
 
-    # 7) Train
-    pipeline.fit(X_train, y_train)
+# -------------------------
+# Stage timing / memory
+# -------------------------
+
+class StageTimer:
+    def __init__(self) -> None:
+        self.seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self) -> str:
+        total = sum(self.seconds.values()) or 1.0
+        lines = [f"  {name:<11s}{secs:9.3f}s {secs / total:6.1%}" for name, secs in self.seconds.items()]
+        lines.append(f"  {'total':<11s}{total:9.3f}s")
+        return "\n".join(lines)
+
 
-    # 8) Evaluate
-    preds = pipeline.predict(X_test)
-    mae = mean_absolute_error(y_test, preds)
-    r2 = r2_score(y_test, preds)
+def peak_memory_mb() -> Optional[float]:
+    """
+    Peak resident set size of this process (workers excluded), or None where unsupported.
+    """
+    if resource is None:
+        return None
+    # ru_maxrss is bytes on macOS, KiB elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# -------------------------
+# Training
+# -------------------------
+
+def train(
+    data_path: Path = DATA_PATH,
+    model_path: Path = MODEL_PATH,
+    max_rows: Optional[int] = None,
+    n_jobs: Optional[int] = -1,
+    n_estimators: int = 150,
+    seed: int = 42,
+    model_type: str = "rf",
+) -> Dict[str, float]:
+    timer = StageTimer()
+
+    # 1) Load dataset (only the model's columns, compact dtypes)
+    with timer.stage("load"):
+        df = load_dataset(Path(data_path), max_rows=max_rows, seed=seed)
+        X = df[FEATURE_COLUMNS]
+        y = df[TARGET_COLUMN]
+
+    # 2) Train / test split + preprocessing fit
+    with timer.stage("preprocess"):
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=seed
+        )
+        pipeline = build_pipeline(model_type, n_jobs=n_jobs, n_estimators=n_estimators, random_state=seed)
+        preprocess, model = pipeline.named_steps["preprocess"], pipeline.named_steps["model"]
+        X_train_enc = preprocess.fit_transform(X_train)
+
+    # 3) Train (forests: all cores with n_jobs=-1; hgb: OpenMP threads)
+    with timer.stage("fit"):
+        model.fit(X_train_enc, y_train)
+
+    # 4) Evaluate
+    with timer.stage("evaluate"):
+        preds = pipeline.predict(X_test)
+        mae = mean_absolute_error(y_test, preds)
+        r2 = r2_score(y_test, preds)
+
+    # 5) Save model
+    with timer.stage("save"):
+        # trained on all cores, but served one small batch at a time: a thread pool
+        # per predict call would only add latency
+        if "n_jobs" in model.get_params():
+            model.set_params(n_jobs=None)
+        model_path = Path(model_path)
+        model_path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(pipeline, model_path)
 
     print("Model evaluation")
     print("----------------")
+    print(f"Model: {model_type}")
+    print(f"Rows : {len(df):,} ({len(X_train):,} train / {len(X_test):,} test)")
     print(f"MAE: {mae:.3f}")
     print(f"R² : {r2:.3f}")
+    print("\nStage timings")
+    print(timer.report())
+    peak = peak_memory_mb()
+    if peak is not None:
+        print(f"Peak memory: {peak:,.0f} MiB")
+
+    print(f"\nSaved model to {model_path.resolve()}")
+    return {"mae": mae, "r2": r2, **{f"{k}_seconds": v for k, v in timer.seconds.items()}}
 
-    # 9) Save model
-    MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(pipeline, MODEL_PATH)
 
-    print(f"\nSaved model to {MODEL_PATH.resolve()}")
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Train the productivity model.")
+    parser.add_argument("--data", type=Path, default=DATA_PATH, help="CSV file, or Parquet file/directory of shards")
+    parser.add_argument("--model-out", type=Path, default=MODEL_PATH)
+    parser.add_argument("--max-rows", type=int, default=None, help="subsample to about this many rows while reading")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="forest fit/predict processes (-1: all cores)")
+    parser.add_argument("--model-type", choices=MODEL_TYPES, default="rf")
+    parser.add_argument("--n-estimators", type=int, default=150, help="trees (boosting iterations for hgb)")
+    parser.add_argument("--seed", type=int, default=42, help="subsampling, split and model seed")
+    args = parser.parse_args(argv)
+
+    train(
+        data_path=args.data,
+        model_path=args.model_out,
+        max_rows=args.max_rows,
+        n_jobs=args.n_jobs,
+        n_estimators=args.n_estimators,
+        seed=args.seed,
+        model_type=args.model_type,
+    )
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,231 @@
+"""
+Hyperparameter search for the productivity model.
+
+Cross-validation folds x candidates run in a process pool. The
+ColumnTransformer is fitted once per fold (not once per candidate x fold):
+the encoded train/validation matrices are cached to disk and memory-mapped
+by the workers. Each candidate records fit time, predict latency, model size
+and MAE/R², averaged over folds, and the table is written as CSV + Markdown.
+
+Run from the repo root:
+  PYTHONPATH=src python -m ml.tune_model --data src/ml/employees_training.csv
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import ExtraTreesRegressor, HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.model_selection import KFold
+
+from ml.schema import FEATURE_COLUMNS, TARGET_COLUMN
+from ml.train_model import DATA_PATH, build_pipeline, load_dataset
+
+RESULTS_PATH = Path("src/ml/artifacts/tuning_results.csv")
+
+# single-row predictions timed per candidate/fold (median reported)
+LATENCY_SAMPLES = 50
+
+
+@dataclass(frozen=True)
+class Candidate:
+    name: str
+    estimator: Any  # unfitted sklearn regressor (cloned per task)
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+def default_grid(random_state: int = 42) -> List[Candidate]:
+    """
+    Forest size x depth for random forests, plus extra trees and gradient boosting.
+    Estimators are single-threaded: the pool already runs one task per core.
+    """
+    grid: List[Candidate] = []
+    for n_estimators in (50, 150, 300):
+        for max_depth in (None, 20, 12):
+            params = {"n_estimators": n_estimators, "max_depth": max_depth}
+            grid.append(Candidate("rf", RandomForestRegressor(random_state=random_state, n_jobs=1, **params), params))
+    for max_depth in (None, 20):
+        params = {"n_estimators": 150, "max_depth": max_depth}
+        grid.append(Candidate("extra_trees", ExtraTreesRegressor(random_state=random_state, n_jobs=1, **params), params))
+    for max_iter, learning_rate in ((200, 0.1), (500, 0.05)):
+        params = {"max_iter": max_iter, "learning_rate": learning_rate}
+        grid.append(Candidate("hgb", HistGradientBoostingRegressor(random_state=random_state, **params), params))
+    return grid
+
+
+# -------------------------
+# Per-fold preprocessing cache
+# -------------------------
+
+def cache_folds(X: pd.DataFrame, y: pd.Series, n_splits: int, cache_dir: Path, seed: int = 42) -> List[Path]:
+    """
+    Fit the ColumnTransformer once per fold and store the encoded matrices
+    (X_train, y_train, X_val, y_val) as .npy files, one directory per fold.
+    """
+    paths = []
+    folds = KFold(n_splits=n_splits, shuffle=True, random_state=seed).split(X)
+    for k, (train_idx, val_idx) in enumerate(folds):
+        preprocess = build_pipeline().named_steps["preprocess"]
+        fold_dir = cache_dir / f"fold-{k}"
+        fold_dir.mkdir(parents=True, exist_ok=True)
+
+        arrays = {
+            "X_train": preprocess.fit_transform(X.iloc[train_idx]),
+            "y_train": y.iloc[train_idx].to_numpy(),
+            "X_val": preprocess.transform(X.iloc[val_idx]),
+            "y_val": y.iloc[val_idx].to_numpy(),
+        }
+        for name, array in arrays.items():
+            if hasattr(array, "toarray"):  # sparse ColumnTransformer output
+                array = array.toarray()
+            np.save(fold_dir / f"{name}.npy", np.ascontiguousarray(array, dtype=np.float32))
+        paths.append(fold_dir)
+    return paths
+
+
+def _load_fold(fold_dir: Path) -> Dict[str, np.ndarray]:
+    return {name: np.load(fold_dir / f"{name}.npy", mmap_mode="r") for name in ("X_train", "y_train", "X_val", "y_val")}
+
+
+# -------------------------
+# One (candidate, fold) task
+# -------------------------
+
+def evaluate(task: Tuple[int, Candidate, int, Path]) -> Dict[str, Any]:
+    index, candidate, fold, fold_dir = task
+    data = _load_fold(fold_dir)
+    model = clone(candidate.estimator)
+
+    start = time.perf_counter()
+    model.fit(data["X_train"], data["y_train"])
+    fit_seconds = time.perf_counter() - start
+
+    X_val = np.asarray(data["X_val"])
+    start = time.perf_counter()
+    preds = model.predict(X_val)
+    batch_seconds = time.perf_counter() - start
+
+    single = []
+    for i in range(min(LATENCY_SAMPLES, len(X_val))):
+        row = X_val[i:i + 1]
+        start = time.perf_counter()
+        model.predict(row)
+        single.append(time.perf_counter() - start)
+
+    return {
+        "candidate": index,
+        "fold": fold,
+        "mae": mean_absolute_error(data["y_val"], preds),
+        "r2": r2_score(data["y_val"], preds),
+        "fit_seconds": fit_seconds,
+        "batch_us_per_row": batch_seconds / len(X_val) * 1e6,
+        "single_row_ms": float(np.median(single)) * 1e3,
+        "model_bytes": len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)),
+    }
+
+
+# -------------------------
+# Search
+# -------------------------
+
+def tune(
+    data_path: Path = DATA_PATH,
+    candidates: Optional[List[Candidate]] = None,
+    n_splits: int = 5,
+    max_rows: Optional[int] = None,
+    workers: Optional[int] = None,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """
+    Cross-validate every candidate; one row per candidate (fold means, plus MAE std).
+    """
+    candidates = candidates if candidates is not None else default_grid(seed)
+    df = load_dataset(Path(data_path), max_rows=max_rows, seed=seed)
+    X, y = df[FEATURE_COLUMNS], df[TARGET_COLUMN]
+
+    with tempfile.TemporaryDirectory(prefix="tune-folds-") as tmp:
+        start = time.perf_counter()
+        fold_dirs = cache_folds(X, y, n_splits, Path(tmp), seed=seed)
+        preprocess_seconds = time.perf_counter() - start
+
+        tasks = [(i, c, k, fold_dir) for i, c in enumerate(candidates) for k, fold_dir in enumerate(fold_dirs)]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            rows = [evaluate(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                rows = list(pool.map(evaluate, tasks))
+
+    per_fold = pd.DataFrame(rows)
+    summary = per_fold.groupby("candidate").agg(
+        mae=("mae", "mean"),
+        mae_std=("mae", "std"),
+        r2=("r2", "mean"),
+        fit_seconds=("fit_seconds", "mean"),
+        batch_us_per_row=("batch_us_per_row", "mean"),
+        single_row_ms=("single_row_ms", "median"),
+        model_bytes=("model_bytes", "mean"),
+    )
+    summary.insert(0, "model", [candidates[i].name for i in summary.index])
+    summary.insert(1, "params", [_format_params(candidates[i].params) for i in summary.index])
+    summary = summary.sort_values("mae").reset_index(drop=True)
+    summary.attrs["preprocess_seconds"] = preprocess_seconds
+    summary.attrs["rows"] = len(df)
+    return summary
+
+
+def _format_params(params: Dict[str, Any]) -> str:
+    return " ".join(f"{k}={v}" for k, v in params.items())
+
+
+def write_results(summary: pd.DataFrame, out_path: Path) -> Tuple[Path, Path]:
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    summary.to_csv(out_path, index=False)
+
+    md_path = out_path.with_suffix(".md")
+    rounded = summary.round({"mae": 4, "mae_std": 4, "r2": 4, "fit_seconds": 3, "batch_us_per_row": 2, "single_row_ms": 3})
+    rounded["model_bytes"] = rounded["model_bytes"].map(lambda b: f"{b / 1e6:.1f} MB")
+    md_path.write_text(_markdown(rounded) + "\n")
+    return out_path, md_path
+
+
+def _markdown(df: pd.DataFrame) -> str:
+    header = "| " + " | ".join(df.columns) + " |"
+    rule = "|" + "|".join("---" for _ in df.columns) + "|"
+    body = ["| " + " | ".join(str(v) for v in row) + " |" for row in df.itertuples(index=False)]
+    return "\n".join([header, rule, *body])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Cross-validated hyperparameter search.")
+    parser.add_argument("--data", type=Path, default=DATA_PATH, help="CSV file, or Parquet file/directory of shards")
+    parser.add_argument("--out", type=Path, default=RESULTS_PATH, help="results CSV (a .md table is written next to it)")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--max-rows", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    summary = tune(args.data, n_splits=args.folds, max_rows=args.max_rows, workers=args.workers, seed=args.seed)
+    csv_path, md_path = write_results(summary, args.out)
+
+    print(f"{len(summary)} candidates x {args.folds} folds on {summary.attrs['rows']:,} rows "
+          f"in {time.perf_counter() - start:.1f}s (preprocessing {summary.attrs['preprocess_seconds']:.2f}s, fitted once per fold)")
+    print(md_path.read_text())
+    print(f"Wrote {csv_path.resolve()} and {md_path.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Sequence, Tuple
+
+import numpy as np
+
+from productivity.analytics.productivity_engine import EMPLOYEE_TYPES, EMPLOYMENT_LEVELS
+from productivity.analytics.score_index import ScoreIndex
+
+# (employee type code, employment level code) - see EMPLOYEE_TYPES / EMPLOYMENT_LEVELS
+GroupKey = Tuple[int, int]
+
+
+@dataclass
+class _Group:
+    count: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    # a removed score equalled min or max; recompute from `scores` on next read
+    bounds_stale: bool = False
+    scores: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, employee_id: str, score: float) -> None:
+        self.scores[employee_id] = score
+        self.count += 1
+        self.total += score
+        self.total_sq += score * score
+        if score < self.min:
+            self.min = score
+        if score > self.max:
+            self.max = score
+
+    def remove(self, employee_id: str) -> None:
+        score = self.scores.pop(employee_id)
+        self.count -= 1
+        self.total -= score
+        self.total_sq -= score * score
+        if score <= self.min or score >= self.max:
+            self.bounds_stale = True
+
+    def refresh_bounds(self) -> None:
+        if self.bounds_stale:
+            values = self.scores.values()
+            self.min = min(values, default=math.inf)
+            self.max = max(values, default=-math.inf)
+            self.bounds_stale = False
+
+
+class _AggregateState:
+    def __init__(self) -> None:
+        self.groups: Dict[GroupKey, _Group] = {}
+        self.group_of: Dict[str, GroupKey] = {}
+
+
+class ProductivityAggregates(ScoreIndex):
+    """
+    Materialized productivity statistics per (employee type, employment level).
+
+    Each group keeps count, sum, sum of squares and min/max, so a read is
+    O(groups). A save replaces the employee's previous contribution; min/max are
+    recomputed lazily (over that group only) when a removed score was a bound.
+    A daily rebuild also clears the floating-point drift that incremental
+    subtraction accumulates. Non-finite scores (NaN, or inf from a zero
+    denominator) are left out, so the running sums stay finite.
+    """
+
+    def _new_state(self) -> _AggregateState:
+        return _AggregateState()
+
+    def _apply(
+        self,
+        state: _AggregateState,
+        employee_ids: Sequence[str],
+        type_codes: np.ndarray,
+        level_codes: np.ndarray,
+        scores: np.ndarray,
+    ) -> None:
+        groups, group_of = state.groups, state.group_of
+        for employee_id, type_code, level_code, score in zip(
+            employee_ids, type_codes.tolist(), level_codes.tolist(), scores.tolist()
+        ):
+            old = group_of.pop(employee_id, None)
+            if old is not None:
+                groups[old].remove(employee_id)
+            if not math.isfinite(score):
+                continue  # zero base pay / contractual hours: no score to aggregate
+            key = (type_code, level_code)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = _Group()
+            group.add(employee_id, score)
+            group_of[employee_id] = key
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Per-group stats plus an overall row; O(groups) unless a group's min/max needs refreshing.
+        """
+        with self._lock:
+            rows = []
+            overall = _Group()
+            for (type_code, level_code), group in sorted(self._state.groups.items()):
+                if group.count == 0:
+                    continue
+                group.refresh_bounds()
+                rows.append({
+                    "type": EMPLOYEE_TYPES[type_code],
+                    "employment_level": EMPLOYMENT_LEVELS[level_code].value,
+                    **_stats(group),
+                })
+                overall.count += group.count
+                overall.total += group.total
+                overall.total_sq += group.total_sq
+                overall.min = min(overall.min, group.min)
+                overall.max = max(overall.max, group.max)
+
+            return {
+                "as_of": self.as_of.isoformat() if self.as_of else None,
+                "groups": rows,
+                "overall": _stats(overall) if overall.count else None,
+            }
+
+
+def _stats(group: _Group) -> Dict[str, Any]:
+    mean = group.total / group.count
+    # population std from the running sums; clamp tiny negative rounding error
+    variance = max(group.total_sq / group.count - mean * mean, 0.0)
+    return {
+        "count": group.count,
+        "mean": mean,
+        "std": math.sqrt(variance),
+        "min": group.min,
+        "max": group.max,
+    }
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import heapq
+import math
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sortedcontainers import SortedList
+
+from productivity.analytics.productivity_engine import EMPLOYEE_TYPES
+from productivity.analytics.score_index import ScoreBatch, ScoreIndex
+
+# (score, employee id); ids break ties so every entry is unique
+RankEntry = Tuple[float, str]
+
+
+class _RankState:
+    def __init__(self) -> None:
+        # type code -> entries sorted ascending
+        self.by_type: Dict[int, SortedList] = {}
+        self.entry_of: Dict[str, Tuple[int, float]] = {}
+
+
+class ProductivityRanking(ScoreIndex):
+    """
+    Exact order-statistics index over productivity scores, one SortedList of
+    (score, id) per employee type.
+
+    Complexity (n = employees of the type, T = number of types, K = page size):
+      save (insert/replace)   O(log n)
+      full rebuild            O(n log n): one sort per type (_load)
+      percentile / rank       O(log n) within the type, O(T log n) overall
+      top / bottom K          O(K + log n) within a type, O(T K + K log T) across all types
+
+    Accuracy: ranks are exact for the stored scores - no sketch or sampling.
+    Scores are "as of" the last rebuild, or the save day for employees saved
+    since (see ScoreIndex), so ranks may lag a promotion-anniversary by up to
+    one rebuild interval.
+    Non-finite scores (NaN, or inf from a zero denominator) have no rank and are left out.
+    """
+
+    def _new_state(self) -> _RankState:
+        return _RankState()
+
+    def _apply(
+        self,
+        state: _RankState,
+        employee_ids: Sequence[str],
+        type_codes: np.ndarray,
+        level_codes: np.ndarray,
+        scores: np.ndarray,
+    ) -> None:
+        for employee_id, type_code, score in zip(employee_ids, type_codes.tolist(), scores.tolist()):
+            old = state.entry_of.pop(employee_id, None)
+            if old is not None:
+                state.by_type[old[0]].discard((old[1], employee_id))
+            if not math.isfinite(score):
+                continue
+            entries = state.by_type.get(type_code)
+            if entries is None:
+                entries = state.by_type[type_code] = SortedList()
+            entries.add((score, employee_id))
+            state.entry_of[employee_id] = (type_code, score)
+
+    def _load(self, state: _RankState, batches: List[ScoreBatch]) -> None:
+        """
+        Bulk build: the latest score per id, then one sort per type.
+        """
+        entry_of = state.entry_of
+        for employee_ids, type_codes, _, scores in batches:
+            for employee_id, type_code, score in zip(employee_ids, type_codes.tolist(), scores.tolist()):
+                if not math.isfinite(score):
+                    entry_of.pop(employee_id, None)
+                else:
+                    entry_of[employee_id] = (type_code, score)
+
+        by_type: Dict[int, List[RankEntry]] = {}
+        for employee_id, (type_code, score) in entry_of.items():
+            by_type.setdefault(type_code, []).append((score, employee_id))
+        state.by_type = {code: SortedList(entries) for code, entries in by_type.items()}
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    def percentile(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Where one employee stands, within their type and overall.
+        percentile = 100 * (below + ties / 2) / n, counting the employee among the ties;
+        rank 1 is the highest score. None if the employee isn't indexed.
+        """
+        with self._lock:
+            state = self._state
+            entry = state.entry_of.get(employee_id)
+            if entry is None:
+                return None
+            type_code, score = entry
+
+            counts = {code: _count_around(entries, score) for code, entries in state.by_type.items()}
+            type_n = len(state.by_type[type_code])
+            total_n = sum(len(entries) for entries in state.by_type.values())
+            as_of = self.as_of
+
+        below, ties = counts[type_code]
+        total_below = sum(b for b, _ in counts.values())
+        total_ties = sum(t for _, t in counts.values())
+
+        return {
+            "employee_id": employee_id,
+            "type": EMPLOYEE_TYPES[type_code],
+            "productivity": score,
+            "as_of": as_of.isoformat() if as_of else None,
+            "within_type": _position(below, ties, type_n),
+            "overall": _position(total_below, total_ties, total_n),
+        }
+
+    def top(self, k: int, employee_type: Optional[str] = None, bottom: bool = False) -> Dict[str, Any]:
+        """
+        The K highest (or lowest) scores, for one type or across all types.
+        """
+        with self._lock:
+            state = self._state
+            if employee_type is not None:
+                code = EMPLOYEE_TYPES.index(employee_type) if employee_type in EMPLOYEE_TYPES else None
+                lists = {code: state.by_type.get(code, [])} if code is not None else {}
+            else:
+                lists = state.by_type
+
+            # each list is sorted ascending, so its first/last K are the only candidates
+            runs = [
+                [(entry, code) for entry in (entries[:k] if bottom else reversed(entries[-k:]))]
+                for code, entries in lists.items()
+            ]
+            merged = heapq.merge(*runs, key=lambda item: item[0], reverse=not bottom)
+            picked = list(islice(merged, k))
+            as_of = self.as_of
+
+        return {
+            "as_of": as_of.isoformat() if as_of else None,
+            "order": "bottom" if bottom else "top",
+            "type": employee_type,
+            "results": [
+                {"position": i, "employee_id": eid, "type": EMPLOYEE_TYPES[code], "productivity": score}
+                for i, ((score, eid), code) in enumerate(picked, start=1)
+            ],
+        }
+
+
+def _count_around(entries: SortedList, score: float) -> Tuple[int, int]:
+    """
+    (entries scoring below `score`, entries scoring exactly `score`).
+    """
+    # (score,) sorts before every (score, id), so bisecting on it skips the ids
+    lo = entries.bisect_left((score,))
+    hi = entries.bisect_left((math.nextafter(score, math.inf),))
+    return lo, hi - lo
+
+
+def _position(below: int, ties: int, n: int) -> Dict[str, Any]:
+    return {
+        "rank": n - (below + ties) + 1,  # best rank shared by the tied group
+        "of": n,
+        "percentile": 100.0 * (below + ties / 2) / n,
+    }
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# one batch of scored employees: ids, type codes, employment level codes, scores (as in EmployeeColumns)
+ScoreBatch = Tuple[Sequence[str], np.ndarray, np.ndarray, np.ndarray]
+
+
+class ScoreIndex(ABC):
+    """
+    Derived state over every employee's current productivity score
+    (group aggregates, rank index, ...), kept up to date by EmployeeService.
+
+    Saves are folded in incrementally with apply(). Scores depend on the day
+    (promotion penalty), so the whole index is also rebuilt daily: a rebuild
+    collects the scored pages, builds a fresh state from all of them in one
+    pass off the lock (_load), then swaps it in and replays any apply() calls
+    that arrived meanwhile. `as_of` is the day of the last rebuild.
+
+    apply() scores are as of the day of the save, so between rebuilds the index
+    mixes days: employees saved since the rebuild carry today's promotion
+    penalty, the rest the rebuild day's. The two differ only for employees
+    whose years-since-promotion ticked over in between, and the next rebuild
+    evens them out; without rebuilds (the daily job is opt-in) untouched
+    employees keep their rebuild-day scores.
+    """
+
+    def __init__(self) -> None:
+        self._state: Any = self._new_state()
+        self.as_of: Optional[date] = None
+
+        self._pending: Optional[List[ScoreBatch]] = None
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_state(self) -> Any: ...
+
+    @abstractmethod
+    def _apply(
+        self,
+        state: Any,
+        employee_ids: Sequence[str],
+        type_codes: np.ndarray,
+        level_codes: np.ndarray,
+        scores: np.ndarray,
+    ) -> None:
+        """Insert or replace the given employees' scores in `state`."""
+
+    def apply(self, employee_ids: Sequence[str], type_codes: np.ndarray, level_codes: np.ndarray, scores: np.ndarray) -> None:
+        """
+        Insert or replace the scores of saved employees.
+        """
+        with self._lock:
+            self._apply(self._state, employee_ids, type_codes, level_codes, scores)
+            if self._pending is not None:
+                self._pending.append((list(employee_ids), type_codes, level_codes, scores))
+
+    # -------------------------
+    # Full rebuild
+    # -------------------------
+
+    def begin_rebuild(self) -> List[ScoreBatch]:
+        """
+        Start a full rebuild; pass the returned collector to add_to_rebuild / finish_rebuild.
+        """
+        with self._lock:
+            self._pending = []
+        return []
+
+    def add_to_rebuild(
+        self,
+        batches: List[ScoreBatch],
+        employee_ids: Sequence[str],
+        type_codes: np.ndarray,
+        level_codes: np.ndarray,
+        scores: np.ndarray,
+    ) -> None:
+        batches.append((list(employee_ids), type_codes, level_codes, scores))
+
+    def finish_rebuild(self, batches: List[ScoreBatch], as_of: date) -> None:
+        """
+        Build the fresh state, then swap it in, replaying updates made while the rebuild ran.
+        """
+        state = self._new_state()
+        self._load(state, batches)
+        with self._lock:
+            for batch in self._pending or ():
+                self._apply(state, *batch)
+            self._state = state
+            self._pending = None
+            self.as_of = as_of
+
+    def abort_rebuild(self) -> None:
+        with self._lock:
+            self._pending = None
+
+    def _load(self, state: Any, batches: List[ScoreBatch]) -> None:
+        """
+        Fill an empty `state` from every batch of a full rebuild (later batches win
+        for a repeated id). Runs without the lock. Override with a bulk build where
+        one-at-a-time _apply would be slower.
+        """
+        for batch in batches:
+            self._apply(state, *batch)
@@ -0,0 +1,43 @@
+from flask import Blueprint, current_app, request
+from pydantic import TypeAdapter, ValidationError
+
+from productivity.schemas.analytics import LeaderboardQuery
+
+bp = Blueprint("analytics", __name__, url_prefix="/analytics")
+
+
+leaderboard_query_adapter = TypeAdapter(LeaderboardQuery)
+
+def _service():
+    return current_app.config["EMPLOYEE_SERVICE"]
+
+@bp.get("/productivity")
+def productivity_aggregates():
+    """
+    Materialized count/mean/std/min/max of productivity per (type, employment level).
+    """
+    return _service().productivity_aggregates(), 200
+
+@bp.post("/productivity/recompute")
+def recompute_productivity_aggregates():
+    # same rebuild the daily job runs; for cron-driven deployments and backfills
+    return _service().recompute_productivity_aggregates(), 200
+
+@bp.get("/productivity/leaderboard")
+def productivity_leaderboard():
+    """
+    ?type=<employee type>&k=50&order=top|bottom
+    """
+    try:
+        req = leaderboard_query_adapter.validate_python(request.args.to_dict())
+    except ValidationError as e:
+        return {"error": "Validation error", "details": e.errors(include_url=False)}, 400
+
+    return _service().productivity_leaderboard(req.k, employee_type=req.type, bottom=req.order == "bottom"), 200
+
+@bp.get("/productivity/percentile/<employee_id>")
+def productivity_percentile(employee_id: str):
+    result = _service().productivity_percentile(employee_id)
+    if result is None:
+        return {"error": "Employee not found"}, 404
+    return result, 200
@@ -0,0 +1,45 @@
+"""
+The routes of api/analytics.py for the ASGI app (asgi_factory.create_asgi_app):
+same paths, query parameters, status codes and response bodies, on AsyncEmployeeService.
+"""
+from pydantic import ValidationError
+from starlette.requests import Request
+from starlette.routing import Route
+
+from productivity.api.analytics import leaderboard_query_adapter
+from productivity.api.async_employees import JSONResponse
+
+
+def _service(request: Request):
+    return request.app.state.employee_service
+
+# reads are O(groups) / O(K + log n) lookups on in-memory indexes, so they stay on the loop
+
+async def productivity_aggregates(request: Request):
+    return JSONResponse(_service(request).productivity_aggregates())
+
+async def recompute_productivity_aggregates(request: Request):
+    # pages are awaited and scored off the loop (see AsyncEmployeeService.recompute_productivity_aggregates)
+    return JSONResponse(await _service(request).recompute_productivity_aggregates())
+
+async def productivity_leaderboard(request: Request):
+    try:
+        req = leaderboard_query_adapter.validate_python(dict(request.query_params))
+    except ValidationError as e:
+        return JSONResponse({"error": "Validation error", "details": e.errors(include_url=False)}, 400)
+
+    return JSONResponse(_service(request).productivity_leaderboard(req.k, employee_type=req.type, bottom=req.order == "bottom"))
+
+async def productivity_percentile(request: Request):
+    result = _service(request).productivity_percentile(request.path_params["employee_id"])
+    if result is None:
+        return JSONResponse({"error": "Employee not found"}, 404)
+    return JSONResponse(result)
+
+
+routes = [
+    Route("/analytics/productivity", productivity_aggregates, methods=["GET"]),
+    Route("/analytics/productivity/recompute", recompute_productivity_aggregates, methods=["POST"]),
+    Route("/analytics/productivity/leaderboard", productivity_leaderboard, methods=["GET"]),
+    Route("/analytics/productivity/percentile/{employee_id}", productivity_percentile, methods=["GET"]),
+]
@@ -0,0 +1,143 @@
+"""
+The routes of api/employees.py for the ASGI app (asgi_factory.create_asgi_app):
+same paths, payloads, status codes and response bodies, on AsyncEmployeeService.
+"""
+import json
+
+from flask.json.provider import DefaultJSONProvider
+from pydantic import ValidationError
+from starlette.requests import Request
+from starlette.responses import JSONResponse as _StarletteJSONResponse
+from starlette.routing import Route
+
+from ml.registry import ModelNotLoadedError
+from productivity.api.employees import BulkIngest, create_employee_adapter, employee_ids_adapter, list_query_adapter
+from productivity.persistence.employee_repo import EmployeeQuery, InvalidCursorError
+
+
+class JSONResponse(_StarletteJSONResponse):
+    # Flask's encoding (Decimal from DynamoDB items as strings, dates, UUIDs), so both apps return the same bodies
+    def render(self, content) -> bytes:
+        return json.dumps(content, default=DefaultJSONProvider.default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _service(request: Request):
+    return request.app.state.employee_service
+
+async def _json_body(request: Request):
+    # Flask's get_json(silent=True) or {}: a missing or malformed body validates as {}
+    try:
+        return await request.json() or {}
+    except ValueError:
+        return {}
+
+async def create_employee(request: Request):
+    raw = await _json_body(request)
+
+    try:
+        req = create_employee_adapter.validate_python(raw)
+    except ValidationError as e:
+        return JSONResponse({"error": "Validation error", "details": e.errors()}, 400)
+
+    employee = await _service(request).create_employee_from_request(req)
+    return JSONResponse(employee, 201)
+
+async def list_employees(request: Request):
+    try:
+        req = list_query_adapter.validate_python(dict(request.query_params))
+    except ValidationError as e:
+        return JSONResponse({"error": "Validation error", "details": e.errors(include_url=False, include_context=False)}, 400)
+
+    try:
+        return JSONResponse(await _service(request).list_employees(EmployeeQuery(**req.model_dump())))
+    except InvalidCursorError as e:
+        return JSONResponse({"error": str(e)}, 400)
+
+async def bulk_ingest(request: Request):
+    """
+    NDJSON body, read as it arrives; each chunk is written while the rest of the upload streams in.
+    """
+    service = _service(request)
+    ingest = BulkIngest()
+
+    line_no = 0
+    async for raw_line in _lines(request):
+        line_no += 1
+        chunk = ingest.feed(line_no, raw_line)
+        if chunk:
+            ingest.created += await service.create_employees(chunk)
+
+    chunk = ingest.flush()
+    if chunk:
+        ingest.created += await service.create_employees(chunk)
+
+    return JSONResponse(ingest.result())
+
+async def _lines(request: Request):
+    pending = b""
+    async for data in request.stream():
+        pending += data
+        *complete, pending = pending.split(b"\n")
+        for line in complete:
+            yield line
+    if pending:
+        yield pending
+
+async def get_employee(request: Request):
+    employee = await _service(request).get_employee(request.path_params["employee_id"])
+    if employee is None:
+        return JSONResponse({"error": "Employee not found"}, 404)
+    return JSONResponse(employee)
+
+async def get_productivity(request: Request):
+    result = await _service(request).get_productivity(request.path_params["employee_id"])
+    if result is None:
+        return JSONResponse({"error": "Employee not found"}, 404)
+    return JSONResponse(result)
+
+async def get_productivity_batch(request: Request):
+    raw = await _json_body(request)
+
+    try:
+        req = employee_ids_adapter.validate_python(raw)
+    except ValidationError as e:
+        return JSONResponse({"error": "Validation error", "details": e.errors()}, 400)
+
+    return JSONResponse(await _service(request).get_productivity_batch(req.employee_ids))
+
+async def predict_productivity(request: Request):
+    try:
+        result = await _service(request).predict_productivity(
+            request.path_params["employee_id"], request.query_params.get("version")
+        )
+    except ModelNotLoadedError as e:
+        return JSONResponse({"error": str(e)}, 503)
+    if result is None:
+        return JSONResponse({"error": "Employee not found"}, 404)
+    return JSONResponse(result)
+
+async def predict_productivity_batch(request: Request):
+    raw = await _json_body(request)
+
+    try:
+        req = employee_ids_adapter.validate_python(raw)
+    except ValidationError as e:
+        return JSONResponse({"error": "Validation error", "details": e.errors()}, 400)
+
+    try:
+        return JSONResponse(
+            await _service(request).predict_productivity_batch(req.employee_ids, request.query_params.get("version"))
+        )
+    except ModelNotLoadedError as e:
+        return JSONResponse({"error": str(e)}, 503)
+
+
+routes = [
+    Route("/employees", create_employee, methods=["POST"]),
+    Route("/employees", list_employees, methods=["GET"]),
+    Route("/employees/bulk", bulk_ingest, methods=["POST"]),
+    Route("/employees/productivity", get_productivity_batch, methods=["POST"]),
+    Route("/employees/productivity/predict", predict_productivity_batch, methods=["POST"]),
+    Route("/employees/{employee_id}", get_employee, methods=["GET"]),
+    Route("/employees/{employee_id}/productivity", get_productivity, methods=["GET"]),
+    Route("/employees/{employee_id}/productivity/predict", predict_productivity, methods=["GET"]),
+]
@@ -0,0 +1,51 @@
+import re
+import time
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from productivity.observability.metrics import CONTENT_TYPE, HTTP_REQUEST_SECONDS, HTTP_REQUESTS, REGISTRY
+
+_PATH_PARAM = re.compile(r"\{(\w+)(?::\w+)?\}")
+
+
+async def metrics(request: Request):
+    return Response(REGISTRY.render(), media_type=None, headers={"Content-Type": CONTENT_TYPE})
+
+
+class RequestMetricsMiddleware:
+    """
+    ASGI counterpart of api.metrics.install_request_metrics, feeding the same
+    metrics. Route labels use Flask's template syntax ("/employees/<employee_id>")
+    so dashboards read both apps alike. Unhandled exceptions count as 500.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            # the router records the matched route in the (shared) scope
+            route = scope.get("route")
+            template = _PATH_PARAM.sub(r"<\1>", route.path) if route is not None else "<unmatched>"
+            labels = (scope["method"], template, str(status))
+            HTTP_REQUEST_SECONDS.labels(*labels).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(*labels).inc()
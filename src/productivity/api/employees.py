@@ -1,16 +1,84 @@
+import json
+import time
+
 from flask import Blueprint, request, current_app
 from pydantic import TypeAdapter, ValidationError
 
+from ml.registry import ModelNotLoadedError
+from productivity.persistence.employee_repo import EmployeeQuery, InvalidCursorError
+from productivity.schemas.employee_batch import EmployeeIdsRequest
 from productivity.schemas.employee_create import CreateEmployeeRequest
+from productivity.schemas.employee_query import EmployeeListQuery
 
 bp = Blueprint("employees", __name__, url_prefix="/employees")
 
 
 create_employee_adapter = TypeAdapter(CreateEmployeeRequest)
+employee_ids_adapter = TypeAdapter(EmployeeIdsRequest)
+list_query_adapter = TypeAdapter(EmployeeListQuery)
+
+# bulk ingest: records validated + written per chunk; error list capped to keep memory flat
+INGEST_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
 
 def _service():
     return current_app.config["EMPLOYEE_SERVICE"]
 
+class BulkIngest:
+    """
+    State of one NDJSON bulk upload (shared with the ASGI app): feed() validates
+    a line and hands back a full chunk when it's time to write, flush() the
+    remainder; the caller adds what it wrote to `created`.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.received = self.created = self.failed = 0
+        self.errors = []
+        self._chunk = []
+
+    def feed(self, line_no, raw_line):
+        if not raw_line.strip():
+            return None
+        self.received += 1
+
+        try:
+            req = create_employee_adapter.validate_python(json.loads(raw_line))
+        except json.JSONDecodeError as e:
+            self._report(line_no, f"Invalid JSON: {e.msg}")
+            return None
+        except UnicodeDecodeError as e:
+            # bytes lines are decoded by json.loads; a bad byte fails this line only
+            self._report(line_no, f"Invalid JSON: not valid {e.encoding} ({e.reason} at byte {e.start})")
+            return None
+        except ValidationError as e:
+            self._report(line_no, "Validation error", e.errors(include_url=False, include_context=False, include_input=False))
+            return None
+
+        self._chunk.append(req)
+        return self.flush() if len(self._chunk) >= INGEST_CHUNK_SIZE else None
+
+    def flush(self):
+        chunk, self._chunk = self._chunk, []
+        return chunk
+
+    def result(self):
+        elapsed = time.perf_counter() - self.started
+        return {
+            "received": self.received,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+            "elapsed_seconds": round(elapsed, 6),
+            "records_per_second": round(self.received / elapsed, 1) if elapsed > 0 else None,
+        }
+
+    def _report(self, line_no, error, details=None):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_no, "error": error, **({"details": details} if details else {})})
+
 @bp.post("")
 def create_employee():
     raw = request.get_json(silent=True) or {}
@@ -20,12 +88,47 @@ def create_employee():
     except ValidationError as e:
         return {"error": "Validation error", "details": e.errors()}, 400
 
-    # If your service expects a dict payload:
-    payload = req.model_dump()  # Pydantic v2
-    
-    employee = _service().create_employee(payload)
+    # validated model goes straight to the domain constructors (no model_dump round trip)
+    employee = _service().create_employee_from_request(req)
     return employee, 201
 
+@bp.get("")
+def list_employees():
+    """
+    Filters: type, employment_level, education_level, employed_from/employed_to
+    (inclusive ISO dates); paging: limit, cursor (next_cursor of the previous page).
+    """
+    try:
+        req = list_query_adapter.validate_python(request.args.to_dict())
+    except ValidationError as e:
+        return {"error": "Validation error", "details": e.errors(include_url=False, include_context=False)}, 400
+
+    try:
+        return _service().list_employees(EmployeeQuery(**req.model_dump())), 200
+    except InvalidCursorError as e:
+        return {"error": str(e)}, 400
+
+@bp.post("/bulk")
+def bulk_ingest():
+    """
+    NDJSON body, one employee payload per line. Streams the upload, validates
+    and writes in chunks through the batched repository path; bad lines are
+    reported by line number without failing the rest.
+    """
+    service = _service()
+    ingest = BulkIngest()
+
+    for line_no, raw_line in enumerate(request.stream, start=1):
+        chunk = ingest.feed(line_no, raw_line)
+        if chunk:
+            ingest.created += service.create_employees(chunk)
+
+    chunk = ingest.flush()
+    if chunk:
+        ingest.created += service.create_employees(chunk)
+
+    return ingest.result(), 200
+
 @bp.get("/<employee_id>")
 def get_employee(employee_id: str):
     employee = _service().get_employee(employee_id)
@@ -40,9 +143,37 @@ def get_productivity(employee_id: str):
         return {"error": "Employee not found"}, 404
     return result, 200
 
+@bp.post("/productivity")
+def get_productivity_batch():
+    raw = request.get_json(silent=True) or {}
+
+    try:
+        req = employee_ids_adapter.validate_python(raw)
+    except ValidationError as e:
+        return {"error": "Validation error", "details": e.errors()}, 400
+
+    return _service().get_productivity_batch(req.employee_ids), 200
+
 @bp.get("/<employee_id>/productivity/predict")
 def predict_productivity(employee_id: str):
-    result = _service().predict_productivity(employee_id)
+    try:
+        result = _service().predict_productivity(employee_id, request.args.get("version"))
+    except ModelNotLoadedError as e:
+        return {"error": str(e)}, 503
     if result is None:
         return {"error": "Employee not found"}, 404
     return result, 200
+
+@bp.post("/productivity/predict")
+def predict_productivity_batch():
+    raw = request.get_json(silent=True) or {}
+
+    try:
+        req = employee_ids_adapter.validate_python(raw)
+    except ValidationError as e:
+        return {"error": "Validation error", "details": e.errors()}, 400
+
+    try:
+        return _service().predict_productivity_batch(req.employee_ids, request.args.get("version")), 200
+    except ModelNotLoadedError as e:
+        return {"error": str(e)}, 503
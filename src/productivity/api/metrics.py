@@ -0,0 +1,40 @@
+import time
+
+from flask import Blueprint, Flask, Response, g, request
+
+from productivity.observability.metrics import CONTENT_TYPE, HTTP_REQUEST_SECONDS, HTTP_REQUESTS, REGISTRY
+
+bp = Blueprint("metrics", __name__)
+
+
+@bp.get("/metrics")
+def metrics():
+    return Response(REGISTRY.render(), mimetype=None, content_type=CONTENT_TYPE)
+
+
+def install_request_metrics(app: Flask) -> None:
+    """
+    Time every request and count it by (method, route template, status).
+    The route label is the matched rule ("/employees/<employee_id>"), never the
+    raw path, so label cardinality stays bounded. Unhandled exceptions count as 500.
+    """
+
+    @app.before_request
+    def _start_timer():
+        g.metrics_start = time.perf_counter()
+
+    @app.after_request
+    def _record_status(response):
+        g.metrics_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def _observe(exc):
+        start = g.pop("metrics_start", None)
+        if start is None:
+            return
+        status = g.pop("metrics_status", None) if exc is None else None
+        rule = request.url_rule
+        labels = (request.method, rule.rule if rule is not None else "<unmatched>", str(status or 500))
+        HTTP_REQUEST_SECONDS.labels(*labels).observe(time.perf_counter() - start)
+        HTTP_REQUESTS.labels(*labels).inc()
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+from flask import Blueprint, request, current_app
+from pydantic import TypeAdapter, ValidationError
+
+from ml.registry import ModelNotLoadedError
+from productivity.schemas.model_registry import LoadModelRequest
+
+bp = Blueprint("models", __name__, url_prefix="/models")
+
+
+load_model_adapter = TypeAdapter(LoadModelRequest)
+
+def _registry():
+    return current_app.config["MODEL_REGISTRY"]
+
+def _service():
+    return current_app.config["EMPLOYEE_SERVICE"]
+
+def _artifact_path(relative: str) -> Path | None:
+    # only artifacts under MODEL_DIR can be loaded (pickles execute code on load)
+    model_dir = Path(current_app.config["MODEL_DIR"]).resolve()
+    path = (model_dir / relative).resolve()
+    return path if path.is_relative_to(model_dir) else None
+
+@bp.get("")
+def list_models():
+    return _registry().stats(), 200
+
+@bp.get("/prediction-cache")
+def prediction_cache_stats():
+    return _service().prediction_cache_stats(), 200
+
+@bp.get("/prediction-batcher")
+def prediction_batcher_stats():
+    return _service().prediction_batcher_stats(), 200
+
+@bp.post("")
+def load_model():
+    raw = request.get_json(silent=True) or {}
+
+    try:
+        req = load_model_adapter.validate_python(raw)
+    except ValidationError as e:
+        return {"error": "Validation error", "details": e.errors()}, 400
+
+    path = _artifact_path(req.path)
+    if path is None or not path.exists():
+        return {"error": "Model artifact not found"}, 404
+
+    # a corrupt or incompatible artifact is the caller's problem, not a 500; the active model is unchanged
+    try:
+        model = _registry().load(req.version, path, activate=req.activate)
+    except Exception as e:
+        current_app.logger.exception("Could not load model %s from %s", req.version, path)
+        return {"error": f"Could not load model artifact: {type(e).__name__}: {e}"}, 422
+    return model.stats(), 201
+
+@bp.post("/<version>/activate")
+def activate_model(version: str):
+    try:
+        _registry().activate(version)
+    except ModelNotLoadedError as e:
+        return {"error": str(e)}, 404
+    return _registry().stats(), 200
+
+@bp.delete("/<version>")
+def unload_model(version: str):
+    try:
+        _registry().unload(version)
+    except ValueError as e:
+        return {"error": str(e)}, 409
+    return _registry().stats(), 200
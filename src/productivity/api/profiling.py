@@ -0,0 +1,57 @@
+from flask import Blueprint, Flask, current_app, g, request, send_file
+
+from productivity.observability.profiling import RequestProfiler
+
+bp = Blueprint("profiling", __name__, url_prefix="/profiles")
+
+
+def _profiler() -> RequestProfiler:
+    return current_app.config["PROFILER"]
+
+
+@bp.get("")
+def list_profiles():
+    profiler = _profiler()
+    return {"mode": profiler.mode, "sample_rate": profiler.sample_rate, "profiles": profiler.recent()}, 200
+
+
+@bp.get("/<profile_id>")
+def download_profile(profile_id: str):
+    path = _profiler().path_of(profile_id)
+    if path is None or not path.is_file():
+        return {"error": "Profile not found"}, 404
+    return send_file(path.resolve(), as_attachment=True, download_name=path.name)
+
+
+def install_request_profiling(app: Flask, profiler: RequestProfiler) -> None:
+    """
+    Profile requests the profiler selects; the profile id comes back in X-Profile-Id.
+    Requests for the profiles themselves are never profiled.
+    """
+    app.config["PROFILER"] = profiler
+    app.register_blueprint(bp)
+
+    @app.before_request
+    def _start_profile():
+        if request.blueprint != bp.name:
+            g.profile = profiler.start(request.headers)
+
+    @app.after_request
+    def _tag_profile(response):
+        active = g.pop("profile", None)
+        if active is not None:
+            record = active.finish(request.method, _route(), request.path, response.status_code)
+            response.headers["X-Profile-Id"] = record.id
+        return response
+
+    @app.teardown_request
+    def _finish_failed_profile(exc):
+        # after_request is skipped when the view raised
+        active = g.pop("profile", None)
+        if active is not None:
+            active.finish(request.method, _route(), request.path, 500)
+
+
+def _route() -> str:
+    rule = request.url_rule
+    return rule.rule if rule is not None else "<unmatched>"
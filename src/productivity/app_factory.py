@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import logging
 import os
 from flask import Flask
 
+from ml.model import DEFAULT_MODEL_PATH
+from ml.registry import ModelRegistry
+from productivity.api.analytics import bp as analytics_bp
 from productivity.api.employees import bp as employees_bp
+from productivity.api.metrics import bp as metrics_bp, install_request_metrics
+from productivity.api.models import bp as models_bp
+from productivity.api.profiling import install_request_profiling
+from productivity.observability.profiling import RequestProfiler
+from productivity.services.daily_job import start_daily_job
 from productivity.services.employee_service import EmployeeService
+from productivity.services.prediction_batcher import PredictionBatcher
+from productivity.services.prediction_cache import PredictionCache
 
 from productivity.persistence.in_memory_employee_repo import InMemoryEmployeeRepository
 
@@ -23,19 +34,81 @@ def create_app() -> Flask:
             table_name=os.getenv("EMPLOYEES_TABLE_NAME"),
             region_name=os.getenv("AWS_REGION"),
         )
+    elif repo_type == "columnar":
+        from productivity.persistence.columnar_employee_repo import ColumnarEmployeeRepository
+
+        # structure-of-arrays store for analytics-scale populations
+        repo = ColumnarEmployeeRepository()
     else: 
         repo = InMemoryEmployeeRepository()
     
+    # model registry: load + warm up configured versions at startup
+    app.config["MODEL_DIR"] = os.getenv("MODEL_DIR", "src/ml")
+    models = load_configured_models(app.logger)
+
     # dependency injection
-    app.config["EMPLOYEE_SERVICE"] = EmployeeService(repo=repo)
+    app.config["MODEL_REGISTRY"] = models
+    # opt-in micro-batching (PREDICTION_BATCHING=1): concurrent predict requests share one model
+    # call per PREDICTION_BATCH_WINDOW_MS window / PREDICTION_BATCH_MAX_ROWS rows
+    batcher = None
+    if os.getenv("PREDICTION_BATCHING", "0") == "1":
+        batcher = PredictionBatcher(
+            max_delay=float(os.getenv("PREDICTION_BATCH_WINDOW_MS", "2")) / 1e3,
+            max_batch_rows=int(os.getenv("PREDICTION_BATCH_MAX_ROWS", "64")),
+        )
+    service = EmployeeService(
+        repo=repo,
+        models=models,
+        prediction_cache=PredictionCache(max_entries=int(os.getenv("PREDICTION_CACHE_SIZE", "10000"))),
+        batcher=batcher,
+    )
+    app.config["EMPLOYEE_SERVICE"] = service
+
+    # dashboard aggregates are updated on every save; a full rebuild (the promotion penalty is date-dependent)
+    # runs from POST /analytics/productivity/recompute, or opt in with AGGREGATES_DAILY_RECOMPUTE=1 to rebuild
+    # at startup and then daily on a background thread. Saves are always scored as of their own day; the
+    # rebuild refreshes everyone else's date-dependent scores
+    if os.getenv("AGGREGATES_DAILY_RECOMPUTE", "0") == "1":
+        start_daily_job(service.recompute_productivity_aggregates, name="productivity-aggregates")
+
+    # per-request latency / status metrics, scraped from /metrics
+    install_request_metrics(app)
+
+    # opt-in request profiling (PROFILING_ENABLED=1): triggered by the X-Profile header or
+    # PROFILE_SAMPLE_RATE, written to PROFILE_DIR and listed at /profiles
+    profiler = RequestProfiler.from_env()
+    if profiler is not None:
+        install_request_profiling(app, profiler)
 
     # routes:
 
     app.register_blueprint(employees_bp)
+    app.register_blueprint(models_bp)
+    app.register_blueprint(analytics_bp)
+    app.register_blueprint(metrics_bp)
 
     #basic health check
     @app.get("/health")
     def health():
-        return {"status": "ok", "repo": repo_type}, 200
+        return {"status": "ok", "repo": repo_type, "model_version": models.active_version}, 200
     
-    return app
\ No newline at end of file
+    return app
+
+def load_configured_models(logger: logging.Logger) -> ModelRegistry:
+    """
+    MODEL_PATH as MODEL_VERSION (the active one), plus CANDIDATE_MODEL_PATH as
+    CANDIDATE_MODEL_VERSION when set. Shared with the ASGI app.
+    """
+    models = ModelRegistry()
+    _load_configured_model(logger, models, os.getenv("MODEL_VERSION", "current"), os.getenv("MODEL_PATH", str(DEFAULT_MODEL_PATH)))
+    candidate_path = os.getenv("CANDIDATE_MODEL_PATH")
+    if candidate_path:
+        _load_configured_model(logger, models, os.getenv("CANDIDATE_MODEL_VERSION", "candidate"), candidate_path)
+    return models
+
+def _load_configured_model(logger: logging.Logger, models: ModelRegistry, version: str, path: str) -> None:
+    # a missing/broken artifact shouldn't take the whole API down; predict routes answer 503 instead
+    try:
+        models.load(version, path)
+    except Exception:
+        logger.exception("Could not load model %s from %s", version, path)
\ No newline at end of file
@@ -0,0 +1,8 @@
+from productivity.asgi_factory import create_asgi_app
+
+app = create_asgi_app()
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app)
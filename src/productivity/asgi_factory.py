@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from productivity.api.async_analytics import routes as analytics_routes
+from productivity.api.async_employees import routes as employee_routes
+from productivity.api.async_metrics import RequestMetricsMiddleware, metrics
+from productivity.app_factory import load_configured_models
+from productivity.services.async_employee_service import DEFAULT_INFERENCE_WORKERS, AsyncEmployeeService
+from productivity.services.daily_job import start_daily_job
+from productivity.services.prediction_cache import PredictionCache
+
+logger = logging.getLogger("productivity.asgi")
+
+
+def create_asgi_app() -> Starlette:
+    """
+    Async serving mode: the /employees and /analytics routes, /metrics and
+    /health of create_app() on an event loop, for many concurrent requests whose time is
+    mostly repository I/O. Configured by the same env vars (REPO_TYPE,
+    MODEL_PATH, PREDICTION_CACHE_SIZE, AGGREGATES_DAILY_RECOMPUTE, ...), plus
+    INFERENCE_WORKERS, the threads model inference is offloaded to.
+
+    Model management and profiling routes stay on the Flask app.
+    Serve with any ASGI server, e.g. `uvicorn productivity.asgi:app`.
+    """
+    # choose repository implementation
+    repo_type = os.getenv("REPO_TYPE", "memory").lower()
+
+    if repo_type == "dynamodb":
+        from productivity.persistence.async_dynamodb_employee_repo import AsyncDynamoDBEmployeeRepository
+
+        repo = AsyncDynamoDBEmployeeRepository(
+            table_name=os.getenv("EMPLOYEES_TABLE_NAME"),
+            region_name=os.getenv("AWS_REGION"),
+        )
+    else:
+        from productivity.persistence.in_memory_employee_repo import AsyncInMemoryEmployeeRepository
+
+        if repo_type == "columnar":
+            from productivity.persistence.columnar_employee_repo import ColumnarEmployeeRepository
+
+            repo = AsyncInMemoryEmployeeRepository(ColumnarEmployeeRepository())
+        else:
+            repo = AsyncInMemoryEmployeeRepository()
+
+    models = load_configured_models(logger)
+    service = AsyncEmployeeService(
+        repo=repo,
+        models=models,
+        prediction_cache=PredictionCache(max_entries=int(os.getenv("PREDICTION_CACHE_SIZE", "10000"))),
+        inference_workers=int(os.getenv("INFERENCE_WORKERS", str(DEFAULT_INFERENCE_WORKERS))),
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        # the aiobotocore client has to be created on the serving loop
+        if hasattr(repo, "open"):
+            await repo.open()
+
+        # opt-in, as in create_app; the rebuild's CPU work runs on executor threads, not the loop
+        if os.getenv("AGGREGATES_DAILY_RECOMPUTE", "0") == "1":
+            loop = asyncio.get_running_loop()
+            start_daily_job(
+                lambda: asyncio.run_coroutine_threadsafe(service.recompute_productivity_aggregates(), loop).result(),
+                name="productivity-aggregates",
+            )
+        try:
+            yield
+        finally:
+            service.close()
+            if hasattr(repo, "close"):
+                await repo.close()
+
+    #basic health check
+    async def health(request: Request):
+        return JSONResponse({"status": "ok", "repo": repo_type, "model_version": models.active_version})
+
+    app = Starlette(
+        routes=[*employee_routes, *analytics_routes, Route("/metrics", metrics), Route("/health", health)],
+        middleware=[Middleware(RequestMetricsMiddleware)],
+        lifespan=lifespan,
+    )
+    app.state.employee_service = service
+    app.state.model_registry = models
+    return app
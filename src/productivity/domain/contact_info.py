@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from .name import Name
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class ContactInfo:
 
     name: Name
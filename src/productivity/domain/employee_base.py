@@ -14,7 +14,10 @@ class ProductivityEstimate(Protocol):
     def estimate_productivity(self) -> float:
         ...
 
-@dataclass(eq=True)
+# The hierarchy uses slots=True (no per-instance __dict__). slots=True rebuilds
+# the class, which breaks zero-argument super() before Python 3.14, so
+# subclasses call super(Class, self) explicitly.
+@dataclass(eq=True, slots=True)
 class AbstractEmployee(ABC):
     EMPLOYMENT_LEVEL_BONUS: ClassVar[float] = 1.4
 
@@ -41,7 +44,7 @@ class AbstractEmployee(ABC):
         Base productivity estimate
         
         Subclasses (Manager/IC/Hourly/etc.) should typically add to this:
-            return: super().estimate_productivity() + extra_terms
+            return: super(Subclass, self).estimate_productivity() + extra_terms
         """
         return self._employee_level_bonus()
     
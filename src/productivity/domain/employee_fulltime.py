@@ -12,7 +12,7 @@ from productivity.domain.employee_base import AbstractEmployee
 from .contact_info import ContactInfo
 from .enums import EducationLevel, EmploymentLevel
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class AbstractFullTimeEmployee(AbstractEmployee, ABC):
     PROJECT_BONUS: ClassVar[float] = 1.5
     PROJECT_BONUS_THRESHOLD: ClassVar[int] = 2
@@ -54,14 +54,14 @@ class AbstractFullTimeEmployee(AbstractEmployee, ABC):
     
     def estimate_productivity(self) -> float:
         return (
-            super().estimate_productivity()
+            super(AbstractFullTimeEmployee, self).estimate_productivity()
             + self._base_productivity_full_time()
             + self._project_bonus()
             + self._last_promotion_penalty()
         )
     
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class Manager(AbstractFullTimeEmployee):
     MANAGER_BONUS: ClassVar[float] = 1.8
     MANAGER_BONUS_THRESHOLD: ClassVar[int] = 8
@@ -82,10 +82,10 @@ class Manager(AbstractFullTimeEmployee):
         Sums base productivity and all applicable manager bonuses.
         """
 
-        return super().estimate_productivity() + self._manager_bonus()
+        return super(Manager, self).estimate_productivity() + self._manager_bonus()
     
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class IndividualContributor(AbstractFullTimeEmployee):
 
     INDIVIDUAL_CONTRIBUTOR_BONUS: ClassVar[float] = 1.3
@@ -103,6 +103,6 @@ class IndividualContributor(AbstractFullTimeEmployee):
         )
     
     def estimate_productivity(self) -> float:
-        return super().estimate_productivity() + self._individual_contributor_bonus()
+        return super(IndividualContributor, self).estimate_productivity() + self._individual_contributor_bonus()
     
     
\ No newline at end of file
@@ -7,7 +7,7 @@ from typing import ClassVar
 
 from .employee_base import AbstractEmployee
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class AbstractPartTimeEmployee(AbstractEmployee, ABC):
     PRODUCTIVITY_FACTOR: ClassVar[float] = 3.7
 
@@ -22,9 +22,9 @@ class AbstractPartTimeEmployee(AbstractEmployee, ABC):
         return (self._f(self.actual_work_hours) / self._f(self.contractual_work_hours)) * self.PRODUCTIVITY_FACTOR
     
     def estimate_productivity(self) -> float:
-        return super().estimate_productivity() + self._base_productivity_part_time()
+        return super(AbstractPartTimeEmployee, self).estimate_productivity() + self._base_productivity_part_time()
      
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class HourlyEmployee(AbstractPartTimeEmployee):
     HOURLY_EARNINGS_BONUS: ClassVar[float] = 3.0
     HOURLY_EARNINGS_BONUS_THRESHOLD: ClassVar[float] = 14.0
@@ -39,12 +39,12 @@ class HourlyEmployee(AbstractPartTimeEmployee):
         )
     
     def estimate_productivity(self):
-        return super().estimate_productivity() + self._hourly_earnings_bonus()
+        return super(HourlyEmployee, self).estimate_productivity() + self._hourly_earnings_bonus()
     
 
 
-@dataclass(eq=True)        
+@dataclass(eq=True, slots=True)        
 class BenefitsEligibleEmployee(AbstractPartTimeEmployee):
     def estimate_productivity(self) -> float:
-        return super().estimate_productivity()
+        return super(BenefitsEligibleEmployee, self).estimate_productivity()
     
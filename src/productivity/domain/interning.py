@@ -0,0 +1,31 @@
+# shared instances for values that repeat across many employees
+
+from __future__ import annotations
+import sys
+from typing import Tuple
+from weakref import WeakValueDictionary
+
+from .name import Name
+
+# weak values: a Name lives only as long as some employee references it
+_NAMES: "WeakValueDictionary[Tuple[str, str], Name]" = WeakValueDictionary()
+
+
+def intern_str(value: str) -> str:
+    """
+    One shared copy per distinct string (addresses, phone numbers, first/last names).
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_name(first_name: str, last_name: str) -> Name:
+    """
+    One shared Name per distinct (first, last), e.g. the same emergency contact on every record.
+    Safe to share because Name is frozen.
+    """
+    key = (first_name, last_name)
+    name = _NAMES.get(key)
+    if name is None:
+        name = Name(first_name=intern_str(first_name), last_name=intern_str(last_name))
+        _NAMES[key] = name
+    return name
@@ -3,7 +3,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-@dataclass(eq=True)
+@dataclass(eq=True, frozen=True, slots=True, weakref_slot=True)
 class Name:
 
     first_name: str
@@ -2,15 +2,24 @@ from __future__ import annotations
 
 from dataclasses import fields
 from datetime import date
-from typing import Any, Mapping, Dict, Type
+from operator import attrgetter
+from typing import Any, Callable, FrozenSet, Mapping, Dict, Type, get_args
 
 from productivity.domain.employee_base import AbstractEmployee
 from productivity.domain.employee_fulltime import Manager, IndividualContributor
 from productivity.domain.employee_parttime import HourlyEmployee, BenefitsEligibleEmployee
 
 from productivity.domain.contact_info import ContactInfo
-from productivity.domain.name import Name
+from productivity.domain.interning import intern_name, intern_str
 from productivity.domain.enums import EducationLevel, EmploymentLevel
+from productivity.schemas.employee_create import (
+    BaseEmployeeCreate,
+    BenefitsEligibleEmployeeCreate,
+    ContactInfoSchema,
+    HourlyEmployeeCreate,
+    IndividualContributorCreate,
+    ManagerCreate,
+)
 
 
 class EmployeeFactory:
@@ -51,20 +60,75 @@ class EmployeeFactory:
             if key in kwargs and isinstance(kwargs[key], str):
                 kwargs[key] = date.fromisoformat(kwargs[key])
         
-        init_field_names = {f.name for f in fields(model_cls) if f.init}
+        init_field_names = _INIT_FIELDS[model_cls]
         kwargs = {k: v for k, v in kwargs.items() if k in init_field_names}
 
         return model_cls(**kwargs)
 
+    @classmethod
+    def from_request(cls, req: BaseEmployeeCreate) -> AbstractEmployee:
+        """
+        Validated create request -> domain object in one step.
+        Pydantic already parsed enums, dates and the nested contact, so this
+        skips the model_dump() / from_payload() round trip.
+        """
+        build = _REQUEST_BUILDERS.get(req.__class__)
+        if build is None:
+            raise ValueError(f"Unsupported employee type: {getattr(req, 'type', None)}")
+        return build(req)
+
     @staticmethod
     def _parse_contact(payload: Mapping[str, Any]) -> ContactInfo:
         p = dict(payload)
 
-        # ContactInfo.name and emergency_contact are Name dataclasses
+        # ContactInfo.name and emergency_contact are Name dataclasses (shared when repeated)
         if "name" in p and isinstance(p["name"], dict):
-            p["name"] = Name(**p["name"])
+            p["name"] = intern_name(**p["name"])
 
         if "emergency_contact" in p and isinstance(p["emergency_contact"], dict):
-            p["emergency_contact"] = Name(**p["emergency_contact"])
+            p["emergency_contact"] = intern_name(**p["emergency_contact"])
+
+        for key in ("address", "phone_number"):
+            if key in p:
+                p[key] = intern_str(p[key])
 
         return ContactInfo(**p)
+
+
+# --- cached at import time ---
+
+_INIT_FIELDS: Dict[Type[AbstractEmployee], FrozenSet[str]] = {
+    model_cls: frozenset(f.name for f in fields(model_cls) if f.init)
+    for model_cls in EmployeeFactory.TYPE_MAP.values()
+}
+
+
+def _contact_from_schema(c: ContactInfoSchema) -> ContactInfo:
+    return ContactInfo(
+        name=intern_name(c.name.first_name, c.name.last_name),
+        address=intern_str(c.address),
+        phone_number=intern_str(c.phone_number),
+        email=c.email,
+        emergency_contact=intern_name(c.emergency_contact.first_name, c.emergency_contact.last_name),
+    )
+
+
+def _request_builder(request_cls: Type[BaseEmployeeCreate]) -> Callable[[BaseEmployeeCreate], AbstractEmployee]:
+    """
+    Per-type constructor: the domain class and the copied field names are resolved once.
+    """
+    (emp_type,) = get_args(request_cls.model_fields["type"].annotation)
+    model_cls = EmployeeFactory.TYPE_MAP[emp_type]
+    names = tuple(n for n in request_cls.model_fields if n in _INIT_FIELDS[model_cls] and n != "contact")
+    values = attrgetter(*names)
+
+    def build(req: BaseEmployeeCreate) -> AbstractEmployee:
+        return model_cls(id="", contact=_contact_from_schema(req.contact), **dict(zip(names, values(req))))
+
+    return build
+
+
+_REQUEST_BUILDERS: Dict[Type[BaseEmployeeCreate], Callable[[BaseEmployeeCreate], AbstractEmployee]] = {
+    request_cls: _request_builder(request_cls)
+    for request_cls in (HourlyEmployeeCreate, BenefitsEligibleEmployeeCreate, ManagerCreate, IndividualContributorCreate)
+}
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Mapping, Optional
+from uuid import uuid4
+
+MODES = ("deterministic", "sampling")
+# file suffix per mode: pstats for cProfile, collapsed stacks ("folded") for the sampler
+SUFFIXES = {"deterministic": ".prof", "sampling": ".folded"}
+
+
+@dataclass(frozen=True)
+class ProfileRecord:
+    id: str
+    method: str
+    route: str
+    path: str
+    status: int
+    duration_ms: float
+    mode: str
+    started_at: str
+    file: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _StackSampler:
+    """
+    Samples one thread's Python stack every `interval` seconds from a helper thread.
+    counts: "outer;...;inner" -> samples, the collapsed format flamegraph.pl / speedscope read.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def write(self, path: Path) -> None:
+        with open(path, "w") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class ActiveProfile:
+    """
+    One request being profiled; finish() stops it and writes the file.
+    """
+
+    def __init__(self, profiler: "RequestProfiler", mode: str):
+        self._profiler = profiler
+        self.mode = mode
+        self.id = uuid4().hex[:12]
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_StackSampler] = None
+
+        if mode == "deterministic":
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()  # raises ValueError while another profiler is active
+        else:
+            self._sampler = _StackSampler(threading.get_ident(), profiler.sample_interval)
+            self._sampler.start()
+
+    def finish(self, method: str, route: str, path: str, status: int) -> ProfileRecord:
+        duration = time.perf_counter() - self._start
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+
+        stamp = self.started_at.strftime("%Y%m%dT%H%M%S")
+        file = self._profiler.directory / f"{stamp}-{self.id}{SUFFIXES[self.mode]}"
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(file)
+        else:
+            self._sampler.write(file)
+
+        record = ProfileRecord(
+            id=self.id,
+            method=method,
+            route=route,
+            path=path,
+            status=status,
+            duration_ms=round(duration * 1e3, 3),
+            mode=self.mode,
+            started_at=self.started_at.isoformat(),
+            file=file.name,
+        )
+        self._profiler._remember(record)
+        return record
+
+
+class RequestProfiler:
+    """
+    Opt-in per-request profiler.
+
+    A request is profiled when it carries the trigger header (any value but
+    "0"; the value "sampling" or "deterministic" picks the mode for that
+    request) or, failing that, with probability `sample_rate`.
+    deterministic: cProfile of the request thread, written as a pstats .prof
+      (snakeviz, gprof2dot, `python -m pstats`). On Python 3.12+ cProfile runs
+      on sys.monitoring, which is process-wide: the profile also records every
+      other thread running meanwhile, and only one can be active at a time. A
+      request triggered while another deterministic profile is running is
+      sampled instead, and on a busy threaded server sampling mode is the one
+      that attributes time to the right request.
+    sampling: the request thread's stack every `sample_interval` seconds,
+      written as collapsed stacks .folded (flamegraph.pl, speedscope); much
+      lower overhead, so it suits sample rates above zero.
+    Only the newest `keep` profiles are kept; older files are deleted.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        mode: str = "deterministic",
+        sample_rate: float = 0.0,
+        header: str = "X-Profile",
+        sample_interval: float = 0.001,
+        keep: int = 100,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode: {mode} (expected one of {', '.join(MODES)})")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.header = header
+        self.sample_interval = sample_interval
+        self._records: Deque[ProfileRecord] = deque()
+        self._keep = keep
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["RequestProfiler"]:
+        """
+        PROFILING_ENABLED=1 turns it on; PROFILE_DIR, PROFILE_MODE, PROFILE_SAMPLE_RATE,
+        PROFILE_HEADER, PROFILE_SAMPLE_INTERVAL and PROFILE_KEEP configure it.
+        """
+        if os.getenv("PROFILING_ENABLED", "0") != "1":
+            return None
+        return cls(
+            directory=os.getenv("PROFILE_DIR", "profiles"),
+            mode=os.getenv("PROFILE_MODE", "deterministic"),
+            sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "0")),
+            header=os.getenv("PROFILE_HEADER", "X-Profile"),
+            sample_interval=float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.001")),
+            keep=int(os.getenv("PROFILE_KEEP", "100")),
+        )
+
+    def start(self, headers: Mapping[str, str]) -> Optional[ActiveProfile]:
+        """
+        Start profiling the current request if it is triggered; None otherwise.
+        """
+        requested = headers.get(self.header)
+        if requested is not None and requested != "0":
+            mode = requested if requested in MODES else self.mode
+        elif self.sample_rate > 0 and random.random() < self.sample_rate:
+            mode = self.mode
+        else:
+            return None
+
+        try:
+            return ActiveProfile(self, mode)
+        except ValueError:
+            # another profiler owns the interpreter (Python 3.12+ allows one at a time)
+            return ActiveProfile(self, "sampling")
+
+    def recent(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [record.to_dict() for record in reversed(self._records)]
+
+    def path_of(self, profile_id: str) -> Optional[Path]:
+        with self._lock:
+            for record in self._records:
+                if record.id == profile_id:
+                    return self.directory / record.file
+        return None
+
+    def _remember(self, record: ProfileRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+            evicted = [self._records.popleft() for _ in range(max(0, len(self._records) - self._keep))]
+        for old in evicted:
+            (self.directory / old.file).unlink(missing_ok=True)
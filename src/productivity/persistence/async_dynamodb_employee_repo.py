@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import uuid4
+
+from boto3.dynamodb.conditions import ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from productivity.domain.employee_base import AbstractEmployee
+from productivity.observability.metrics import stage
+from productivity.persistence.dynamodb_employee_repo import (
+    BATCH_GET_LIMIT,
+    BATCH_WRITE_LIMIT,
+    DynamoDBEmployeeRepository,
+    QueryPlan,
+    _chunks,
+    backoff_seconds,
+    employee_to_item,
+    item_to_employee,
+)
+from productivity.persistence.employee_repo import EmployeePage, EmployeeQuery
+
+_GET_ITEM = stage("dynamodb_get_item")
+_BATCH_GET = stage("dynamodb_batch_get")
+_REHYDRATE = stage("rehydrate")
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+class AsyncDynamoDBEmployeeRepository:
+    """
+    AsyncEmployeeRepository on an aiobotocore client: same table layout, item
+    mapping, query plan and cursors as DynamoDBEmployeeRepository, but every
+    round trip is awaited, so one event loop keeps many requests in flight.
+
+    aiobotocore's client is the low-level one, so items are converted to and
+    from the DynamoDB wire format here (the boto3 resource does this for the
+    sync repository). Batch chunks run concurrently with asyncio.gather.
+
+    The client is created inside the running loop: `await repo.open()` (or
+    `async with repo:`) before use, `await repo.close()` at shutdown.
+    """
+
+    MAX_BATCH_ATTEMPTS = DynamoDBEmployeeRepository.MAX_BATCH_ATTEMPTS
+    BACKOFF_BASE_SECONDS = DynamoDBEmployeeRepository.BACKOFF_BASE_SECONDS
+
+    def __init__(
+        self,
+        table_name: str | None = None,
+        region_name: str | None = None,
+        endpoint_url: str | None = None,
+        max_pool_connections: int = 64,
+    ):
+        self._table_name = table_name or os.environ["EMPLOYEES_TABLE_NAME"]
+        self._region_name = region_name
+        self._endpoint_url = endpoint_url or os.getenv("DYNAMODB_ENDPOINT_URL")
+        # in-flight requests per client; botocore's default of 10 would cap concurrency again
+        self._max_pool_connections = max_pool_connections
+        self._client = None
+        self._stack: Optional[AsyncExitStack] = None
+
+    async def open(self) -> "AsyncDynamoDBEmployeeRepository":
+        if self._client is not None:
+            return self
+        try:
+            from aiobotocore.config import AioConfig
+            from aiobotocore.session import get_session
+        except ImportError as e:
+            raise ImportError(
+                "The async DynamoDB repository needs aiobotocore (pip install aiobotocore)"
+            ) from e
+
+        self._stack = AsyncExitStack()
+        self._client = await self._stack.enter_async_context(
+            get_session().create_client(
+                "dynamodb",
+                region_name=self._region_name,
+                endpoint_url=self._endpoint_url,
+                config=AioConfig(max_pool_connections=self._max_pool_connections),
+            )
+        )
+        return self
+
+    async def close(self) -> None:
+        if self._stack is not None:
+            await self._stack.aclose()
+        self._client = self._stack = None
+
+    async def __aenter__(self) -> "AsyncDynamoDBEmployeeRepository":
+        return await self.open()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    # -------------------------
+    # AsyncEmployeeRepository
+    # -------------------------
+
+    async def save(self, employee: AbstractEmployee) -> AbstractEmployee:
+        if not employee.id:
+            employee.id = str(uuid4())
+
+        await self._client.put_item(TableName=self._table_name, Item=_to_wire(employee_to_item(employee)))
+        return employee
+
+    async def get(self, employee_id: str) -> Optional[AbstractEmployee]:
+        with _GET_ITEM.time():
+            resp = await self._client.get_item(
+                TableName=self._table_name, Key={"employee_id": {"S": employee_id}}
+            )
+        item = resp.get("Item")
+        if not item:
+            return None
+
+        with _REHYDRATE.time():
+            return item_to_employee(_from_wire(item))
+
+    async def save_many(self, employees: Sequence[AbstractEmployee]) -> List[AbstractEmployee]:
+        """
+        batch_write_item in 25-item chunks, sent concurrently.
+        """
+        items: Dict[str, Dict[str, Any]] = {}
+        for employee in employees:
+            if not employee.id:
+                employee.id = str(uuid4())
+            # a batch may not contain the same key twice; last write wins
+            items[employee.id] = _to_wire(employee_to_item(employee))
+
+        await asyncio.gather(*(self._write_chunk(chunk) for chunk in _chunks(list(items.values()), BATCH_WRITE_LIMIT)))
+        return list(employees)
+
+    async def get_many(self, employee_ids: Sequence[str]) -> Dict[str, AbstractEmployee]:
+        """
+        batch_get_item in 100-key chunks, sent concurrently.
+        """
+        unique_ids = list(dict.fromkeys(employee_ids))
+        found: Dict[str, AbstractEmployee] = {}
+        with _BATCH_GET.time():
+            chunks = await asyncio.gather(*(self._get_chunk(chunk) for chunk in _chunks(unique_ids, BATCH_GET_LIMIT)))
+        with _REHYDRATE.time():
+            for items in chunks:
+                for item in items:
+                    employee = item_to_employee(_from_wire(item))
+                    found[employee.id] = employee
+        return found
+
+    async def query(self, query: EmployeeQuery) -> EmployeePage:
+        """
+        Same GSI walk as DynamoDBEmployeeRepository.query.
+        """
+        plan = QueryPlan(query)
+        items: List[Dict[str, Any]] = []
+        while len(items) < query.limit and not plan.done:
+            resp = await self._client.query(**self._wire_query(plan.request(query.limit - len(items))))
+            items.extend(_from_wire(item) for item in resp.get("Items", []))
+            last_key = resp.get("LastEvaluatedKey")
+            plan.advance(_from_wire(last_key) if last_key else None)
+
+        return EmployeePage(items=[item_to_employee(item) for item in items], next_cursor=plan.next_cursor())
+
+    # -------------------------
+    # Wire-format helpers
+    # -------------------------
+
+    def _wire_query(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        QueryPlan.request kwargs -> client.query kwargs: condition objects become
+        expression strings with placeholders, values go to the wire format.
+        """
+        builder = ConditionExpressionBuilder()  # one builder, so placeholders don't collide
+        key = builder.build_expression(kwargs["KeyConditionExpression"], is_key_condition=True)
+        names = dict(key.attribute_name_placeholders)
+        values = dict(key.attribute_value_placeholders)
+        request: Dict[str, Any] = {
+            "TableName": self._table_name,
+            "IndexName": kwargs["IndexName"],
+            "KeyConditionExpression": key.condition_expression,
+            "Limit": kwargs["Limit"],
+        }
+        if "FilterExpression" in kwargs:
+            condition = builder.build_expression(kwargs["FilterExpression"])
+            request["FilterExpression"] = condition.condition_expression
+            names.update(condition.attribute_name_placeholders)
+            values.update(condition.attribute_value_placeholders)
+        if "ExclusiveStartKey" in kwargs:
+            request["ExclusiveStartKey"] = _to_wire(kwargs["ExclusiveStartKey"])
+        request["ExpressionAttributeNames"] = names
+        request["ExpressionAttributeValues"] = _to_wire(values)
+        return request
+
+    async def _get_chunk(self, employee_ids: List[str]) -> List[Dict[str, Any]]:
+        items: List[Dict[str, Any]] = []
+        request = {self._table_name: {"Keys": [{"employee_id": {"S": eid}} for eid in employee_ids]}}
+
+        for attempt in range(self.MAX_BATCH_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(backoff_seconds(self.BACKOFF_BASE_SECONDS, attempt))
+            resp = await self._client.batch_get_item(RequestItems=request)
+            items.extend(resp.get("Responses", {}).get(self._table_name, []))
+            request = resp.get("UnprocessedKeys") or {}
+            if not request:
+                return items
+
+        raise RuntimeError(f"batch_get_item left {len(request[self._table_name]['Keys'])} keys unprocessed")
+
+    async def _write_chunk(self, items: List[Dict[str, Any]]) -> None:
+        request = {self._table_name: [{"PutRequest": {"Item": item}} for item in items]}
+
+        for attempt in range(self.MAX_BATCH_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(backoff_seconds(self.BACKOFF_BASE_SECONDS, attempt))
+            resp = await self._client.batch_write_item(RequestItems=request)
+            request = resp.get("UnprocessedItems") or {}
+            if not request:
+                return
+
+        raise RuntimeError(f"batch_write_item left {len(request[self._table_name])} items unprocessed")
+
+
+def _to_wire(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: _serializer.serialize(value) for name, value in item.items()}
+
+
+def _from_wire(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: _deserializer.deserialize(value) for name, value in item.items()}
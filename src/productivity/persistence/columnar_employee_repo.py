@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import fields
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+from uuid import uuid4
+
+import numpy as np
+
+from productivity.analytics.productivity_engine import (
+    EMPLOYEE_TYPES,
+    EMPLOYMENT_LEVELS,
+    LEVEL_CODE,
+    TYPE_CODE_BY_CLASS,
+    EmployeeColumns,
+)
+from productivity.domain.contact_info import ContactInfo
+from productivity.domain.employee_base import AbstractEmployee
+from productivity.domain.enums import EducationLevel
+from productivity.factories.employee_factory import EmployeeFactory
+from productivity.observability.metrics import stage
+from productivity.persistence.employee_repo import (
+    EmployeePage,
+    EmployeeQuery,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+EDUCATION_LEVELS: Tuple[EducationLevel, ...] = tuple(EducationLevel)
+EDUCATION_CODE: Dict[EducationLevel, int] = {level: code for code, level in enumerate(EDUCATION_LEVELS)}
+
+# every numeric dataclass field across the hierarchy; NaN where a type doesn't have it
+FLOAT_FIELDS = (
+    "last_year_earnings",
+    "overtime_earnings",
+    "bonus",
+    "base_pay",
+    "contractual_work_hours",
+    "actual_work_hours",
+    "hourly_earnings",
+)
+INT_FIELDS = (
+    "num_projects",
+    "num_employees",
+    "num_patents",
+    "num_publications",
+    "num_external_collaborations",
+)
+# date fields stored as date.toordinal(); 0 where a type doesn't have it
+DATE_FIELDS = ("employment_date", "last_promotion_date")
+
+# string values of each dictionary-encoded column, position == code
+CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "employee_type": EMPLOYEE_TYPES,
+    "employment_level": tuple(level.value for level in EMPLOYMENT_LEVELS),
+    "education_level": tuple(level.value for level in EDUCATION_LEVELS),
+}
+
+_INITIAL_CAPACITY = 1024
+
+_REHYDRATE = stage("rehydrate")
+
+
+class ColumnarEmployeeRepository:
+    """
+    In-memory repository stored column-wise (structure of arrays).
+
+    Each field lives in a growable NumPy array (capacity doubles as rows are
+    added): numerics as float64 (NaN where the type has no such field), enums
+    and the employee type as int8 codes, dates as int64 day ordinals. Ids and
+    contacts stay Python objects. An id -> row dict gives O(1) lookups.
+
+    get/get_many rebuild domain objects from the columns, so this satisfies
+    EmployeeRepository; save copies the employee's values in (later mutations
+    of the saved object are not seen). Population-wide work should use
+    columns()/feature_columns() instead, which hand out read-only views of the
+    live arrays without copying.
+    """
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        self._capacity = max(int(capacity), 1)
+        self._size = 0
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._contacts: List[ContactInfo] = []
+
+        self._arrays: Dict[str, np.ndarray] = {}
+        for name in FLOAT_FIELDS + INT_FIELDS:
+            self._arrays[name] = np.full(self._capacity, np.nan, dtype=np.float64)
+        for name in DATE_FIELDS:
+            self._arrays[name] = np.zeros(self._capacity, dtype=np.int64)
+        for name in CATEGORIES:
+            self._arrays[name] = np.zeros(self._capacity, dtype=np.int8)
+
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    # -------------------------
+    # EmployeeRepository protocol
+    # -------------------------
+
+    def save(self, employee: AbstractEmployee) -> AbstractEmployee:
+        # Server-generated id
+        if not employee.id:
+            employee.id = str(uuid4())
+
+        with self._lock:
+            self._write_row(employee)
+        return employee
+
+    def get(self, employee_id: str) -> Optional[AbstractEmployee]:
+        with self._lock:
+            row = self._index.get(employee_id)
+            if row is None:
+                return None
+            with _REHYDRATE.time():
+                return self._materialize([row])[0]
+
+    def save_many(self, employees: Sequence[AbstractEmployee]) -> List[AbstractEmployee]:
+        for employee in employees:
+            if not employee.id:
+                employee.id = str(uuid4())
+
+        with self._lock:
+            self._reserve(self._size + len(employees))
+            for employee in employees:
+                self._write_row(employee)
+        return list(employees)
+
+    def get_many(self, employee_ids: Sequence[str]) -> Dict[str, AbstractEmployee]:
+        with self._lock:
+            index = self._index
+            found = [eid for eid in dict.fromkeys(employee_ids) if eid in index]
+            with _REHYDRATE.time():
+                employees = self._materialize([index[eid] for eid in found])
+        return dict(zip(found, employees))
+
+    def query(self, query: EmployeeQuery) -> EmployeePage:
+        """
+        Ordered by (employment_date, row). Filters are evaluated as one vectorized
+        mask over the columns; only the page itself is materialized.
+        """
+        after = _decode_row_cursor(query.cursor) if query.cursor else None
+
+        with self._lock:
+            n = self._size
+            arrays = self._arrays
+            mask = np.ones(n, dtype=bool)
+
+            filters = (
+                ("employee_type", query.type, _code(CATEGORIES["employee_type"], query.type)),
+                ("employment_level", query.employment_level, LEVEL_CODE.get(query.employment_level)),
+                ("education_level", query.education_level, EDUCATION_CODE.get(query.education_level)),
+            )
+            for name, value, code in filters:
+                if value is None:
+                    continue
+                if code is None:
+                    return EmployeePage()  # a value no row can have
+                mask &= arrays[name][:n] == code
+
+            dates = arrays["employment_date"][:n]
+            if query.employed_from is not None:
+                mask &= dates >= query.employed_from.toordinal()
+            if query.employed_to is not None:
+                mask &= dates <= query.employed_to.toordinal()
+
+            # (ordinal, row) packed into one sortable int64
+            rows = np.flatnonzero(mask)
+            keys = (dates[rows] << 32) | rows
+            if after is not None:
+                later = keys > ((after[0] << 32) | after[1])
+                rows, keys = rows[later], keys[later]
+
+            if len(keys) > query.limit + 1:
+                nearest = np.argpartition(keys, query.limit)[: query.limit + 1]
+                rows, keys = rows[nearest], keys[nearest]
+            order = np.argsort(keys, kind="stable")
+            page_rows = rows[order][: query.limit].tolist()
+
+            items = self._materialize(page_rows)
+            last = (int(dates[page_rows[-1]]), page_rows[-1]) if page_rows else None
+
+        next_cursor = encode_cursor(list(last)) if len(rows) > query.limit else None
+        return EmployeePage(items=items, next_cursor=next_cursor)
+
+    # -------------------------
+    # Column access
+    # -------------------------
+
+    def row_ids(self) -> List[str]:
+        """
+        Employee ids in row order (row i of every column belongs to row_ids()[i]).
+        """
+        with self._lock:
+            return self._ids[: self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Read-only view of one stored column, trimmed to the current row count.
+        Categorical columns are codes into CATEGORIES[name].
+        """
+        with self._lock:
+            return self._view(name)
+
+    def columns(self) -> EmployeeColumns:
+        """
+        Zero-copy EmployeeColumns over every stored row, ready for estimate_productivity_batch.
+        """
+        with self._lock:
+            return EmployeeColumns(
+                employee_type=self._view("employee_type"),
+                employment_level=self._view("employment_level"),
+                last_year_earnings=self._view("last_year_earnings"),
+                base_pay=self._view("base_pay"),
+                num_projects=self._view("num_projects"),
+                last_promotion_ordinal=self._view("last_promotion_date"),
+                num_employees=self._view("num_employees"),
+                num_publications=self._view("num_publications"),
+                contractual_work_hours=self._view("contractual_work_hours"),
+                actual_work_hours=self._view("actual_work_hours"),
+                hourly_earnings=self._view("hourly_earnings"),
+            )
+
+    def feature_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy views of every stored column by field name, for FeatureEncoder.encode_columns.
+        """
+        with self._lock:
+            return {name: self._view(name) for name in self._arrays}
+
+    # -------------------------
+    # Internal helpers (callers hold the lock)
+    # -------------------------
+
+    def _view(self, name: str) -> np.ndarray:
+        # a view of the current buffer: it reflects re-saves of its rows until
+        # the next growth swaps in new arrays, and never sees rows added later
+        view = self._arrays[name][: self._size]
+        view.flags.writeable = False
+        return view
+
+    def _reserve(self, needed: int) -> None:
+        if needed <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+
+        for name, old in self._arrays.items():
+            fill = np.nan if old.dtype == np.float64 else 0
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            self._arrays[name] = new
+        self._capacity = capacity
+
+    def _write_row(self, employee: AbstractEmployee) -> None:
+        type_code = TYPE_CODE_BY_CLASS.get(employee.__class__)
+        if type_code is None:
+            raise ValueError(f"Unsupported employee class: {employee.__class__.__name__}")
+
+        row = self._index.get(employee.id)
+        if row is None:
+            row = self._size
+            self._reserve(row + 1)
+            self._index[employee.id] = row
+            self._ids.append(employee.id)
+            self._contacts.append(employee.contact)
+            self._size += 1
+        else:
+            self._contacts[row] = employee.contact
+
+        arrays = self._arrays
+        arrays["employee_type"][row] = type_code
+        arrays["employment_level"][row] = LEVEL_CODE[employee.employment_level]
+        arrays["education_level"][row] = EDUCATION_CODE[employee.education_level]
+
+        # a re-saved id may have changed type, so absent fields are reset too
+        for name in FLOAT_FIELDS + INT_FIELDS:
+            value = getattr(employee, name, None)
+            arrays[name][row] = np.nan if value is None else value
+        for name in DATE_FIELDS:
+            value = getattr(employee, name, None)
+            arrays[name][row] = 0 if value is None else value.toordinal()
+
+    def _materialize(self, rows: List[int]) -> List[AbstractEmployee]:
+        """
+        Rows -> domain objects. Gathers each needed column once, then builds per row.
+        """
+        if not rows:
+            return []
+
+        arrays = self._arrays
+        gathered = {name: arrays[name][rows].tolist() for name in arrays}
+        type_codes = gathered["employee_type"]
+
+        employees: List[AbstractEmployee] = []
+        for k, row in enumerate(rows):
+            model_cls = EmployeeFactory.TYPE_MAP[EMPLOYEE_TYPES[type_codes[k]]]
+            kwargs: Dict[str, Any] = {
+                "id": self._ids[row],
+                "contact": self._contacts[row],
+                "education_level": EDUCATION_LEVELS[gathered["education_level"][k]],
+                "employment_level": EMPLOYMENT_LEVELS[gathered["employment_level"][k]],
+            }
+            for name, convert in _plan(model_cls):
+                kwargs[name] = convert(gathered[name][k])
+            employees.append(model_cls(**kwargs))
+        return employees
+
+
+def _code(values: Tuple[str, ...], value: Optional[str]) -> Optional[int]:
+    return values.index(value) if value in values else None
+
+
+def _decode_row_cursor(cursor: str) -> Tuple[int, int]:
+    position = decode_cursor(cursor)
+    if not isinstance(position, list) or len(position) != 2 or not all(type(v) is int and v >= 0 for v in position):
+        raise InvalidCursorError("Invalid cursor")
+    return position[0], position[1]
+
+
+# -------------------------
+# Per-class rebuild plans
+# -------------------------
+
+_PLANS: Dict[Type[AbstractEmployee], List[Tuple[str, Callable[[Any], Any]]]] = {}
+
+
+def _plan(model_cls: Type[AbstractEmployee]) -> List[Tuple[str, Callable[[Any], Any]]]:
+    """
+    (field, converter) for each stored column the class takes in __init__, built once per class.
+    """
+    plan = _PLANS.get(model_cls)
+    if plan is None:
+        init_fields = {f.name for f in fields(model_cls) if f.init}
+        plan = (
+            [(name, float) for name in FLOAT_FIELDS if name in init_fields]
+            + [(name, int) for name in INT_FIELDS if name in init_fields]
+            + [(name, date.fromordinal) for name in DATE_FIELDS if name in init_fields]
+        )
+        _PLANS[model_cls] = plan
+    return plan
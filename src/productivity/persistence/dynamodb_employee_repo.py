@@ -1,29 +1,191 @@
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import Optional, Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any, Dict, Iterator, List, Sequence, Tuple
 import os
+import random
+import time
 from uuid import uuid4
 
 import boto3
+from boto3.dynamodb.conditions import Attr, Key
 
 from productivity.domain.employee_base import AbstractEmployee
 from productivity.factories.employee_factory import EmployeeFactory
+from productivity.observability.metrics import stage
+from productivity.persistence.employee_repo import (
+    EmployeePage,
+    EmployeeQuery,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from productivity.serializers.employee_serializer import EmployeeSerializer
+
+# DynamoDB hard limits per request
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+
+# GSIs for EmployeeRepository.query: (partition attribute, index name), all sorted
+# by employment_date (ISO string) and projecting the whole item. Listed most
+# selective first; a query uses the first one it has an equality filter for.
+QUERY_INDEXES = (
+    ("education_level", "education_level-employment_date-index"),
+    ("employment_level", "employment_level-employment_date-index"),
+    ("type", "type-employment_date-index"),
+)
+_INDEX_BY_ATTR = dict(QUERY_INDEXES)
+
+_GET_ITEM = stage("dynamodb_get_item")
+_BATCH_GET = stage("dynamodb_batch_get")
+_REHYDRATE = stage("rehydrate")
+
+_TYPE_BY_CLASS = {
+    "HourlyEmployee": "hourly",
+    "BenefitsEligibleEmployee": "benefits_eligible",
+    "Manager": "manager",
+    "IndividualContributor": "individual_contributor",
+}
+
+
+def item_to_employee(item: Dict[str, Any]) -> AbstractEmployee:
+    payload = dict(item["payload"])
+    payload["id"] = item["employee_id"]
+    payload["type"] = item["type"]
+
+    return EmployeeFactory.from_payload(payload)
 
-class DynamoDBEmployeeRepository:
 
-    _TYPE_BY_CLASS = {
-        "HourlyEmployee": "hourly",
-        "BenefitsEligibleEmployee": "benefits_eligible",
-        "Manager": "manager",
-        "IndividualContributor": "individual_contributor",
+def employee_to_item(employee: AbstractEmployee) -> Dict[str, Any]:
+    """
+    Store:
+      employee_id (PK)
+      type (class/type string)
+      employment_level, education_level, employment_date: top-level copies
+        that key the query GSIs
+      payload (Map): JSON-safe fields to rebuild the domain object
+    """
 
+    payload = EmployeeSerializer.to_item_payload(employee)
+
+    emp_type = _TYPE_BY_CLASS.get(employee.__class__.__name__)
+    if not emp_type:
+        raise ValueError(f"Unsupported employee class: {employee.__class__.__name__}")
+
+    return {
+        "employee_id": employee.id,
+        "type": emp_type,
+        "employment_level": employee.employment_level.value,
+        "education_level": employee.education_level.value,
+        "employment_date": employee.employment_date.isoformat(),
+        "payload": payload,
     }
-    def __init__(self, table_name: str | None = None, region_name: str | None = None):
+
+
+class QueryPlan:
+    """
+    An EmployeeQuery as a sequence of GSI Query requests (see DynamoDBEmployeeRepository.query);
+    shared by the sync and async repositories so their cursors are interchangeable.
+    Call request() / advance() until done, then next_cursor().
+    """
+
+    def __init__(self, query: EmployeeQuery):
+        equality = {
+            "type": query.type,
+            "employment_level": query.employment_level.value if query.employment_level else None,
+            "education_level": query.education_level.value if query.education_level else None,
+        }
+        self.partition_attr = next((attr for attr, _ in QUERY_INDEXES if equality[attr] is not None), "type")
+        self.partitions = (
+            [equality[self.partition_attr]] if equality[self.partition_attr] is not None else list(EmployeeFactory.TYPE_MAP)
+        )
+
+        self.key_condition = None
+        if query.employed_from and query.employed_to:
+            self.key_condition = Key("employment_date").between(query.employed_from.isoformat(), query.employed_to.isoformat())
+        elif query.employed_from:
+            self.key_condition = Key("employment_date").gte(query.employed_from.isoformat())
+        elif query.employed_to:
+            self.key_condition = Key("employment_date").lte(query.employed_to.isoformat())
+
+        self.filter_expression = None
+        for attr, value in equality.items():
+            if value is not None and attr != self.partition_attr:
+                condition = Attr(attr).eq(value)
+                self.filter_expression = condition if self.filter_expression is None else self.filter_expression & condition
+
+        self.position, self.start_key = (
+            _decode_query_cursor(query.cursor, self.partition_attr, self.partitions) if query.cursor else (0, None)
+        )
+
+    @property
+    def done(self) -> bool:
+        return self.position >= len(self.partitions)
+
+    def request(self, limit: int) -> Dict[str, Any]:
+        """
+        Table.query kwargs (boto3 condition objects, plain Python values) for the next call.
+        """
+        condition = Key(self.partition_attr).eq(self.partitions[self.position])
+        kwargs: Dict[str, Any] = {
+            "IndexName": _INDEX_BY_ATTR[self.partition_attr],
+            "KeyConditionExpression": condition & self.key_condition if self.key_condition is not None else condition,
+            "Limit": limit,
+        }
+        if self.filter_expression is not None:
+            kwargs["FilterExpression"] = self.filter_expression
+        if self.start_key is not None:
+            kwargs["ExclusiveStartKey"] = self.start_key
+        return kwargs
+
+    def advance(self, last_evaluated_key: Optional[Dict[str, Any]]) -> None:
+        self.start_key = last_evaluated_key
+        if last_evaluated_key is None:
+            self.position += 1
+
+    def next_cursor(self) -> Optional[str]:
+        return encode_cursor({"p": self.position, "k": self.start_key}) if not self.done else None
+
+
+class DynamoDBEmployeeRepository:
+    """
+    EmployeeRepository on a DynamoDB table keyed by employee_id.
+
+    Known limitation: the query GSIs (QUERY_INDEXES) are partitioned on
+    low-cardinality attributes -- four types, five employment levels, four
+    education levels -- so every write lands in one of a handful of index
+    partitions, and a single partition can absorb at most ~1,000 WCU / 3,000 RCU.
+    Under sustained bulk writes a hot GSI partition throttles, and GSI write
+    throttling back-pressures the base table's writes too (surfacing here as
+    UnprocessedItems retries, then RuntimeError). Before ingest rates reach that
+    ceiling the partition keys should be write-sharded (e.g. "manager#<0..N>",
+    with QueryPlan querying every shard and merging by employment_date).
+    """
+
+    # retries for UnprocessedKeys / UnprocessedItems (throttling), exponential backoff with jitter
+    MAX_BATCH_ATTEMPTS = 8
+    BACKOFF_BASE_SECONDS = 0.05
+
+    def __init__(
+        self,
+        table_name: str | None = None,
+        region_name: str | None = None,
+        endpoint_url: str | None = None,
+        max_workers: int = 8,
+    ):
 
         self._table_name = table_name or os.environ["EMPLOYEES_TABLE_NAME"]
-        dynamodb = boto3.resource("dynamodb", region_name=region_name)
+        # endpoint_url points at a local stand-in (DynamoDB Local, moto server)
+        dynamodb = boto3.resource(
+            "dynamodb",
+            region_name=region_name,
+            endpoint_url=endpoint_url or os.getenv("DYNAMODB_ENDPOINT_URL"),
+        )
         self._table = dynamodb.Table(self._table_name)
+        # the resource's client is thread-safe and already (de)serializes plain Python types,
+        # so batch chunks can be dispatched concurrently through it
+        self._client = dynamodb.meta.client
+        self._max_workers = max_workers
 
     def save(self, employee: AbstractEmployee) -> AbstractEmployee:
         #ensure server-generated id exists, if not, generate one
@@ -35,64 +197,175 @@ class DynamoDBEmployeeRepository:
         return employee
     
     def get(self, employee_id: str) -> Optional[AbstractEmployee]:
-        resp = self._table.get_item(Key={"employee_id": employee_id})
+        with _GET_ITEM.time():
+            resp = self._table.get_item(Key={"employee_id": employee_id})
         item = resp.get("Item")
         if not item:
             return None
 
-        payload = dict(item["payload"])
-        payload["id"] = employee_id
-        payload["type"] = item["type"]
+        with _REHYDRATE.time():
+            return self._item_to_employee(item)
 
-        return EmployeeFactory.from_payload(payload)
-    
-    def _employee_to_item(self, employee: AbstractEmployee) -> Dict[str, Any]:
+    def save_many(self, employees: Sequence[AbstractEmployee]) -> List[AbstractEmployee]:
         """
-        Store:
-          employee_id (PK)
-          type (class/type string)
-          payload (Map): JSON-safe fields to rebuild the domain object
+        batch_write_item in 25-item chunks, dispatched concurrently.
         """
-        
-        payload = self._to_payload(employee)
-        payload.pop("id", None)  
+        items: Dict[str, Dict[str, Any]] = {}
+        for employee in employees:
+            if not employee.id:
+                employee.id = str(uuid4())
+            # a batch may not contain the same key twice; last write wins
+            items[employee.id] = self._employee_to_item(employee)
 
-        payload = self._to_decimal(payload)
+        self._dispatch(self._write_chunk, _chunks(list(items.values()), BATCH_WRITE_LIMIT))
+        return list(employees)
 
-        emp_type = self._TYPE_BY_CLASS.get(employee.__class__.__name__)
-        if not emp_type:
-            raise ValueError(f"Unsupported employee class: {employee.__class__.__name__}")
+    def get_many(self, employee_ids: Sequence[str]) -> Dict[str, AbstractEmployee]:
+        """
+        batch_get_item in 100-key chunks, dispatched concurrently.
+        """
+        unique_ids = list(dict.fromkeys(employee_ids))
+        found: Dict[str, AbstractEmployee] = {}
+        with _BATCH_GET.time():
+            chunks = self._dispatch(self._get_chunk, _chunks(unique_ids, BATCH_GET_LIMIT))
+        with _REHYDRATE.time():
+            for items in chunks:
+                for item in items:
+                    found[item["employee_id"]] = self._item_to_employee(item)
+        return found
 
-        return {
-            "employee_id": employee.id,
-            "type": emp_type,
-            "payload": payload, 
-        }
-    
-    def _to_payload(self, employee: AbstractEmployee) -> Dict[str, Any]:
-        # simple, local conversion; mirrors your service’s approach
-        from dataclasses import asdict
-        from datetime import date
-        from enum import Enum
-
-        def json_safe(obj: Any) -> Any:
-            if isinstance(obj, date):
-                return obj.isoformat()
-            if isinstance(obj, Enum):
-                return obj.value
-            if isinstance(obj, dict):
-                return {k: json_safe(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [json_safe(v) for v in obj]
-            return obj
-
-        return json_safe(asdict(employee))
-    
-    def _to_decimal(self, value):
-        if isinstance(value, float):
-            return Decimal(str(value))  # str avoids float precision bugs
-        if isinstance(value, dict):
-            return {k: self._to_decimal(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [self._to_decimal(v) for v in value]
-        return value
+    def query(self, query: EmployeeQuery) -> EmployeePage:
+        """
+        GSI Query, never a Scan. The most selective equality filter picks the index
+        partition, the date range becomes the sort-key condition and any other
+        filters a FilterExpression. With no equality filter the type index is
+        walked one type partition at a time. Ordered by partition, then
+        employment_date.
+
+        The cursor is (partition position, LastEvaluatedKey). Each call asks for at
+        most the items still needed, so a FilterExpression can cost several round
+        trips per page, and the last page may come back empty.
+        """
+        plan = QueryPlan(query)
+        items: List[Dict[str, Any]] = []
+        while len(items) < query.limit and not plan.done:
+            resp = self._table.query(**plan.request(query.limit - len(items)))
+            items.extend(resp.get("Items", []))
+            plan.advance(resp.get("LastEvaluatedKey"))
+
+        return EmployeePage(items=[self._item_to_employee(item) for item in items], next_cursor=plan.next_cursor())
+
+    # -------------------------
+    # Batch helpers
+    # -------------------------
+
+    def _dispatch(self, fn, chunks: List[List[Any]]) -> List[Any]:
+        if len(chunks) <= 1 or self._max_workers <= 1:
+            return [fn(chunk) for chunk in chunks]
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(chunks))) as pool:
+            return list(pool.map(fn, chunks))
+
+    def _get_chunk(self, employee_ids: List[str]) -> List[Dict[str, Any]]:
+        items: List[Dict[str, Any]] = []
+        request = {self._table_name: {"Keys": [{"employee_id": eid} for eid in employee_ids]}}
+
+        for _ in self._attempts():
+            resp = self._client.batch_get_item(RequestItems=request)
+            items.extend(resp.get("Responses", {}).get(self._table_name, []))
+            request = resp.get("UnprocessedKeys") or {}
+            if not request:
+                return items
+
+        raise RuntimeError(f"batch_get_item left {len(request[self._table_name]['Keys'])} keys unprocessed")
+
+    def _write_chunk(self, items: List[Dict[str, Any]]) -> None:
+        request = {self._table_name: [{"PutRequest": {"Item": item}} for item in items]}
+
+        for _ in self._attempts():
+            resp = self._client.batch_write_item(RequestItems=request)
+            request = resp.get("UnprocessedItems") or {}
+            if not request:
+                return
+
+        raise RuntimeError(f"batch_write_item left {len(request[self._table_name])} items unprocessed")
+
+    def _attempts(self) -> Iterator[int]:
+        for attempt in range(self.MAX_BATCH_ATTEMPTS):
+            if attempt:
+                time.sleep(backoff_seconds(self.BACKOFF_BASE_SECONDS, attempt))
+            yield attempt
+
+    # -------------------------
+    # Item mapping
+    # -------------------------
+
+    _item_to_employee = staticmethod(item_to_employee)
+    _employee_to_item = staticmethod(employee_to_item)
+
+
+def _chunks(values: List[Any], size: int) -> List[List[Any]]:
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+def backoff_seconds(base: float, attempt: int) -> float:
+    """
+    Exponential backoff with jitter before retry number `attempt` (1-based).
+    """
+    return base * (2 ** (attempt - 1)) * (0.5 + random.random())
+
+
+def _decode_query_cursor(
+    cursor: str, partition_attr: str, partitions: List[str]
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    position = decode_cursor(cursor)
+    if (
+        not isinstance(position, dict)
+        or type(position.get("p")) is not int
+        or not 0 <= position["p"] < len(partitions)
+        or not isinstance(position.get("k"), (dict, type(None)))
+    ):
+        raise InvalidCursorError("Invalid cursor")
+    start_key = position["k"]
+    # a GSI LastEvaluatedKey holds the table key plus the index keys, all strings here;
+    # anything else would reach DynamoDB as a ValidationException (a 500, not a 400)
+    if start_key is not None and (
+        set(start_key) != {"employee_id", partition_attr, "employment_date"}
+        or not all(isinstance(value, str) for value in start_key.values())
+        or start_key[partition_attr] != partitions[position["p"]]
+    ):
+        raise InvalidCursorError("Invalid cursor")
+    return position["p"], start_key
+
+
+def create_table(table_name: str, region_name: str | None = None, endpoint_url: str | None = None):
+    """
+    Create the employees table (on-demand billing). Meant for local stand-ins and load tests;
+    production tables are provisioned by infrastructure.
+    """
+    dynamodb = boto3.resource(
+        "dynamodb",
+        region_name=region_name,
+        endpoint_url=endpoint_url or os.getenv("DYNAMODB_ENDPOINT_URL"),
+    )
+    table = dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[{"AttributeName": "employee_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[
+            {"AttributeName": name, "AttributeType": "S"}
+            for name in ["employee_id", "employment_date"] + [attr for attr, _ in QUERY_INDEXES]
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": index_name,
+                "KeySchema": [
+                    {"AttributeName": attr, "KeyType": "HASH"},
+                    {"AttributeName": "employment_date", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            }
+            for attr, index_name in QUERY_INDEXES
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    table.wait_until_exists()
+    return table
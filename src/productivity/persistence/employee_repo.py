@@ -1,8 +1,82 @@
 from __future__ import annotations
-from typing import Protocol, Optional
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Protocol, Optional, Sequence
 
 from productivity.domain.employee_base import AbstractEmployee
+from productivity.domain.enums import EducationLevel, EmploymentLevel
+
+DEFAULT_PAGE_SIZE = 50
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor wasn't issued by this repository."""
+
+
+@dataclass(frozen=True)
+class EmployeeQuery:
+    """
+    Filters for EmployeeRepository.query. None means "any"; the date range is inclusive.
+    `cursor` is the next_cursor of the previous page.
+    """
+
+    type: Optional[str] = None  # EmployeeFactory.TYPE_MAP key
+    employment_level: Optional[EmploymentLevel] = None
+    education_level: Optional[EducationLevel] = None
+    employed_from: Optional[date] = None
+    employed_to: Optional[date] = None
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
+
+
+@dataclass
+class EmployeePage:
+    items: List[AbstractEmployee] = field(default_factory=list)
+    next_cursor: Optional[str] = None  # None => no more pages
+
 
 class EmployeeRepository(Protocol):
     def save(self, employee: AbstractEmployee) -> AbstractEmployee: ...
-    def get(self, employee_id: str) -> Optional[AbstractEmployee]: ...
\ No newline at end of file
+    def get(self, employee_id: str) -> Optional[AbstractEmployee]: ...
+    def save_many(self, employees: Sequence[AbstractEmployee]) -> List[AbstractEmployee]: ...
+    def get_many(self, employee_ids: Sequence[str]) -> Dict[str, AbstractEmployee]:
+        """Found employees by id; unknown ids are simply absent."""
+        ...
+    def query(self, query: EmployeeQuery) -> EmployeePage:
+        """
+        One page of matching employees. Order is repository-defined but stable
+        across pages; cursors are opaque and only valid for the repository that issued them.
+        """
+        ...
+
+
+class AsyncEmployeeRepository(Protocol):
+    """
+    EmployeeRepository for the async (ASGI) app: same contract, awaited, so
+    repository I/O doesn't hold a worker thread.
+    """
+
+    async def save(self, employee: AbstractEmployee) -> AbstractEmployee: ...
+    async def get(self, employee_id: str) -> Optional[AbstractEmployee]: ...
+    async def save_many(self, employees: Sequence[AbstractEmployee]) -> List[AbstractEmployee]: ...
+    async def get_many(self, employee_ids: Sequence[str]) -> Dict[str, AbstractEmployee]: ...
+    async def query(self, query: EmployeeQuery) -> EmployeePage: ...
+
+
+def encode_cursor(position: Any) -> str:
+    """
+    JSON-able resume position -> opaque URL-safe cursor.
+    """
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Any:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
@@ -1,27 +1,222 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+import asyncio
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
 from uuid import uuid4
 
+from sortedcontainers import SortedList
+
 from productivity.domain.employee_base import AbstractEmployee
+from productivity.factories.employee_factory import EmployeeFactory
+from productivity.persistence.employee_repo import (
+    EmployeePage,
+    EmployeeQuery,
+    EmployeeRepository,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+# sort key of every index entry: (employment_date ordinal, employee id)
+IndexKey = Tuple[int, str]
+# an id's key plus its (type, employment_level, education_level) values
+IndexEntry = Tuple[IndexKey, Tuple[object, ...]]
+
+_TYPE_BY_CLASS = {model_cls: emp_type for emp_type, model_cls in EmployeeFactory.TYPE_MAP.items()}
+_INDEXED = ("type", "employment_level", "education_level")
 
 
 class InMemoryEmployeeRepository:
     """
     Dev/test repository.
     Stores domain objects in a dict in memory.
+
+    Secondary indexes (updated on save): for each of type / employment_level /
+    education_level, value -> SortedList of (employment_date ordinal, id),
+    plus one such list over everyone. Inserts and removals are O(log n), and
+    save_many adds a whole batch to each list in one update. A query walks the
+    shortest list in its date range and checks the remaining filters per
+    entry; pages resume from the last (ordinal, id) returned.
     """
 
     def __init__(self) -> None:
         self._store: Dict[str, AbstractEmployee] = {}
 
+        self._by_date: SortedList = SortedList()
+        self._indexes: Dict[str, Dict[object, SortedList]] = {attr: {} for attr in _INDEXED}
+        # what each id is currently indexed under, so a re-save can remove the old entries
+        self._indexed_as: Dict[str, IndexEntry] = {}
+        self._lock = threading.Lock()
+
     def save(self, employee: AbstractEmployee) -> AbstractEmployee:
         # Server-generated id
         if not employee.id:
             employee.id = str(uuid4())
 
-        self._store[employee.id] = employee
+        entry = _index_entry(employee)
+        with self._lock:
+            self._store[employee.id] = employee
+            if self._reindexing(employee.id, entry):
+                key, values = entry
+                self._by_date.add(key)
+                for attr, value in zip(_INDEXED, values):
+                    self._value_list(attr, value).add(key)
         return employee
 
     def get(self, employee_id: str) -> Optional[AbstractEmployee]:
         return self._store.get(employee_id)
+
+    def save_many(self, employees: Sequence[AbstractEmployee]) -> List[AbstractEmployee]:
+        for employee in employees:
+            if not employee.id:
+                employee.id = str(uuid4())
+
+        with self._lock:
+            # last write wins for an id repeated within the batch
+            latest = {employee.id: employee for employee in employees}
+            new_keys: List[IndexKey] = []
+            by_value: Dict[Tuple[str, object], List[IndexKey]] = {}
+            for employee_id, employee in latest.items():
+                self._store[employee_id] = employee
+                entry = _index_entry(employee)
+                if not self._reindexing(employee_id, entry):
+                    continue
+                key, values = entry
+                new_keys.append(key)
+                for attr, value in zip(_INDEXED, values):
+                    by_value.setdefault((attr, value), []).append(key)
+
+            # one bulk update per list (SortedList re-sorts once when the batch is large)
+            self._by_date.update(new_keys)
+            for (attr, value), keys in by_value.items():
+                self._value_list(attr, value).update(keys)
+        return list(employees)
+
+    def get_many(self, employee_ids: Sequence[str]) -> Dict[str, AbstractEmployee]:
+        store = self._store
+        return {eid: store[eid] for eid in employee_ids if eid in store}
+
+    def query(self, query: EmployeeQuery) -> EmployeePage:
+        """
+        Ordered by (employment_date, id).
+        """
+        # (position in _INDEXED, required value) for each equality filter given
+        filters = [(k, value) for k, value in enumerate(_query_values(query)) if value is not None]
+        lo = query.employed_from.toordinal() if query.employed_from else None
+        hi = query.employed_to.toordinal() if query.employed_to else None
+        after = _decode_key(query.cursor) if query.cursor else None
+
+        with self._lock:
+            # drive from the shortest candidate list within the date range
+            lists = [self._by_date] + [self._indexes[_INDEXED[k]].get(value, SortedList()) for k, value in filters]
+            spans = [_span(keys, lo, hi, after) for keys in lists]
+            driver, (start, stop) = min(zip(lists, spans), key=lambda pair: pair[1][1] - pair[1][0])
+
+            matched: List[IndexKey] = []
+            for key in driver.islice(start, stop):
+                values = self._indexed_as[key[1]][1]
+                if all(values[k] == value for k, value in filters):
+                    matched.append(key)
+                    if len(matched) > query.limit:
+                        break
+
+            page = matched[: query.limit]
+            items = [self._store[employee_id] for _, employee_id in page]
+
+        next_cursor = encode_cursor(list(page[-1])) if len(matched) > query.limit else None
+        return EmployeePage(items=items, next_cursor=next_cursor)
+
+    # -------------------------
+    # Index maintenance (caller holds the lock)
+    # -------------------------
+
+    def _reindexing(self, employee_id: str, entry: IndexEntry) -> bool:
+        """
+        Records `entry` for the id and drops its old list entries. False when the
+        id is already indexed exactly so (an upsert that kept its date, type and
+        levels): there is nothing to add.
+        """
+        old = self._indexed_as.get(employee_id)
+        if old == entry:
+            return False
+        if old is not None:
+            old_key, old_values = old
+            self._by_date.discard(old_key)
+            for attr, value in zip(_INDEXED, old_values):
+                self._indexes[attr][value].discard(old_key)
+        self._indexed_as[employee_id] = entry
+        return True
+
+    def _value_list(self, attr: str, value: object) -> SortedList:
+        keys = self._indexes[attr].get(value)
+        if keys is None:
+            keys = self._indexes[attr][value] = SortedList()
+        return keys
+
+
+class AsyncInMemoryEmployeeRepository:
+    """
+    AsyncEmployeeRepository over an in-process repository (default: a new
+    InMemoryEmployeeRepository; the columnar one works too).
+
+    get, get_many and save touch a bounded number of entries (dict lookups,
+    O(log n) index updates), so they run inline on the event loop; a thread
+    hop would cost more than the call. save_many and query grow with the batch
+    or the scan, so they run on the loop's default executor.
+    """
+
+    def __init__(self, repo: Optional[EmployeeRepository] = None) -> None:
+        self.sync = repo if repo is not None else InMemoryEmployeeRepository()
+
+    async def save(self, employee: AbstractEmployee) -> AbstractEmployee:
+        return self.sync.save(employee)
+
+    async def get(self, employee_id: str) -> Optional[AbstractEmployee]:
+        return self.sync.get(employee_id)
+
+    async def save_many(self, employees: Sequence[AbstractEmployee]) -> List[AbstractEmployee]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.sync.save_many, employees)
+
+    async def get_many(self, employee_ids: Sequence[str]) -> Dict[str, AbstractEmployee]:
+        return self.sync.get_many(employee_ids)
+
+    async def query(self, query: EmployeeQuery) -> EmployeePage:
+        return await asyncio.get_running_loop().run_in_executor(None, self.sync.query, query)
+
+
+def _index_entry(employee: AbstractEmployee) -> IndexEntry:
+    key = (employee.employment_date.toordinal(), employee.id)
+    values = (
+        _TYPE_BY_CLASS.get(employee.__class__, employee.__class__.__name__.lower()),
+        employee.employment_level,
+        employee.education_level,
+    )
+    return key, values
+
+
+def _query_values(query: EmployeeQuery) -> Tuple[object, ...]:
+    return query.type, query.employment_level, query.education_level
+
+
+def _span(keys: SortedList, lo: Optional[int], hi: Optional[int], after: Optional[IndexKey]) -> Tuple[int, int]:
+    """
+    [start, stop) of the entries with lo <= ordinal <= hi that sort after the cursor key.
+    """
+    start = keys.bisect_left((lo,)) if lo is not None else 0
+    if after is not None:
+        start = max(start, keys.bisect_right(after))
+    stop = keys.bisect_left((hi + 1,)) if hi is not None else len(keys)
+    return start, max(start, stop)
+
+
+def _decode_key(cursor: str) -> IndexKey:
+    position = decode_cursor(cursor)
+    if (
+        not isinstance(position, list)
+        or len(position) != 2
+        or type(position[0]) is not int
+        or not isinstance(position[1], str)
+    ):
+        raise InvalidCursorError("Invalid cursor")
+    return position[0], position[1]
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+MAX_LEADERBOARD_SIZE = 1000
+
+
+class LeaderboardQuery(BaseModel):
+    type: Optional[Literal["hourly", "benefits_eligible", "manager", "individual_contributor"]] = None
+    k: int = Field(default=50, ge=1, le=MAX_LEADERBOARD_SIZE)
+    order: Literal["top", "bottom"] = "top"
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_SIZE = 10_000
+
+
+class EmployeeIdsRequest(BaseModel):
+    employee_ids: List[str] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Literal, Union
+from typing import Annotated, Literal, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # import your enums
 from productivity.domain.enums import EducationLevel, EmploymentLevel
@@ -64,9 +64,13 @@ class IndividualContributorCreate(BaseEmployeeCreate):
     num_external_collaborations: int
 
 
-CreateEmployeeRequest = Union[
-    HourlyEmployeeCreate,
-    BenefitsEligibleEmployeeCreate,
-    ManagerCreate,
-    IndividualContributorCreate,
+# discriminated on `type`: pydantic dispatches straight to one member instead of trying each in turn
+CreateEmployeeRequest = Annotated[
+    Union[
+        HourlyEmployeeCreate,
+        BenefitsEligibleEmployeeCreate,
+        ManagerCreate,
+        IndividualContributorCreate,
+    ],
+    Field(discriminator="type"),
 ]
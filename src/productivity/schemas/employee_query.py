@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+from productivity.domain.enums import EducationLevel, EmploymentLevel
+from productivity.persistence.employee_repo import DEFAULT_PAGE_SIZE
+
+MAX_PAGE_SIZE = 500
+
+
+class EmployeeListQuery(BaseModel):
+    """
+    Query-string filters for GET /employees.
+    """
+
+    type: Optional[Literal["hourly", "benefits_eligible", "manager", "individual_contributor"]] = None
+    employment_level: Optional[EmploymentLevel] = None
+    education_level: Optional[EducationLevel] = None
+    employed_from: Optional[date] = None  # inclusive
+    employed_to: Optional[date] = None  # inclusive
+    limit: int = Field(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    cursor: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _check_date_range(self) -> "EmployeeListQuery":
+        if self.employed_from and self.employed_to and self.employed_from > self.employed_to:
+            raise ValueError("employed_from must not be after employed_to")
+        return self
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class LoadModelRequest(BaseModel):
+    version: str = Field(min_length=1)
+    path: str = Field(min_length=1)  # relative to MODEL_DIR
+    activate: bool = False
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, List, Tuple, Type, get_type_hints
+
+from productivity.domain.employee_base import AbstractEmployee
+
+Encoder = Callable[[Any], Dict[str, Any]]
+
+
+def _to_decimal(value: Any) -> Any:
+    # str avoids float precision bugs; ints and everything else pass through
+    return Decimal(str(value)) if isinstance(value, float) else value
+
+
+class EmployeeSerializer:
+    """
+    Per-class compiled encoders for domain employees.
+
+    The first time a concrete class is seen, its dataclass fields are walked
+    once and a flat encoder function is generated for it (nested Name /
+    ContactInfo unrolled, date -> isoformat(), Enum -> .value). Output is
+    identical to asdict() + the recursive JSON-safe walk, without the deep copy
+    or per-value isinstance checks.
+
+    Variants:
+      to_dict          - JSON-safe dict (API responses)
+      to_item_payload  - DynamoDB payload map: no id, floats as Decimal
+    """
+
+    _ENCODERS: Dict[Tuple[type, str], Encoder] = {}
+
+    @classmethod
+    def to_dict(cls, employee: AbstractEmployee) -> Dict[str, Any]:
+        return cls._encoder(employee.__class__, "json")(employee)
+
+    @classmethod
+    def to_item_payload(cls, employee: AbstractEmployee) -> Dict[str, Any]:
+        return cls._encoder(employee.__class__, "dynamodb")(employee)
+
+    @classmethod
+    def _encoder(cls, model_cls: Type[AbstractEmployee], variant: str) -> Encoder:
+        encoder = cls._ENCODERS.get((model_cls, variant))
+        if encoder is None:
+            if not is_dataclass(model_cls):
+                raise TypeError("Employee must be a dataclass to serialize cleanly")
+            encoder = cls._ENCODERS[(model_cls, variant)] = _compile(model_cls, variant)
+        return encoder
+
+
+def _compile(model_cls: type, variant: str) -> Encoder:
+    """
+    Generate `def encode(obj): return {...}` for model_cls.
+    """
+    decimal = variant == "dynamodb"
+    skip = {"id"} if variant == "dynamodb" else set()
+    prelude: List[str] = []
+    counter = iter(range(1_000_000))
+
+    def dict_expr(var: str, cls: type, exclude: set) -> str:
+        hints = get_type_hints(cls)
+        items = []
+        for f in fields(cls):
+            if f.name in exclude:
+                continue
+            items.append(f"{f.name!r}: {value_expr(f'{var}.{f.name}', hints[f.name])}")
+        return "{" + ", ".join(items) + "}"
+
+    def value_expr(expr: str, tp: Any) -> str:
+        if isinstance(tp, type):
+            if is_dataclass(tp):
+                local = f"_v{next(counter)}"
+                prelude.append(f"{local} = {expr}")
+                return dict_expr(local, tp, set())
+            if issubclass(tp, Enum):
+                return f"{expr}.value"
+            if issubclass(tp, date):
+                return f"{expr}.isoformat()"
+            if decimal and issubclass(tp, (int, float)) and not issubclass(tp, bool):
+                return f"_to_decimal({expr})"
+        return expr
+
+    body = dict_expr("obj", model_cls, skip)
+    lines = ["def encode(obj):", *(f"    {line}" for line in prelude), f"    return {body}"]
+    namespace: Dict[str, Any] = {"_to_decimal": _to_decimal}
+    exec("\n".join(lines), namespace)
+
+    encoder = namespace["encode"]
+    encoder.__qualname__ = f"encode_{model_cls.__name__}_{variant}"
+    return encoder
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ml.registry import ModelRegistry
+from productivity.analytics.productivity_aggregates import ProductivityAggregates
+from productivity.analytics.productivity_ranking import ProductivityRanking
+from productivity.domain.employee_base import AbstractEmployee
+from productivity.factories.employee_factory import EmployeeFactory
+from productivity.observability.metrics import stage
+from productivity.persistence.employee_repo import AsyncEmployeeRepository, EmployeeQuery
+from productivity.schemas.employee_create import BaseEmployeeCreate
+from productivity.services.employee_service import RECOMPUTE_PAGE_SIZE, BaseEmployeeService, split_found
+from productivity.services.prediction_cache import PredictionCache
+
+# threads running model inference off the event loop
+DEFAULT_INFERENCE_WORKERS = 4
+
+_REPO_GET = stage("repo_get")
+_REPO_GET_MANY = stage("repo_get_many")
+_INFERENCE_QUEUE = stage("inference_queue")
+
+
+class AsyncEmployeeService(BaseEmployeeService):
+    """
+    EmployeeService for the ASGI app: the same use cases and response shapes,
+    with repository calls awaited.
+
+    Inference (feature encoding + model.predict) is CPU-bound and would stall
+    every request on the loop, so it runs on `inference_executor` (by default
+    a private pool of `inference_workers` threads; numpy and the tree models
+    release the GIL for most of a predict call).
+
+    Derived-state work that grows with the batch or the population - folding
+    a bulk insert into the aggregates and ranking, and scoring/building a full
+    rebuild - runs on the loop's default executor. Only the one-row
+    _after_save of a single create (O(log n) index updates) stays inline.
+    """
+
+    def __init__(
+        self,
+        repo: AsyncEmployeeRepository,
+        models: Optional[ModelRegistry] = None,
+        prediction_cache: Optional[PredictionCache] = None,
+        aggregates: Optional[ProductivityAggregates] = None,
+        ranking: Optional[ProductivityRanking] = None,
+        inference_executor: Optional[Executor] = None,
+        inference_workers: int = DEFAULT_INFERENCE_WORKERS,
+    ):
+        super().__init__(models=models, prediction_cache=prediction_cache, aggregates=aggregates, ranking=ranking)
+        self._repo = repo
+        self._owns_executor = inference_executor is None
+        self._executor = inference_executor or ThreadPoolExecutor(
+            max_workers=inference_workers, thread_name_prefix="inference"
+        )
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    # -------------------------
+    # Use cases
+    # -------------------------
+
+    async def create_employee(self, payload: Mapping[str, Any]) -> Dict[str, Any]:
+        employee: AbstractEmployee = EmployeeFactory.from_payload(payload)
+
+        saved = await self._repo.save(employee)
+        self._after_save([saved])
+
+        return self._to_dict(saved)
+
+    async def create_employee_from_request(self, req: BaseEmployeeCreate) -> Dict[str, Any]:
+        employee: AbstractEmployee = EmployeeFactory.from_request(req)
+
+        saved = await self._repo.save(employee)
+        self._after_save([saved])
+
+        return self._to_dict(saved)
+
+    async def create_employees(self, requests: Sequence[BaseEmployeeCreate]) -> int:
+        employees = [EmployeeFactory.from_request(req) for req in requests]
+
+        saved = await self._repo.save_many(employees)
+        await _offload(self._after_save, saved)
+
+        return len(saved)
+
+    async def get_employee(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        emp = await self._get(employee_id)
+        if emp is None:
+            return None
+        return self._to_dict(emp)
+
+    async def list_employees(self, query: EmployeeQuery) -> Dict[str, Any]:
+        page = await self._repo.query(query)
+        return {
+            "items": [self._to_dict(emp) for emp in page.items],
+            "next_cursor": page.next_cursor,
+        }
+
+    async def get_productivity(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        emp = await self._get(employee_id)
+        if emp is None:
+            return None
+        return self._productivity_result(emp)
+
+    async def get_productivity_batch(self, employee_ids: Sequence[str]) -> Dict[str, Any]:
+        found, missing = await self._get_many(employee_ids)
+        return self._productivity_batch_result(found, missing)
+
+    async def predict_productivity(self, employee_id: str, model_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        employee = await self._get(employee_id)
+        if employee is None:
+            return None
+
+        prediction = (await self._predict_offloaded([employee], model_version))[0]
+        return self._prediction_result(employee, prediction)
+
+    async def predict_productivity_batch(
+        self, employee_ids: Sequence[str], model_version: Optional[str] = None
+    ) -> Dict[str, Any]:
+        found, missing = await self._get_many(employee_ids)
+
+        predictions = await self._predict_offloaded(found, model_version)
+        return self._prediction_batch_result(found, missing, predictions)
+
+    async def recompute_productivity_aggregates(self, as_of: Optional[date] = None) -> Dict[str, Any]:
+        """
+        See EmployeeService.recompute_productivity_aggregates. Pages are awaited
+        on the loop; scoring them and building the new state run on the default
+        executor, so in-flight requests keep being served during a rebuild.
+        """
+        rebuild = self._begin_rebuild(as_of or date.today())
+        try:
+            query = EmployeeQuery(limit=RECOMPUTE_PAGE_SIZE)
+            while True:
+                page = await self._repo.query(query)
+                await _offload(rebuild.add, page.items)
+                if page.next_cursor is None:
+                    break
+                query = EmployeeQuery(limit=RECOMPUTE_PAGE_SIZE, cursor=page.next_cursor)
+        except Exception:
+            rebuild.abort()
+            raise
+
+        return await _offload(rebuild.finish)
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    async def _get(self, employee_id: str) -> Optional[AbstractEmployee]:
+        with _REPO_GET.time():
+            return await self._repo.get(employee_id)
+
+    async def _get_many(self, employee_ids: Sequence[str]) -> Tuple[List[AbstractEmployee], List[str]]:
+        with _REPO_GET_MANY.time():
+            by_id = await self._repo.get_many(employee_ids)
+        return split_found(by_id, employee_ids)
+
+    async def _predict_offloaded(
+        self, employees: Sequence[AbstractEmployee], model_version: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        BaseEmployeeService._predict on the inference executor. inference_queue
+        times the wait for a free inference thread.
+        """
+        submitted = time.perf_counter()
+
+        def run() -> np.ndarray:
+            _INFERENCE_QUEUE.observe(time.perf_counter() - submitted)
+            return self._predict(employees, model_version)
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, run)
+
+
+async def _offload(fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    fn(*args) on the running loop's default executor.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, time, timedelta
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+def seconds_until(at: time, now: datetime) -> float:
+    """
+    Seconds from `now` to the next local wall-clock `at` (tomorrow if it has passed today).
+    """
+    target = datetime.combine(now.date(), at)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+def start_daily_job(
+    job: Callable[[], Any],
+    name: str,
+    at: time = time(0, 0, 5),
+    run_now: bool = True,
+    stop: threading.Event | None = None,
+) -> threading.Thread:
+    """
+    Run `job` on a daemon thread every day at `at` (local time), and once at
+    start if `run_now`. A failing run is logged and retried the next day.
+    Set `stop` to end the loop.
+    """
+    stop = stop or threading.Event()
+
+    def run_once() -> None:
+        try:
+            job()
+        except Exception:
+            logger.exception("Daily job %s failed", name)
+
+    def loop() -> None:
+        if run_now:
+            run_once()
+        while not stop.wait(seconds_until(at, datetime.now())):
+            run_once()
+
+    thread = threading.Thread(target=loop, name=f"daily-{name}", daemon=True)
+    thread.start()
+    return thread
@@ -1,43 +1,83 @@
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
+import time
 from datetime import date
-from enum import Enum
-from typing import Any, Mapping, Optional, Dict
+from typing import Any, Mapping, Optional, Dict, List, Sequence, Tuple
 
-import pandas as pd
+import numpy as np
 
-from ml.features import employee_to_features
-from ml.model import load_model
-from ml.schema import FEATURE_COLUMNS
+from ml.registry import ModelRegistry
+from productivity.analytics.productivity_aggregates import ProductivityAggregates
+from productivity.analytics.productivity_engine import EmployeeColumns, estimate_productivity_batch
+from productivity.analytics.productivity_ranking import ProductivityRanking
 from productivity.factories.employee_factory import EmployeeFactory
+from productivity.observability.metrics import stage
 from productivity.domain.employee_base import AbstractEmployee
-from productivity.persistence.employee_repo import EmployeeRepository
+from productivity.persistence.employee_repo import EmployeeQuery, EmployeeRepository
+from productivity.schemas.employee_create import BaseEmployeeCreate
+from productivity.serializers.employee_serializer import EmployeeSerializer
+from productivity.services.prediction_batcher import PredictionBatcher
+from productivity.services.prediction_cache import PredictionCache
 
+# employees scored per repository page during an aggregates rebuild
+RECOMPUTE_PAGE_SIZE = 1000
 
-class EmployeeService:
-    def __init__(self, repo: EmployeeRepository):
-        self._repo = repo
+_REPO_GET = stage("repo_get")
+_REPO_GET_MANY = stage("repo_get_many")
+_PREDICTION_CACHE = stage("prediction_cache")
+
+
+class BaseEmployeeService:
+    """
+    Everything EmployeeService and AsyncEmployeeService share: derived score
+    state, the prediction path and the response shapes. Subclasses own the
+    repository and the use cases that touch it.
+    """
+
+    def __init__(
+        self,
+        models: Optional[ModelRegistry] = None,
+        prediction_cache: Optional[PredictionCache] = None,
+        aggregates: Optional[ProductivityAggregates] = None,
+        ranking: Optional[ProductivityRanking] = None,
+        batcher: Optional[PredictionBatcher] = None,
+    ):
+        self._models = models if models is not None else ModelRegistry()
+        self._prediction_cache = prediction_cache if prediction_cache is not None else PredictionCache()
+        self._aggregates = aggregates if aggregates is not None else ProductivityAggregates()
+        self._ranking = ranking if ranking is not None else ProductivityRanking()
+        # derived score state fed on every save and rebuilt daily
+        self._score_indexes = (self._aggregates, self._ranking)
+        # optional: coalesce concurrent cache misses into shared model calls
+        self._batcher = batcher
 
     # -------------------------
-    # Use cases
+    # Dashboard aggregates / ranking
     # -------------------------
 
-    def create_employee(self, payload: Mapping[str, Any]) -> Dict[str, Any]:
+    def productivity_aggregates(self) -> Dict[str, Any]:
         """
-        JSON payload -> domain employee -> repo -> JSON response dict
+        Productivity count/mean/std/min/max per (type, employment level); O(groups).
         """
-        employee: AbstractEmployee = EmployeeFactory.from_payload(payload)
+        return self._aggregates.snapshot()
 
-        saved: AbstractEmployee = self._repo.save(employee)
+    def productivity_percentile(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Exact rank/percentile of one employee within their type and overall; O(log n).
+        """
+        return self._ranking.percentile(employee_id)
 
-        return self._to_dict(saved)
+    def productivity_leaderboard(self, k: int, employee_type: Optional[str] = None, bottom: bool = False) -> Dict[str, Any]:
+        """
+        Top (or bottom) K employees by productivity; O(K) for one type.
+        """
+        return self._ranking.top(k, employee_type=employee_type, bottom=bottom)
 
-    def get_employee(self, employee_id: str) -> Optional[Dict[str, Any]]:
-        emp = self._repo.get(employee_id)
-        if emp is None:
-            return None
-        return self._to_dict(emp)
+    def prediction_cache_stats(self) -> Dict[str, Any]:
+        return self._prediction_cache.stats()
+
+    def prediction_batcher_stats(self) -> Dict[str, Any]:
+        return {"enabled": False} if self._batcher is None else {"enabled": True, **self._batcher.stats()}
 
     # -------------------------
     # Serialization helpers
@@ -47,61 +87,313 @@ class EmployeeService:
         """
         Convert domain employee object to a JSON-safe dict for API responses.
         """
-        if not is_dataclass(employee):
-            raise TypeError("Employee must be a dataclass to serialize cleanly")
-
-        data = asdict(employee)
+        data = EmployeeSerializer.to_dict(employee)
         data["type"] = employee.__class__.__name__  # helpful for client/UI
 
-        return self._json_safe(data)
+        return data
+
+    def _productivity_result(self, emp: AbstractEmployee) -> Dict[str, Any]:
+        return {
+            "employee_id": emp.id,
+            "type": emp.__class__.__name__,
+            "productivity": emp.estimate_productivity(),
+        }
+
+    def _productivity_batch_result(self, found: Sequence[AbstractEmployee], missing: List[str]) -> Dict[str, Any]:
+        scores = estimate_productivity_batch(EmployeeColumns.from_employees(found), as_of=date.today())
+
+        return {
+            "results": [
+                {
+                    "employee_id": emp.id,
+                    "type": emp.__class__.__name__,
+                    "productivity": float(score),
+                }
+                for emp, score in zip(found, scores)
+            ],
+            "missing": missing,
+        }
 
-    def _json_safe(self, obj: Any) -> Any:
+    def _prediction_result(self, employee: AbstractEmployee, prediction: float) -> Dict[str, Any]:
+        return {
+            "employee_id": employee.id,
+            "type": employee.__class__.__name__.lower(),
+            "predicted_productivity": float(prediction),
+            "actual_productivity": float(employee.estimate_productivity()),
+        }
+
+    def _prediction_batch_result(
+        self, found: Sequence[AbstractEmployee], missing: List[str], predictions: np.ndarray
+    ) -> Dict[str, Any]:
+        actuals = estimate_productivity_batch(EmployeeColumns.from_employees(found), as_of=date.today())
+
+        return {
+            "results": [
+                {
+                    "employee_id": emp.id,
+                    "type": emp.__class__.__name__.lower(),
+                    "predicted_productivity": float(predicted),
+                    "actual_productivity": float(actual),
+                }
+                for emp, predicted, actual in zip(found, predictions, actuals)
+            ],
+            "missing": missing,
+        }
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    def _after_save(self, saved: Sequence[AbstractEmployee]) -> None:
         """
-        Recursively convert non-JSON types:
-        - date -> ISO string
-        - Enum -> .value
+        Keep derived state in step with the repository: drop cached predictions
+        and fold the new scores into the aggregates and ranking (replacing any previous ones).
+
+        Saves are scored as of today, not the last rebuild's day: a save always
+        gets its current score even when no rebuild has run for a while, at the
+        cost of the index mixing days until the next rebuild (see ScoreIndex).
         """
-        if isinstance(obj, date):
-            return obj.isoformat()
+        for emp in saved:
+            self._prediction_cache.invalidate(emp.id)
 
-        if isinstance(obj, Enum):
-            return obj.value
+        if saved:
+            columns = EmployeeColumns.from_employees(saved)
+            scores = estimate_productivity_batch(columns, as_of=date.today())
+            ids = [emp.id for emp in saved]
+            for index in self._score_indexes:
+                index.apply(ids, columns.employee_type, columns.employment_level, scores)
 
-        if isinstance(obj, dict):
-            return {k: self._json_safe(v) for k, v in obj.items()}
+    def _begin_rebuild(self, as_of: date) -> "_ScoreRebuild":
+        return _ScoreRebuild(self._score_indexes, as_of)
 
-        if isinstance(obj, list):
-            return [self._json_safe(v) for v in obj]
+    def _predict(self, employees: Sequence[AbstractEmployee], model_version: Optional[str] = None) -> np.ndarray:
+        """
+        One feature matrix, one predict call on the requested (default: active) model.
+        Rows already in the prediction cache skip the model entirely; with a
+        batcher, the misses share a model call with other threads' requests.
+        """
+        model = self._models.get(model_version)
+        if not employees:
+            return np.empty(0, dtype=np.float64)
 
-        return obj
+        as_of = date.today()
+        X = model.encode(employees, as_of=as_of)
+        cache = self._prediction_cache
+        predictions = np.empty(len(employees), dtype=np.float64)
+        misses: List[int] = []
+        with _PREDICTION_CACHE.time():
+            keys = [cache.make_key(d, model.version, model.revision, as_of) for d in model.row_digests(X)]
+            for i, key in enumerate(keys):
+                cached = cache.get(key)
+                if cached is None:
+                    misses.append(i)
+                else:
+                    predictions[i] = cached
 
-    # get employee productivity
-    def get_productivity(self, employee_id: str) -> Optional[Dict[str, Any]]:
-        emp = self._repo.get(employee_id)
+        if misses:
+            if self._batcher is not None:
+                predictions[misses] = self._batcher.predict(model, X, rows=misses)
+            else:
+                predictions[misses] = model.predict_encoded(X, rows=misses)
+            for i in misses:
+                cache.put(keys[i], employees[i].id, float(predictions[i]))
+
+        return predictions
+
+
+class _ScoreRebuild:
+    """
+    One full rebuild of the aggregates and ranking: add() scores each repository
+    page, then finish() builds the fresh states and swaps them in (abort() drops them).
+    """
+
+    def __init__(self, indexes: Sequence[Any], as_of: date):
+        self._indexes = indexes
+        self._batches = [index.begin_rebuild() for index in indexes]
+        self.as_of = as_of
+        self.scored = 0
+        self._started = time.perf_counter()
+
+    def add(self, employees: Sequence[AbstractEmployee]) -> None:
+        if not employees:
+            return
+        columns = EmployeeColumns.from_employees(employees)
+        scores = estimate_productivity_batch(columns, as_of=self.as_of)
+        ids = [emp.id for emp in employees]
+        for index, batches in zip(self._indexes, self._batches):
+            index.add_to_rebuild(batches, ids, columns.employee_type, columns.employment_level, scores)
+        self.scored += len(employees)
+
+    def abort(self) -> None:
+        for index in self._indexes:
+            index.abort_rebuild()
+
+    def finish(self) -> Dict[str, Any]:
+        for index, batches in zip(self._indexes, self._batches):
+            index.finish_rebuild(batches, self.as_of)
+        return {
+            "as_of": self.as_of.isoformat(),
+            "employees": self.scored,
+            "elapsed_seconds": round(time.perf_counter() - self._started, 6),
+        }
+
+
+def split_found(by_id: Mapping[str, AbstractEmployee], employee_ids: Sequence[str]) -> Tuple[List[AbstractEmployee], List[str]]:
+    """
+    get_many result -> (found, missing ids), both in input order.
+    """
+    found: List[AbstractEmployee] = []
+    missing: List[str] = []
+    for employee_id in employee_ids:
+        emp = by_id.get(employee_id)
+        if emp is None:
+            missing.append(employee_id)
+        else:
+            found.append(emp)
+    return found, missing
+
+
+class EmployeeService(BaseEmployeeService):
+    def __init__(
+        self,
+        repo: EmployeeRepository,
+        models: Optional[ModelRegistry] = None,
+        prediction_cache: Optional[PredictionCache] = None,
+        aggregates: Optional[ProductivityAggregates] = None,
+        ranking: Optional[ProductivityRanking] = None,
+        batcher: Optional[PredictionBatcher] = None,
+    ):
+        super().__init__(
+            models=models, prediction_cache=prediction_cache, aggregates=aggregates, ranking=ranking, batcher=batcher
+        )
+        self._repo = repo
+
+    # -------------------------
+    # Use cases
+    # -------------------------
+
+    def create_employee(self, payload: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        JSON payload -> domain employee -> repo -> JSON response dict
+        """
+        employee: AbstractEmployee = EmployeeFactory.from_payload(payload)
+
+        saved: AbstractEmployee = self._repo.save(employee)
+        self._after_save([saved])
+
+        return self._to_dict(saved)
+
+    def create_employee_from_request(self, req: BaseEmployeeCreate) -> Dict[str, Any]:
+        """
+        Validated request model -> domain employee -> repo -> JSON response dict
+        (fast path: no dict round trip through from_payload).
+        """
+        employee: AbstractEmployee = EmployeeFactory.from_request(req)
+
+        saved: AbstractEmployee = self._repo.save(employee)
+        self._after_save([saved])
+
+        return self._to_dict(saved)
+
+    def create_employees(self, requests: Sequence[BaseEmployeeCreate]) -> int:
+        """
+        Bulk variant of create_employee_from_request: one batched repository write,
+        returns the number saved.
+        """
+        employees = [EmployeeFactory.from_request(req) for req in requests]
+
+        saved = self._repo.save_many(employees)
+        self._after_save(saved)
+
+        return len(saved)
+
+    def get_employee(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        emp = self._get(employee_id)
         if emp is None:
             return None
+        return self._to_dict(emp)
+
+    def list_employees(self, query: EmployeeQuery) -> Dict[str, Any]:
+        """
+        One page of employees matching the query's filters.
+        """
+        page = self._repo.query(query)
         return {
-            "employee_id": emp.id,
-            "type": emp.__class__.__name__,
-            "productivity": emp.estimate_productivity(),
+            "items": [self._to_dict(emp) for emp in page.items],
+            "next_cursor": page.next_cursor,
         }
+
+    # get employee productivity
+    def get_productivity(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        emp = self._get(employee_id)
+        if emp is None:
+            return None
+        return self._productivity_result(emp)
+
+    def get_productivity_batch(self, employee_ids: Sequence[str]) -> Dict[str, Any]:
+        """
+        Batch variant of get_productivity.
+        Scores every found employee in one vectorized pass (single as-of date);
+        results keep input order, unknown ids are reported under "missing".
+        """
+        found, missing = self._get_many(employee_ids)
+        return self._productivity_batch_result(found, missing)
     
-    def predict_productivity(self, employee_id: str) -> dict | None:
-        employee = self._repo.get(employee_id)
+    def predict_productivity(self, employee_id: str, model_version: Optional[str] = None) -> dict | None:
+        employee = self._get(employee_id)
         if employee is None:
             return None
 
-        # extract ML features
-        features = employee_to_features(employee)
+        prediction = self._predict([employee], model_version)[0]
+        return self._prediction_result(employee, prediction)
 
-        # model expects a 2D structure
-        model = load_model("src/ml/model.pkl")
-        X = pd.DataFrame([features], columns=FEATURE_COLUMNS)
-        prediction = model.predict(X)[0]
+    def predict_productivity_batch(
+        self, employee_ids: Sequence[str], model_version: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Batch variant of predict_productivity.
+        Builds one feature matrix for all found employees and makes a single
+        model.predict call; results keep input order, unknown ids are
+        reported under "missing".
+        """
+        found, missing = self._get_many(employee_ids)
 
-        return {
-            "employee_id": employee.id,
-            "type": employee.__class__.__name__.lower(),
-            "predicted_productivity": float(prediction),
-            "actual_productivity": float(employee.estimate_productivity()),
-        }
\ No newline at end of file
+        predictions = self._predict(found, model_version)
+        return self._prediction_batch_result(found, missing, predictions)
+
+    def recompute_productivity_aggregates(self, as_of: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Rescore every employee as of `as_of` (default today) and swap in fresh
+        aggregates and ranking. Run daily: the promotion penalty moves with the
+        date even when nobody is saved.
+        """
+        rebuild = self._begin_rebuild(as_of or date.today())
+        try:
+            query = EmployeeQuery(limit=RECOMPUTE_PAGE_SIZE)
+            while True:
+                page = self._repo.query(query)
+                rebuild.add(page.items)
+                if page.next_cursor is None:
+                    break
+                query = EmployeeQuery(limit=RECOMPUTE_PAGE_SIZE, cursor=page.next_cursor)
+        except Exception:
+            rebuild.abort()
+            raise
+
+        return rebuild.finish()
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    def _get(self, employee_id: str) -> Optional[AbstractEmployee]:
+        with _REPO_GET.time():
+            return self._repo.get(employee_id)
+
+    def _get_many(self, employee_ids: Sequence[str]) -> Tuple[List[AbstractEmployee], List[str]]:
+        """
+        Fetch employees in one repository round trip; returns (found, missing ids) in input order.
+        """
+        with _REPO_GET_MANY.time():
+            by_id = self._repo.get_many(employee_ids)
+        return split_found(by_id, employee_ids)
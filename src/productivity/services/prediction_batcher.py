@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ml.registry import LoadedModel
+from productivity.observability.metrics import PREDICTION_BATCH_ROWS, stage
+
+DEFAULT_MAX_DELAY_SECONDS = 0.002
+DEFAULT_MAX_BATCH_ROWS = 64
+
+_BATCH_QUEUE = stage("prediction_batch_queue")
+
+
+@dataclass
+class _Request:
+    model: LoadedModel
+    X: Any
+    rows: int
+    future: Future
+    enqueued: float
+
+
+class PredictionBatcher:
+    """
+    Coalesces concurrent predict calls into one model call.
+
+    Callers (request threads) hand over their encoded rows and block on a
+    future; a dispatcher thread waits until `max_batch_rows` rows are pending
+    or the oldest request has waited `max_delay` seconds, stacks everything
+    pending for the same model (version + revision) into one matrix, predicts
+    once and hands each caller its slice. Per-call overhead and the walk over
+    every tree are then paid once per batch instead of once per request.
+
+    Inputs of `max_batch_rows` rows or more are already a batch and are
+    predicted on the caller's thread. The cost is up to `max_delay` of extra
+    latency when traffic is light.
+
+    Metrics: prediction_batch_rows (rows per model call) and the
+    prediction_batch_queue stage (time from submit until the batch starts).
+    """
+
+    def __init__(self, max_delay: float = DEFAULT_MAX_DELAY_SECONDS, max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS):
+        if max_delay < 0 or max_batch_rows < 1:
+            raise ValueError("max_delay must be >= 0 and max_batch_rows >= 1")
+        self.max_delay = max_delay
+        self.max_batch_rows = max_batch_rows
+
+        self._pending: List[_Request] = []
+        self._pending_rows = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self.batches = 0
+        self.requests = 0
+        self.rows = 0
+
+        self._thread = threading.Thread(target=self._run, name="prediction-batcher", daemon=True)
+        self._thread.start()
+
+    def predict(self, model: LoadedModel, X: Any, rows: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        model.predict_encoded(X, rows), computed in a shared batch. Blocks until
+        the batch has run; model errors are raised here.
+        """
+        if rows is not None:
+            X = model.take_rows(X, rows)
+        n = len(X)
+        if n == 0:
+            return np.empty(0, dtype=np.float64)
+        if n >= self.max_batch_rows:
+            return model.predict_encoded(X)
+
+        request = _Request(model, X, n, Future(), time.perf_counter())
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("PredictionBatcher is closed")
+            self._pending.append(request)
+            self._pending_rows += n
+            # wake the dispatcher for a new window or a full batch; otherwise it's already waiting on the deadline
+            if len(self._pending) == 1 or self._pending_rows >= self.max_batch_rows:
+                self._cond.notify()
+        return request.future.result()
+
+    def close(self) -> None:
+        """
+        Run what's pending, then stop the dispatcher.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_delay_ms": self.max_delay * 1e3,
+            "max_batch_rows": self.max_batch_rows,
+            "batches": self.batches,
+            "requests": self.requests,
+            "rows": self.rows,
+            "mean_batch_rows": round(self.rows / self.batches, 3) if self.batches else None,
+        }
+
+    # -------------------------
+    # Dispatcher thread
+    # -------------------------
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return  # closed and drained
+
+                deadline = self._pending[0].enqueued + self.max_delay
+                while self._pending_rows < self.max_batch_rows and not self._closed:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch = self._take_batch()
+
+            for requests in _by_model(batch):
+                self._dispatch(requests)
+
+    def _take_batch(self) -> List[_Request]:
+        """
+        Oldest pending requests up to max_batch_rows rows (at least one); caller holds the lock.
+        """
+        taken, rows = 0, 0
+        for request in self._pending:
+            if taken and rows + request.rows > self.max_batch_rows:
+                break
+            taken += 1
+            rows += request.rows
+        batch, self._pending = self._pending[:taken], self._pending[taken:]
+        self._pending_rows -= rows
+        return batch
+
+    def _dispatch(self, requests: List[_Request]) -> None:
+        """
+        Run one batch; every caller's future is resolved on every path, so a
+        failure here can neither kill the dispatcher nor leave a caller blocked.
+        """
+        try:
+            self._predict_batch(requests)
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+
+    def _predict_batch(self, requests: List[_Request]) -> None:
+        model = requests[0].model
+        started = time.perf_counter()
+        for request in requests:
+            _BATCH_QUEUE.observe(started - request.enqueued)
+
+        X = model.concat_rows([request.X for request in requests])
+        predictions = np.asarray(model.predict_encoded(X), dtype=np.float64)
+
+        total = sum(request.rows for request in requests)
+        if len(predictions) != total:
+            raise ValueError(f"Model {model.version} returned {len(predictions)} predictions for {total} rows")
+
+        PREDICTION_BATCH_ROWS.observe(total)
+        self.batches += 1
+        self.requests += len(requests)
+        self.rows += total
+
+        offset = 0
+        for request in requests:
+            request.future.set_result(predictions[offset:offset + request.rows])
+            offset += request.rows
+
+
+def _by_model(batch: List[_Request]) -> List[List[_Request]]:
+    """
+    Requests grouped by model (version + revision), in arrival order; only these can share a matrix.
+    """
+    groups: Dict[Tuple[str, int], List[_Request]] = {}
+    for request in batch:
+        groups.setdefault((request.model.version, request.model.revision), []).append(request)
+    return list(groups.values())
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+CacheKey = Tuple[bytes, str, int, int]
+
+
+class PredictionCache:
+    """
+    Bounded LRU cache of model predictions.
+
+    Keyed on (feature-row digest, model version, model revision, as-of day):
+    the prediction is a pure function of those, and the day is part of the key
+    because years_since_promotion moves with date.today(). A per-employee index
+    lets a save drop that employee's entries straight away instead of waiting
+    for them to age out.
+
+    Entries are shared by content - two employees with identical features hit
+    the same entry - so invalidation is about memory, never correctness.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, str]]" = OrderedDict()
+        self._keys_by_employee: Dict[str, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(digest: bytes, model_version: str, model_revision: int, as_of: date) -> CacheKey:
+        return digest, model_version, model_revision, as_of.toordinal()
+
+    def get(self, key: CacheKey) -> Optional[float]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: CacheKey, employee_id: str, prediction: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._unindex(key, old[1])
+
+            self._entries[key] = (prediction, employee_id)
+            self._keys_by_employee.setdefault(employee_id, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                evicted_key, (_, evicted_id) = self._entries.popitem(last=False)
+                self._unindex(evicted_key, evicted_id)
+                self.evictions += 1
+
+    def invalidate(self, employee_id: str) -> None:
+        """
+        Drop every entry stored for `employee_id` (call after the employee is saved).
+        """
+        with self._lock:
+            for key in self._keys_by_employee.pop(employee_id, ()):
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_employee.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _unindex(self, key: Hashable, employee_id: str) -> None:
+        keys = self._keys_by_employee.get(employee_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_employee[employee_id]
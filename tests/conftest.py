@@ -0,0 +1,128 @@
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+# the packages live under src/ (run from the repo root: python -m pytest tests)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from productivity.domain.enums import EducationLevel, EmploymentLevel  # noqa: E402
+from productivity.factories.employee_factory import EmployeeFactory  # noqa: E402
+from productivity.persistence.employee_repo import EmployeeQuery  # noqa: E402
+
+_TYPES = ("manager", "individual_contributor", "hourly", "benefits_eligible")
+_LEVELS = ("ENTRY", "INTERMEDIATE", "MID", "SENIOR", "EXECUTIVE")
+_EDUCATION = ("HIGH_SCHOOL_DIPLOMA", "BACHELORS", "MASTERS", "DOCTORAL")
+
+
+def employee_payload(rng: random.Random) -> dict:
+    """
+    A random valid create payload; employment dates repeat often so ordering ties are exercised.
+    """
+    emp_type = rng.choice(_TYPES)
+    payload = {
+        "type": emp_type,
+        "contact": {
+            "name": {"first_name": rng.choice(["Ada", "Grace", "Alan"]), "last_name": "Doe"},
+            "address": "123 Main St",
+            "phone_number": "555-555-5555",
+            "email": "someone@example.com",
+            "emergency_contact": {"first_name": "Emergency", "last_name": "Contact"},
+        },
+        "employment_date": (date(2015, 1, 1) + timedelta(days=rng.randrange(60))).isoformat(),
+        "education_level": rng.choice(_EDUCATION),
+        "employment_level": rng.choice(_LEVELS),
+        "last_year_earnings": float(rng.randrange(20_000, 200_000)),
+        "overtime_earnings": float(rng.randrange(0, 5_000)),
+        "bonus": float(rng.randrange(0, 10_000)),
+    }
+    if emp_type in ("manager", "individual_contributor"):
+        payload.update(
+            base_pay=float(rng.randrange(40_000, 180_000)),
+            last_promotion_date=(date(2016, 1, 1) + timedelta(days=rng.randrange(3_000))).isoformat(),
+            num_projects=rng.randrange(6),
+        )
+        if emp_type == "manager":
+            payload["num_employees"] = rng.randrange(20)
+        else:
+            payload.update(
+                num_patents=rng.randrange(3), num_publications=rng.randrange(9), num_external_collaborations=rng.randrange(4)
+            )
+    else:
+        payload.update(contractual_work_hours=float(rng.randrange(10, 40)), actual_work_hours=float(rng.randrange(5, 45)))
+        if emp_type == "hourly":
+            payload["hourly_earnings"] = float(rng.randrange(10, 30))
+    return payload
+
+
+@pytest.fixture
+def make_employees():
+    """
+    make_employees(n, seed=0) -> n random domain employees without ids.
+    """
+    def make(n: int, seed: int = 0):
+        rng = random.Random(seed)
+        return [EmployeeFactory.from_payload(employee_payload(rng)) for _ in range(n)]
+
+    return make
+
+
+# -------------------------
+# Repository query matrix (shared by the EmployeeRepository implementations' tests)
+# -------------------------
+
+QUERIES = [
+    EmployeeQuery(),
+    EmployeeQuery(type="manager"),
+    EmployeeQuery(type="hourly", employment_level=EmploymentLevel.SENIOR),
+    EmployeeQuery(education_level=EducationLevel.MASTERS, employed_from=date(2015, 1, 10)),
+    EmployeeQuery(employed_from=date(2015, 1, 20), employed_to=date(2015, 1, 25)),
+    EmployeeQuery(type="intern"),
+]
+
+
+def page_ids(repo, query, limit):
+    """
+    Ids of every page of `query`, following next_cursor from query.cursor.
+    """
+    ids, cursor = [], query.cursor
+    while True:
+        page = repo.query(EmployeeQuery(**{**query.__dict__, "limit": limit, "cursor": cursor}))
+        assert len(page.items) <= limit
+        ids += [e.id for e in page.items]
+        cursor = page.next_cursor
+        if cursor is None:
+            return ids
+
+
+def matching(employees, query):
+    """
+    Brute-force filter of `employees` by `query`, in input order.
+    """
+    return [
+        e for e in employees
+        if (query.type is None or EmployeeFactory.TYPE_MAP.get(query.type) is e.__class__)
+        and (query.employment_level is None or e.employment_level == query.employment_level)
+        and (query.education_level is None or e.education_level == query.education_level)
+        and (query.employed_from is None or e.employment_date >= query.employed_from)
+        and (query.employed_to is None or e.employment_date <= query.employed_to)
+    ]
+
+
+# -------------------------
+# Model training data
+# -------------------------
+
+@pytest.fixture(scope="session")
+def training_frame():
+    """
+    A generated training table (FEATURE_COLUMNS + target), as ml.train_model loads it.
+    """
+    import numpy as np
+
+    from ml.generate_dataset import sample_chunk
+    from ml.train_model import _compact
+
+    return _compact(sample_chunk(np.random.default_rng(0), 3_000, date.today(), noise_std=0.15))
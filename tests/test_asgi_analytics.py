@@ -0,0 +1,61 @@
+"""
+The /analytics routes on the ASGI app: same bodies as the service, fed by /employees writes.
+"""
+import random
+
+import pytest
+from starlette.testclient import TestClient
+
+from productivity.asgi_factory import create_asgi_app
+
+from conftest import employee_payload
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setenv("REPO_TYPE", "memory")
+    monkeypatch.setenv("MODEL_PATH", str(tmp_path / "missing.pkl"))  # analytics needs no model
+    monkeypatch.delenv("AGGREGATES_DAILY_RECOMPUTE", raising=False)
+    with TestClient(create_asgi_app()) as client:
+        rng = random.Random(0)
+        for _ in range(30):
+            assert client.post("/employees", json=employee_payload(rng)).status_code == 201
+        yield client
+
+
+def test_aggregates_follow_writes_and_recompute(client):
+    service = client.app.state.employee_service
+
+    live = client.get("/analytics/productivity")
+    assert live.status_code == 200
+    assert live.json() == service.productivity_aggregates()
+    assert live.json()["overall"]["count"] == 30
+
+    rebuilt = client.post("/analytics/productivity/recompute")
+    assert rebuilt.status_code == 200
+    assert rebuilt.json()["employees"] == 30
+    assert client.get("/analytics/productivity").json()["as_of"] == rebuilt.json()["as_of"]
+
+
+def test_leaderboard_and_percentile(client):
+    service = client.app.state.employee_service
+
+    top = client.get("/analytics/productivity/leaderboard", params={"k": 5, "type": "manager"})
+    assert top.status_code == 200
+    assert top.json() == service.productivity_leaderboard(5, employee_type="manager")
+
+    employee_id = top.json()["results"][0]["employee_id"]
+    percentile = client.get(f"/analytics/productivity/percentile/{employee_id}")
+    assert percentile.status_code == 200
+    assert percentile.json() == service.productivity_percentile(employee_id)
+
+
+@pytest.mark.parametrize("params", [{"k": 0}, {"order": "sideways"}, {"type": "ceo"}])
+def test_invalid_leaderboard_query(client, params):
+    response = client.get("/analytics/productivity/leaderboard", params=params)
+    assert response.status_code == 400
+    assert response.json()["error"] == "Validation error"
+
+
+def test_unknown_employee_percentile(client):
+    assert client.get("/analytics/productivity/percentile/missing").status_code == 404
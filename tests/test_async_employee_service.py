@@ -0,0 +1,90 @@
+"""
+AsyncEmployeeService on the in-memory repository: results match the sync
+service, and population-sized work stays off the event loop thread.
+"""
+import asyncio
+import random
+import threading
+from datetime import date
+
+import pytest
+
+from productivity.api.employees import create_employee_adapter
+from productivity.persistence.employee_repo import EmployeeQuery
+from productivity.persistence.in_memory_employee_repo import AsyncInMemoryEmployeeRepository, InMemoryEmployeeRepository
+from productivity.services import employee_service
+from productivity.services.async_employee_service import AsyncEmployeeService
+from productivity.services.employee_service import EmployeeService
+
+from conftest import employee_payload
+
+
+@pytest.fixture
+def requests():
+    rng = random.Random(0)
+    return [create_employee_adapter.validate_python(employee_payload(rng)) for _ in range(300)]
+
+
+@pytest.fixture
+def loop_threads(monkeypatch):
+    """
+    Names of the threads that ran _ScoreRebuild.add / finish and the sync repo's save_many / query.
+    """
+    seen = {}
+
+    def record(cls, name):
+        original = getattr(cls, name)
+
+        def wrapper(self, *args, **kwargs):
+            seen.setdefault(name, set()).add(threading.current_thread().name)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(cls, name, wrapper)
+
+    record(employee_service._ScoreRebuild, "add")
+    record(employee_service._ScoreRebuild, "finish")
+    record(InMemoryEmployeeRepository, "save_many")
+    record(InMemoryEmployeeRepository, "query")
+    return seen
+
+
+def test_bulk_create_and_rebuild_run_off_the_loop(requests, loop_threads):
+    async def scenario():
+        service = AsyncEmployeeService(AsyncInMemoryEmployeeRepository())
+        try:
+            created = await service.create_employees(requests)
+            rebuilt = await service.recompute_productivity_aggregates(as_of=date(2024, 5, 20))
+            page = await service.list_employees(EmployeeQuery(limit=10))
+            return created, rebuilt, page, threading.current_thread().name
+        finally:
+            service.close()
+
+    created, rebuilt, page, loop_thread = asyncio.run(scenario())
+
+    assert created == rebuilt["employees"] == len(requests)
+    assert len(page["items"]) == 10
+    for name in ("add", "finish", "save_many", "query"):
+        assert loop_threads[name] and loop_thread not in loop_threads[name], name
+
+
+def test_matches_the_sync_service(requests):
+    sync = EmployeeService(InMemoryEmployeeRepository())
+    sync.create_employees(requests)
+    expected = sync.recompute_productivity_aggregates(as_of=date(2024, 5, 20))
+
+    async def scenario():
+        service = AsyncEmployeeService(AsyncInMemoryEmployeeRepository())
+        try:
+            await service.create_employees(requests)
+            return await service.recompute_productivity_aggregates(as_of=date(2024, 5, 20)), service
+        finally:
+            service.close()
+
+    rebuilt, service = asyncio.run(scenario())
+
+    assert rebuilt["employees"] == expected["employees"]
+    # ids are random uuids, so the pages (and float summation order) differ between the two repos
+    got, want = service.productivity_aggregates(), sync.productivity_aggregates()
+    assert len(got["groups"]) == len(want["groups"])
+    for g, w in zip(got["groups"] + [got["overall"]], want["groups"] + [want["overall"]]):
+        assert g == pytest.approx(w)
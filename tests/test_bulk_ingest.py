@@ -0,0 +1,55 @@
+"""
+BulkIngest: per-line validation of NDJSON uploads.
+"""
+import json
+
+from productivity.api.employees import BulkIngest
+
+RECORD = {
+    "type": "benefits_eligible",
+    "contact": {
+        "name": {"first_name": "Ada", "last_name": "Lovelace"},
+        "address": "123 Main St",
+        "phone_number": "555-555-5555",
+        "email": "ada@example.com",
+        "emergency_contact": {"first_name": "Emergency", "last_name": "Contact"},
+    },
+    "employment_date": "2019-03-01",
+    "education_level": "MASTERS",
+    "employment_level": "SENIOR",
+    "last_year_earnings": 125000.0,
+    "overtime_earnings": 2500.0,
+    "bonus": 8000.0,
+    "contractual_work_hours": 30.0,
+    "actual_work_hours": 28.0,
+}
+
+
+def _feed(lines):
+    ingest = BulkIngest()
+    accepted = []
+    for line_no, line in enumerate(lines, start=1):
+        accepted += ingest.feed(line_no, line) or []
+    accepted += ingest.flush()
+    return ingest, accepted
+
+
+def test_bad_lines_are_reported_and_the_rest_ingested():
+    good = json.dumps(RECORD).encode()
+    ingest, accepted = _feed([good, b"{not json", b"", json.dumps({**RECORD, "type": "intern"}).encode(), good])
+
+    assert len(accepted) == 2
+    assert (ingest.received, ingest.failed) == (4, 2)
+    assert [e["line"] for e in ingest.errors] == [2, 4]
+    assert ingest.errors[0]["error"].startswith("Invalid JSON")
+    assert ingest.errors[1]["error"] == "Validation error"
+
+
+def test_invalid_utf8_is_a_per_line_error():
+    good = json.dumps(RECORD).encode()
+    ingest, accepted = _feed([good, b'{"type": "\xff\xfe"}', good])
+
+    assert len(accepted) == 2
+    assert ingest.failed == 1
+    assert ingest.errors[0]["line"] == 2
+    assert ingest.errors[0]["error"].startswith("Invalid JSON: not valid utf-8")
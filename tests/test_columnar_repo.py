@@ -0,0 +1,49 @@
+"""
+ColumnarEmployeeRepository specifics: re-saves across types and the column views.
+The repository contract and paging are covered in test_employee_repos.py.
+"""
+from datetime import date
+
+import numpy as np
+import pytest
+
+from productivity.analytics.productivity_engine import EmployeeColumns, estimate_productivity_batch
+from productivity.persistence.columnar_employee_repo import ColumnarEmployeeRepository
+
+
+@pytest.fixture
+def stored(make_employees):
+    employees = make_employees(600)
+    repo = ColumnarEmployeeRepository(capacity=16)  # forces several growths
+    repo.save_many(employees[:400])
+    for e in employees[400:]:
+        repo.save(e)
+    return repo, employees
+
+
+def test_resave_with_another_type_resets_absent_fields(stored, make_employees):
+    repo, employees = stored
+    manager = next(e for e in employees if e.__class__.__name__ == "Manager")
+    hourly = next(e for e in make_employees(50, seed=1) if e.__class__.__name__ == "HourlyEmployee")
+    hourly.id = manager.id
+
+    repo.save(hourly)
+
+    assert len(repo) == len(employees)
+    assert repo.get(manager.id) == hourly
+    row = repo.row_ids().index(manager.id)
+    assert np.isnan(repo.column("num_employees")[row])
+
+
+def test_columns_match_from_employees(stored):
+    repo, employees = stored
+    by_id = {e.id: e for e in employees}
+    in_row_order = [by_id[eid] for eid in repo.row_ids()]
+    as_of = date(2024, 5, 20)
+
+    np.testing.assert_array_equal(
+        estimate_productivity_batch(repo.columns(), as_of),
+        estimate_productivity_batch(EmployeeColumns.from_employees(in_row_order), as_of),
+    )
+    with pytest.raises(ValueError):
+        repo.column("base_pay")[0] = 1.0
@@ -0,0 +1,60 @@
+"""
+DynamoDBEmployeeRepository against moto: GSI paging and cursor validation.
+"""
+import pytest
+
+moto = pytest.importorskip("moto")
+
+from conftest import QUERIES, matching, page_ids  # noqa: E402
+from productivity.persistence.dynamodb_employee_repo import DynamoDBEmployeeRepository, create_table  # noqa: E402
+from productivity.persistence.employee_repo import EmployeeQuery, InvalidCursorError, encode_cursor  # noqa: E402
+
+
+@pytest.fixture
+def stored(monkeypatch, make_employees):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("DYNAMODB_ENDPOINT_URL", raising=False)
+    with moto.mock_aws():
+        create_table("employees", region_name="us-east-1")
+        repo = DynamoDBEmployeeRepository("employees", region_name="us-east-1", max_workers=1)
+        employees = make_employees(120)
+        repo.save_many(employees)
+        yield repo, employees
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_paging_visits_every_match_once(stored, query):
+    repo, employees = stored
+    ids = page_ids(repo, query, 7)
+    assert len(ids) == len(set(ids))
+    assert set(ids) == {e.id for e in matching(employees, query)}
+
+
+def test_cursor_resumes_with_a_real_start_key(stored):
+    repo, employees = stored
+    first = repo.query(EmployeeQuery(type="manager", limit=3))
+    rest = page_ids(repo, EmployeeQuery(type="manager", cursor=first.next_cursor), 5)
+    managers = matching(employees, EmployeeQuery(type="manager"))
+    assert sorted([e.id for e in first.items] + rest) == sorted(e.id for e in managers)
+
+
+_KEY = {"employee_id": "x", "type": "manager", "employment_date": "2015-01-01"}
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        encode_cursor({"p": 0, "k": "x"}),
+        encode_cursor({"p": 9, "k": None}),
+        encode_cursor({"p": 0, "k": {"employee_id": "x"}}),  # missing the index keys
+        encode_cursor({"p": 0, "k": {**_KEY, "extra": "x"}}),
+        encode_cursor({"p": 0, "k": {**_KEY, "employment_date": 20150101}}),
+        encode_cursor({"p": 0, "k": {**_KEY, "type": "hourly"}}),  # another partition's key
+    ],
+)
+def test_invalid_cursor(stored, cursor):
+    repo, _ = stored
+    with pytest.raises(InvalidCursorError):
+        repo.query(EmployeeQuery(type="manager", cursor=cursor))
@@ -0,0 +1,119 @@
+"""
+The EmployeeRepository contract, for every in-process implementation:
+round trips, re-saves and cursor paging against a brute-force filter.
+"""
+import copy
+from datetime import date
+
+import pytest
+
+from conftest import QUERIES, matching, page_ids
+from productivity.domain.enums import EmploymentLevel
+from productivity.persistence.columnar_employee_repo import ColumnarEmployeeRepository
+from productivity.persistence.employee_repo import EmployeeQuery, InvalidCursorError, encode_cursor
+from productivity.persistence.in_memory_employee_repo import InMemoryEmployeeRepository
+
+REPOSITORIES = {
+    "memory": InMemoryEmployeeRepository,
+    "columnar": lambda: ColumnarEmployeeRepository(capacity=16),  # forces several growths
+}
+
+
+def page_order(repo):
+    """
+    Sort key of the repository's paging order: (employment_date, id), or (employment_date, row) for columnar.
+    """
+    if isinstance(repo, ColumnarEmployeeRepository):
+        row = {eid: i for i, eid in enumerate(repo.row_ids())}
+        return lambda e: (e.employment_date, row[e.id])
+    return lambda e: (e.employment_date, e.id)
+
+
+def expected_ids(repo, employees, query):
+    return [e.id for e in sorted(matching(employees, query), key=page_order(repo))]
+
+
+@pytest.fixture(params=list(REPOSITORIES))
+def new_repo(request):
+    return REPOSITORIES[request.param]
+
+
+@pytest.fixture
+def stored(new_repo, make_employees):
+    employees = make_employees(600)
+    repo = new_repo()
+    repo.save_many(employees[:400])  # unsorted batch
+    for e in employees[400:]:
+        repo.save(e)
+    return repo, employees
+
+
+def test_round_trip(stored):
+    repo, employees = stored
+    assert repo.get(employees[7].id) == employees[7]
+    found = repo.get_many([employees[3].id, "missing", employees[3].id, employees[500].id])
+    assert found == {employees[3].id: employees[3], employees[500].id: employees[500]}
+    assert repo.get("missing") is None
+
+
+@pytest.mark.parametrize("query", QUERIES)
+@pytest.mark.parametrize("limit", [1, 7, 50, 1000])
+def test_paging_visits_every_match_once_in_order(stored, query, limit):
+    repo, employees = stored
+    assert page_ids(repo, query, limit) == expected_ids(repo, employees, query)
+
+
+def test_resave_moves_index_entries(stored):
+    repo, employees = stored
+    changed = []
+    for e in employees[::3]:
+        moved = copy.copy(e)
+        moved.employment_date = date(2015, 3, 1)
+        moved.employment_level = EmploymentLevel.EXECUTIVE
+        changed.append(moved)
+    repo.save_many(changed[:100])
+    for e in changed[100:]:
+        repo.save(e)
+
+    current = list(({e.id: e for e in employees} | {e.id: e for e in changed}).values())
+    for query in QUERIES + [EmployeeQuery(employment_level=EmploymentLevel.EXECUTIVE)]:
+        assert page_ids(repo, query, 50) == expected_ids(repo, current, query)
+
+
+def test_save_many_repeated_id_keeps_last(new_repo, make_employees):
+    first, second = make_employees(2)
+    second.id = first.id = "same"
+    repo = new_repo()
+
+    repo.save_many([first, second])
+
+    assert repo.get("same") == second
+    assert page_ids(repo, EmployeeQuery(), 10) == ["same"]
+
+
+def test_save_many_assigns_ids(new_repo, make_employees):
+    repo = new_repo()
+    saved = repo.save_many(make_employees(3))
+    assert all(e.id for e in saved)
+    assert repo.get_many([e.id for e in saved]) == {e.id: e for e in saved}
+
+
+def test_cursor_survives_writes_between_pages(stored, make_employees):
+    repo, employees = stored
+    first = repo.query(EmployeeQuery(limit=100))
+    seen = [e.id for e in first.items]
+    repo.save_many(make_employees(50, seed=2))
+
+    rest = page_ids(repo, EmployeeQuery(cursor=first.next_cursor), 100)
+
+    assert not set(seen) & set(rest)
+    assert {e.id for e in employees} <= set(seen) | set(rest)
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-a-cursor", encode_cursor({"a": 1}), encode_cursor([1, -2]), encode_cursor(["2015-01-01", "x"])]
+)
+def test_invalid_cursor(stored, cursor):
+    repo, _ = stored
+    with pytest.raises(InvalidCursorError):
+        repo.query(EmployeeQuery(cursor=cursor))
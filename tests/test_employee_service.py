@@ -0,0 +1,37 @@
+"""
+EmployeeService score indexes: saves between rebuilds are scored as of the day of the save.
+"""
+import random
+from datetime import date
+
+from productivity.analytics.productivity_engine import EmployeeColumns, estimate_productivity_batch
+from productivity.api.employees import create_employee_adapter
+from productivity.persistence.employee_repo import EmployeeQuery
+from productivity.persistence.in_memory_employee_repo import InMemoryEmployeeRepository
+from productivity.services.employee_service import EmployeeService
+
+from conftest import employee_payload
+
+
+def _score(employee, as_of):
+    return float(estimate_productivity_batch(EmployeeColumns.from_employees([employee]), as_of)[0])
+
+
+def test_saves_after_a_rebuild_are_scored_today():
+    rng = random.Random(0)
+    repo = InMemoryEmployeeRepository()
+    service = EmployeeService(repo)
+    rebuilt_on = date(2017, 6, 1)
+
+    service.create_employees([create_employee_adapter.validate_python(employee_payload(rng)) for _ in range(20)])
+    service.recompute_productivity_aggregates(as_of=rebuilt_on)
+    before = {e.id for e in repo.query(EmployeeQuery(limit=100)).items}
+    service.create_employees([create_employee_adapter.validate_python(employee_payload(rng)) for _ in range(20)])
+
+    employees = repo.query(EmployeeQuery(limit=100)).items
+    after = [e for e in employees if e.id not in before]
+    # the two days' scores differ, so the check below means something
+    assert any(_score(e, rebuilt_on) != _score(e, date.today()) for e in after)
+    for e in employees:
+        scored_on = rebuilt_on if e.id in before else date.today()
+        assert service.productivity_percentile(e.id)["productivity"] == _score(e, scored_on)
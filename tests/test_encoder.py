@@ -0,0 +1,106 @@
+"""
+ml.encoder.FeatureEncoder: the same matrix as the fitted sklearn preprocessor it was compiled from.
+"""
+import copy
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml.encoder import FeatureEncoder
+from ml.features import employee_to_features
+from ml.schema import FEATURE_COLUMNS, TARGET_COLUMN
+from ml.train_model import build_pipeline
+from productivity.analytics.productivity_engine import EMPLOYEE_TYPES
+from productivity.domain.enums import EducationLevel, EmploymentLevel
+
+
+@pytest.fixture(scope="module", params=["rf", "hgb"])
+def pipeline(request, training_frame):
+    # no EXECUTIVE rows, so that level is an unknown category at encode time
+    frame = training_frame[training_frame["employment_level"] != EmploymentLevel.EXECUTIVE.value]
+    pipeline = build_pipeline(request.param, n_jobs=1, n_estimators=5)
+    return pipeline.fit(frame[FEATURE_COLUMNS], frame[TARGET_COLUMN])
+
+
+def _features(employee):
+    if employee.education_level is not None:
+        return employee_to_features(employee)
+    # employee_to_features assumes every categorical is set; a missing one is None (NaN) in the frame
+    filled = copy.copy(employee)
+    filled.education_level = EducationLevel.BACHELORS
+    row = employee_to_features(filled)
+    row["education_level"] = None
+    return row
+
+
+def _sklearn_encode(pipeline, employees):
+    frame = pd.DataFrame([_features(e) for e in employees], columns=FEATURE_COLUMNS)
+    X = pipeline.named_steps["preprocess"].transform(frame)
+    return np.asarray(X.toarray() if hasattr(X, "toarray") else X, dtype=np.float64)
+
+
+@pytest.fixture
+def employees(make_employees):
+    employees = make_employees(200)
+    assert {e.employment_level for e in employees} >= {EmploymentLevel.EXECUTIVE}
+    # missing values: a NaN numeric and a missing categorical go through the imputers
+    holes = [copy.copy(e) for e in employees[:20]]
+    for e in holes[::2]:
+        e.bonus = float("nan")
+    for e in holes[1::2]:
+        e.education_level = None
+    return employees + holes
+
+
+def test_encode_many_matches_the_preprocessor(pipeline, employees):
+    encoder = FeatureEncoder.from_pipeline(pipeline)
+
+    np.testing.assert_array_equal(encoder.encode_many(employees, as_of=date.today()), _sklearn_encode(pipeline, employees))
+
+
+def test_unknown_category_encodes_like_sklearn(pipeline, employees):
+    encoder = FeatureEncoder.from_pipeline(pipeline)
+    executives = [e for e in employees if e.employment_level == EmploymentLevel.EXECUTIVE]
+
+    X = encoder.encode_many(executives, as_of=date.today())
+
+    np.testing.assert_array_equal(X, _sklearn_encode(pipeline, executives))
+    if pipeline.named_steps["model"].__class__.__name__.startswith("HistGradientBoosting"):
+        assert np.isnan(X[:, FEATURE_COLUMNS.index("employment_level")]).all()
+
+
+def test_round_trips_through_dict(pipeline, employees):
+    encoder = FeatureEncoder.from_pipeline(pipeline)
+    restored = FeatureEncoder.from_dict(encoder.to_dict())
+
+    np.testing.assert_array_equal(
+        restored.encode_many(employees, as_of=date.today()), encoder.encode_many(employees, as_of=date.today())
+    )
+
+
+def test_encode_columns_matches_encode_many(pipeline, make_employees):
+    employees = make_employees(100)
+    encoder = FeatureEncoder.from_pipeline(pipeline)
+    as_of = date(2024, 5, 20)
+    categories = {
+        "employee_type": list(EMPLOYEE_TYPES),
+        "employment_level": [level.value for level in EmploymentLevel],
+        "education_level": sorted({e.education_level.value for e in employees}) + ["UNSEEN"],
+    }
+    rows = [employee_to_features(e) for e in employees]
+    columns = {
+        col: np.array([categories[col].index(row[col]) for row in rows])
+        for col in categories
+    }
+    for col in FEATURE_COLUMNS:
+        if col not in categories and col != "years_since_promotion":
+            columns[col] = np.array([np.nan if row[col] is None else row[col] for row in rows], dtype=np.float64)
+    columns["last_promotion_date"] = np.array(
+        [e.last_promotion_date.toordinal() if getattr(e, "last_promotion_date", None) else 0 for e in employees]
+    )
+
+    np.testing.assert_array_equal(
+        encoder.encode_columns(columns, categories, as_of=as_of), encoder.encode_many(employees, as_of=as_of)
+    )
@@ -0,0 +1,63 @@
+"""
+ml.flat_forest.FlatForest: the same predictions as the sklearn pipeline it was compiled from.
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml.features import employee_to_features
+from ml.flat_forest import FlatForest
+from ml.schema import FEATURE_COLUMNS, TARGET_COLUMN
+from ml.train_model import build_pipeline
+
+# leaf values are stored as float32 and averaged in float64; sklearn averages float64 leaves
+RTOL = 1e-6
+ATOL = 1e-6
+
+
+@pytest.fixture(scope="module", params=["rf", "rf-limited"])
+def pipeline(request, training_frame):
+    pipeline = build_pipeline(request.param, n_jobs=1, n_estimators=8)
+    return pipeline.fit(training_frame[FEATURE_COLUMNS], training_frame[TARGET_COLUMN])
+
+
+def _encoded(pipeline, frame):
+    X = pipeline.named_steps["preprocess"].transform(frame[FEATURE_COLUMNS])
+    return X.toarray() if hasattr(X, "toarray") else X
+
+
+def test_predict_matches_the_pipeline(pipeline, training_frame):
+    # the training rows themselves sit right next to split thresholds
+    flat = FlatForest.from_pipeline(pipeline)
+
+    np.testing.assert_allclose(
+        flat.predict(_encoded(pipeline, training_frame)), pipeline.predict(training_frame[FEATURE_COLUMNS]), rtol=RTOL, atol=ATOL
+    )
+
+
+def test_saved_forest_predicts_employees_like_the_pipeline(pipeline, make_employees, tmp_path):
+    employees = make_employees(300)
+    flat = FlatForest.load(FlatForest.from_pipeline(pipeline).save(tmp_path / "flat"))
+    frame = pd.DataFrame([employee_to_features(e) for e in employees], columns=FEATURE_COLUMNS)
+
+    np.testing.assert_allclose(
+        flat.predict_employees(employees, as_of=date.today()), pipeline.predict(frame), rtol=RTOL, atol=ATOL
+    )
+
+
+def test_blocks_and_single_rows(pipeline, training_frame, monkeypatch):
+    monkeypatch.setattr("ml.flat_forest._BLOCK_ROWS", 7)
+    flat = FlatForest.from_pipeline(pipeline)
+    X = _encoded(pipeline, training_frame.head(50))
+    expected = pipeline.predict(training_frame.head(50)[FEATURE_COLUMNS])
+
+    np.testing.assert_allclose(flat.predict(X), expected, rtol=RTOL, atol=ATOL)
+    np.testing.assert_allclose(flat.predict(X[3]), expected[3:4], rtol=RTOL, atol=ATOL)
+
+
+def test_rejects_a_non_forest_pipeline(training_frame):
+    pipeline = build_pipeline("hgb", n_estimators=5).fit(training_frame[FEATURE_COLUMNS], training_frame[TARGET_COLUMN])
+    with pytest.raises(ValueError):
+        FlatForest.from_pipeline(pipeline)
@@ -0,0 +1,19 @@
+"""
+Interned values are shared between employees, so they must be immutable.
+"""
+import dataclasses
+
+import pytest
+
+from productivity.domain.interning import intern_name
+
+
+def test_intern_name_shares_one_instance():
+    assert intern_name("Emergency", "Contact") is intern_name("Emergency", "Contact")
+
+
+def test_interned_name_cannot_be_mutated():
+    name = intern_name("Ada", "Lovelace")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        name.first_name = "Grace"
+    assert intern_name("Ada", "Lovelace").first_name == "Ada"
@@ -0,0 +1,46 @@
+"""
+Text exposition of the in-process metrics registry.
+"""
+import pytest
+
+from productivity.observability.metrics import MetricsRegistry, _Metric
+
+
+def test_counter_family_and_samples_share_the_name():
+    registry = MetricsRegistry()
+    requests = registry.counter("http_requests_total", "Requests.", labelnames=("route",))
+    requests.labels("/a").inc()
+    requests.labels("/a").inc(2)
+
+    assert registry.render().splitlines() == [
+        "# HELP http_requests_total Requests.",
+        "# TYPE http_requests_total counter",
+        'http_requests_total{route="/a"} 3',
+    ]
+
+
+def test_counter_name_must_end_in_total():
+    with pytest.raises(ValueError):
+        MetricsRegistry().counter("http_requests", "Requests.")
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value)
+
+    assert registry.render().splitlines() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.65",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_metric_base_is_abstract():
+    with pytest.raises(TypeError):
+        _Metric("x", "x")
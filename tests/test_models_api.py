@@ -0,0 +1,37 @@
+"""
+POST /models: loading artifacts through the registry.
+"""
+import pytest
+from flask import Flask
+
+from ml.registry import ModelRegistry
+from productivity.api.models import bp as models_bp
+
+
+@pytest.fixture
+def client(tmp_path):
+    app = Flask(__name__)
+    app.config["MODEL_DIR"] = str(tmp_path)
+    app.config["MODEL_REGISTRY"] = ModelRegistry()
+    app.register_blueprint(models_bp)
+    return app.test_client()
+
+
+def test_unloadable_artifact_is_422(client, tmp_path):
+    (tmp_path / "broken.pkl").write_bytes(b"not a pickle")
+
+    resp = client.post("/models", json={"version": "broken", "path": "broken.pkl"})
+
+    assert resp.status_code == 422
+    assert resp.get_json()["error"].startswith("Could not load model artifact")
+    assert client.get("/models").get_json() == {"active_version": None, "versions": []}
+
+
+def test_missing_artifact_is_404(client):
+    resp = client.post("/models", json={"version": "v2", "path": "missing.pkl"})
+    assert resp.status_code == 404
+
+
+def test_path_outside_model_dir_is_404(client):
+    resp = client.post("/models", json={"version": "v2", "path": "../../etc/passwd"})
+    assert resp.status_code == 404
@@ -0,0 +1,139 @@
+"""
+PredictionBatcher with a stand-in model: coalescing, slicing, failures, shutdown.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from productivity.services.prediction_batcher import PredictionBatcher
+
+
+class FakeModel:
+    """The LoadedModel surface the batcher uses; predicts 2 * the first column."""
+
+    version, revision = "fake", 0
+
+    def __init__(self, fail=None, drop_rows=0):
+        self.calls = []
+        self.fail = fail
+        self.drop_rows = drop_rows
+
+    take_rows = staticmethod(lambda X, rows: X[list(rows)])
+    concat_rows = staticmethod(lambda parts: np.concatenate(parts))
+
+    def predict_encoded(self, X):
+        self.calls.append(len(X))
+        if self.fail is not None:
+            raise self.fail
+        return 2.0 * X[: len(X) - self.drop_rows, 0]
+
+
+def _rows(start, n):
+    return np.arange(start, start + n, dtype=np.float64).reshape(n, 1)
+
+
+def _wait_pending(batcher, n, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while len(batcher._pending) < n:
+        assert time.monotonic() < deadline, "requests never reached the batcher"
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def make_batcher():
+    batchers = []
+
+    def make(**kwargs):
+        batchers.append(PredictionBatcher(**kwargs))
+        return batchers[-1]
+
+    yield make
+    for batcher in batchers:
+        batcher.close()
+
+
+def test_concurrent_requests_share_one_model_call(make_batcher):
+    model = FakeModel()
+    batcher = make_batcher(max_delay=30.0, max_batch_rows=8)  # fires on the 8th row, not the deadline
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda i: batcher.predict(model, _rows(10 * i, 1)), range(8)))
+
+    assert model.calls == [8]
+    assert [r.tolist() for r in results] == [[20.0 * i] for i in range(8)]
+    assert batcher.stats()["batches"] == 1 and batcher.stats()["mean_batch_rows"] == 8
+
+
+def test_each_caller_gets_its_own_slice(make_batcher):
+    model = FakeModel()
+    batcher = make_batcher(max_delay=30.0, max_batch_rows=9)
+    sizes = [1, 3, 5]
+
+    with ThreadPoolExecutor(3) as pool:
+        results = list(pool.map(lambda n: batcher.predict(model, _rows(100 * n, n)), sizes))
+
+    assert model.calls == [9]
+    for n, result in zip(sizes, results):
+        np.testing.assert_array_equal(result, 2.0 * np.arange(100 * n, 100 * n + n))
+
+
+def test_row_selection_and_large_inputs(make_batcher):
+    model = FakeModel()
+    batcher = make_batcher(max_delay=0.0, max_batch_rows=4)
+
+    np.testing.assert_array_equal(batcher.predict(model, _rows(0, 6), rows=[5, 1]), [10.0, 2.0])
+    np.testing.assert_array_equal(batcher.predict(model, _rows(0, 4)), [0.0, 2.0, 4.0, 6.0])  # a full batch: inline
+    assert batcher.predict(model, _rows(0, 0)).shape == (0,)
+    assert batcher.stats()["batches"] == 1
+
+
+@pytest.mark.parametrize(
+    "model, error",
+    [(FakeModel(fail=RuntimeError("model exploded")), RuntimeError), (FakeModel(drop_rows=1), ValueError)],
+    ids=["predict raises", "wrong row count"],
+)
+def test_failure_reaches_every_caller_and_dispatcher_survives(make_batcher, model, error):
+    batcher = make_batcher(max_delay=30.0, max_batch_rows=4)
+
+    def call(i):
+        try:
+            batcher.predict(model, _rows(i, 1))
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(4) as pool:
+        outcomes = list(pool.map(call, range(4)))
+
+    assert all(isinstance(e, error) for e in outcomes)
+    # the dispatcher thread is still serving
+    healthy = FakeModel()
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda i: batcher.predict(healthy, _rows(i, 1)), range(4)))
+    assert [r.tolist() for r in results] == [[0.0], [2.0], [4.0], [6.0]]
+
+
+def test_close_runs_pending_requests(make_batcher):
+    model = FakeModel()
+    batcher = make_batcher(max_delay=30.0, max_batch_rows=100)
+    results = {}
+
+    def call(i):
+        results[i] = batcher.predict(model, _rows(i, 1))
+
+    callers = [threading.Thread(target=call, args=(i,)) for i in range(3)]
+    for t in callers:
+        t.start()
+    _wait_pending(batcher, 3)
+
+    started = time.monotonic()
+    batcher.close()
+    for t in callers:
+        t.join(timeout=5)
+
+    assert time.monotonic() - started < 5  # not the 30s window
+    assert {i: r.tolist() for i, r in results.items()} == {0: [0.0], 1: [2.0], 2: [4.0]}
+    with pytest.raises(RuntimeError):
+        batcher.predict(model, _rows(0, 1))
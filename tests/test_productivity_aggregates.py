@@ -0,0 +1,94 @@
+"""
+ProductivityAggregates against statistics recomputed from scratch.
+"""
+import json
+import math
+from datetime import date
+
+import numpy as np
+import pytest
+
+from productivity.analytics.productivity_aggregates import ProductivityAggregates
+
+
+def _apply(aggregates, rows):
+    """rows: (id, type code, level code, score)"""
+    ids, types, levels, scores = zip(*rows)
+    aggregates.apply(list(ids), np.array(types, dtype=np.int8), np.array(levels, dtype=np.int8), np.array(scores))
+
+
+def _stats(scores):
+    mean = sum(scores) / len(scores)
+    return {
+        "count": len(scores),
+        "mean": pytest.approx(mean),
+        "std": pytest.approx(math.sqrt(sum((s - mean) ** 2 for s in scores) / len(scores)), abs=1e-9),
+        "min": min(scores),
+        "max": max(scores),
+    }
+
+
+def _group(snapshot, type_name, level):
+    rows = [g for g in snapshot["groups"] if g["type"] == type_name and g["employment_level"] == level]
+    return {k: v for k, v in rows[0].items() if k not in ("type", "employment_level")} if rows else None
+
+
+def test_add_resave_and_move():
+    aggregates = ProductivityAggregates()
+    _apply(aggregates, [("a", 0, 0, 1.0), ("b", 0, 0, 3.0), ("c", 0, 0, 5.0), ("d", 2, 3, 2.0)])
+    snapshot = aggregates.snapshot()
+    assert _group(snapshot, "manager", "ENTRY") == _stats([1.0, 3.0, 5.0])
+    assert _group(snapshot, "hourly", "SENIOR") == _stats([2.0])
+    assert snapshot["overall"] == _stats([1.0, 3.0, 5.0, 2.0])
+
+    # re-save "c" with a new score, move "a" to another group
+    _apply(aggregates, [("c", 0, 0, 4.0), ("a", 2, 3, 7.0)])
+    snapshot = aggregates.snapshot()
+    assert _group(snapshot, "manager", "ENTRY") == _stats([3.0, 4.0])
+    assert _group(snapshot, "hourly", "SENIOR") == _stats([2.0, 7.0])
+    assert snapshot["overall"] == _stats([3.0, 4.0, 2.0, 7.0])
+
+
+def test_removed_bound_is_refreshed():
+    aggregates = ProductivityAggregates()
+    _apply(aggregates, [("lo", 1, 1, -2.0), ("mid", 1, 1, 0.5), ("hi", 1, 1, 9.0)])
+    _apply(aggregates, [("lo", 1, 1, 1.0), ("hi", 1, 1, 2.0)])  # both bounds replaced from inside the range
+
+    group = _group(aggregates.snapshot(), "individual_contributor", "INTERMEDIATE")
+    assert (group["min"], group["max"]) == (0.5, 2.0)
+
+
+def test_emptied_group_is_dropped():
+    aggregates = ProductivityAggregates()
+    _apply(aggregates, [("a", 0, 0, 1.0)])
+    _apply(aggregates, [("a", 3, 0, 1.0)])
+    snapshot = aggregates.snapshot()
+    assert _group(snapshot, "manager", "ENTRY") is None
+    assert snapshot["overall"]["count"] == 1
+
+
+@pytest.mark.parametrize("bad", [math.inf, -math.inf, math.nan])
+def test_non_finite_scores_are_left_out(bad):
+    aggregates = ProductivityAggregates()
+    _apply(aggregates, [("a", 0, 0, 1.0), ("b", 0, 0, 3.0)])
+    _apply(aggregates, [("zero-base-pay", 0, 0, bad), ("b", 0, 0, bad)])  # new employee, and a re-save
+
+    snapshot = aggregates.snapshot()
+    assert snapshot["overall"] == _stats([1.0])
+    json.dumps(snapshot, allow_nan=False)
+
+    _apply(aggregates, [("b", 0, 0, 3.0)])  # fixed later: counted again
+    assert aggregates.snapshot()["overall"] == _stats([1.0, 3.0])
+
+
+def test_rebuild_replaces_state():
+    aggregates = ProductivityAggregates()
+    _apply(aggregates, [("stale", 0, 0, 100.0)])
+
+    batches = aggregates.begin_rebuild()
+    aggregates.add_to_rebuild(batches, ["a", "b"], np.zeros(2, np.int8), np.zeros(2, np.int8), np.array([1.0, math.inf]))
+    aggregates.finish_rebuild(batches, date(2024, 5, 20))
+
+    snapshot = aggregates.snapshot()
+    assert snapshot["as_of"] == "2024-05-20"
+    assert snapshot["overall"] == _stats([1.0])
@@ -0,0 +1,176 @@
+"""
+estimate_productivity_batch must match estimate_productivity() row by row.
+"""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from productivity.analytics.productivity_engine import EmployeeColumns, estimate_productivity_batch
+from productivity.domain import employee_fulltime
+from productivity.domain.employee_base import AbstractEmployee
+from productivity.factories.employee_factory import EmployeeFactory
+
+_COMMON: Dict[str, Any] = {
+    "contact": {
+        "name": {"first_name": "Ada", "last_name": "Lovelace"},
+        "address": "123 Main St",
+        "phone_number": "555-555-5555",
+        "email": "ada@example.com",
+        "emergency_contact": {"first_name": "Emergency", "last_name": "Contact"},
+    },
+    "employment_date": "2015-03-01",
+    "education_level": "MASTERS",
+    "employment_level": "SENIOR",
+    "last_year_earnings": 125000.0,
+    "overtime_earnings": 2500.0,
+    "bonus": 8000.0,
+}
+
+
+def _manager(**overrides: Any) -> AbstractEmployee:
+    payload = {
+        **_COMMON, "type": "manager", "base_pay": 140000.0, "last_promotion_date": "2021-06-15",
+        "num_projects": 4, "num_employees": 12,
+    }
+    return EmployeeFactory.from_payload({**payload, **overrides})
+
+
+def _individual_contributor(**overrides: Any) -> AbstractEmployee:
+    payload = {
+        **_COMMON, "type": "individual_contributor", "base_pay": 130000.0, "last_promotion_date": "2020-01-10",
+        "num_projects": 3, "num_patents": 1, "num_publications": 6, "num_external_collaborations": 2,
+    }
+    return EmployeeFactory.from_payload({**payload, **overrides})
+
+
+def _hourly(**overrides: Any) -> AbstractEmployee:
+    payload = {
+        **_COMMON, "type": "hourly", "contractual_work_hours": 20.0, "actual_work_hours": 22.5, "hourly_earnings": 18.0,
+    }
+    return EmployeeFactory.from_payload({**payload, **overrides})
+
+
+def _benefits_eligible(**overrides: Any) -> AbstractEmployee:
+    payload = {**_COMMON, "type": "benefits_eligible", "contractual_work_hours": 30.0, "actual_work_hours": 28.0}
+    return EmployeeFactory.from_payload({**payload, **overrides})
+
+
+@pytest.fixture
+def today(monkeypatch):
+    """
+    Pins date.today() in the full-time module, so the object path and the batch agree on the as-of date.
+    """
+
+    def pin(as_of: date) -> date:
+        class _Today(date):
+            @classmethod
+            def today(cls) -> date:
+                return as_of
+
+        monkeypatch.setattr(employee_fulltime, "date", _Today)
+        return as_of
+
+    return pin
+
+
+def assert_parity(employees: List[AbstractEmployee], as_of: date) -> np.ndarray:
+    batch = estimate_productivity_batch(EmployeeColumns.from_employees(employees), as_of)
+    expected = np.array([e.estimate_productivity() for e in employees], dtype=np.float64)
+    np.testing.assert_array_equal(batch, expected)
+    return batch
+
+
+def test_all_types_and_levels(today):
+    as_of = today(date(2024, 5, 20))
+    employees = [
+        build(employment_level=level)
+        for build in (_manager, _individual_contributor, _hourly, _benefits_eligible)
+        for level in ("ENTRY", "INTERMEDIATE", "SENIOR", "EXECUTIVE")
+    ]
+    assert_parity(employees, as_of)
+
+
+def test_leaf_bonus_thresholds(today):
+    as_of = today(date(2024, 5, 20))
+    employees = [
+        _manager(num_employees=8), _manager(num_employees=9),
+        _individual_contributor(num_publications=4), _individual_contributor(num_publications=5),
+        _hourly(hourly_earnings=14.0), _hourly(hourly_earnings=13.99),
+    ]
+    batch = assert_parity(employees, as_of)
+    assert batch[1] - batch[0] == pytest.approx(1.8)
+    assert batch[3] - batch[2] == pytest.approx(1.3)
+    assert batch[5] - batch[4] == pytest.approx(3.0)
+
+
+def test_project_bonus_threshold(today):
+    as_of = today(date(2024, 5, 20))
+    employees = [_manager(num_projects=2), _manager(num_projects=3), _individual_contributor(num_projects=2)]
+    batch = assert_parity(employees, as_of)
+    assert batch[1] - batch[0] == pytest.approx(1.5)
+
+
+@pytest.mark.parametrize(
+    "promoted, penalized",
+    [
+        ("2021-05-20", False),  # exactly 3 full years
+        ("2020-05-21", False),  # one day short of 4
+        ("2020-05-20", True),   # 4th anniversary today
+        ("2020-05-19", True),
+    ],
+)
+def test_promotion_penalty_threshold(today, promoted, penalized):
+    as_of = today(date(2024, 5, 20))
+    employees = [_manager(last_promotion_date=promoted), _individual_contributor(last_promotion_date=promoted)]
+    batch = assert_parity(employees, as_of)
+    fresh = estimate_productivity_batch(
+        EmployeeColumns.from_employees([_manager(last_promotion_date=as_of.isoformat())]), as_of
+    )
+    assert bool(batch[0] < fresh[0]) is penalized
+
+
+@pytest.mark.parametrize(
+    "as_of",
+    [date(2028, 2, 28), date(2028, 2, 29), date(2028, 3, 1), date(2029, 2, 28), date(2029, 3, 1)],
+)
+def test_leap_day_promotion(today, as_of):
+    today(as_of)
+    employees = [
+        _manager(last_promotion_date="2024-02-29"),
+        _manager(last_promotion_date="2025-02-28"),
+        _individual_contributor(last_promotion_date="2025-03-01"),
+    ]
+    assert_parity(employees, as_of)
+
+
+def test_anniversary_around_today(today):
+    as_of = today(date.today())
+    anniversary = date(as_of.year - 4, as_of.month, as_of.day)  # 4 years back is a leap year too, so Feb 29 works
+    employees = [
+        _manager(last_promotion_date=(anniversary + timedelta(days=delta)).isoformat())
+        for delta in (-1, 0, 1)
+    ]
+    assert_parity(employees, as_of)
+
+
+def test_missing_promotion_date(today):
+    # part-time rows have no last_promotion_date (ordinal 0) and must never get the penalty
+    as_of = today(date(2024, 5, 20))
+    employees = [_hourly(), _benefits_eligible(), _manager(last_promotion_date="2010-01-01"), _benefits_eligible()]
+    columns = EmployeeColumns.from_employees(employees)
+    assert columns.last_promotion_ordinal.tolist()[:2] == [0, 0]
+    assert_parity(employees, as_of)
+
+
+def test_default_as_of_is_today():
+    employees = [_manager(last_promotion_date=(date.today() - timedelta(days=4 * 366)).isoformat()), _hourly()]
+    batch = estimate_productivity_batch(EmployeeColumns.from_employees(employees))
+    np.testing.assert_array_equal(batch, [e.estimate_productivity() for e in employees])
+
+
+def test_empty_batch():
+    assert estimate_productivity_batch(EmployeeColumns.from_employees([]), date(2024, 1, 1)).shape == (0,)
@@ -0,0 +1,135 @@
+"""
+ProductivityRanking against a brute-force ranking of the same scores.
+"""
+import json
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+from productivity.analytics.productivity_engine import EMPLOYEE_TYPES, EmployeeColumns, estimate_productivity_batch
+from productivity.analytics.productivity_ranking import ProductivityRanking
+
+
+def _batch(rng, ids):
+    types = np.array([rng.randrange(len(EMPLOYEE_TYPES)) for _ in ids], dtype=np.int8)
+    levels = np.zeros(len(ids), dtype=np.int8)
+    # few distinct values, so ties are common
+    scores = np.array([rng.choice([0.5, 1.0, 1.25, 2.0, 3.5, float("nan")]) + rng.randrange(3) for _ in ids])
+    return list(ids), types, levels, scores
+
+
+def _expected(current, employee_id):
+    type_code, score = current[employee_id]
+
+    def position(scores):
+        below = sum(s < score for s in scores)
+        ties = sum(s == score for s in scores)
+        n = len(scores)
+        return {"rank": n - (below + ties) + 1, "of": n, "percentile": 100.0 * (below + ties / 2) / n}
+    same_type = [s for t, s in current.values() if t == type_code]
+    return position(same_type), position([s for _, s in current.values()])
+
+
+def _fold(current, batch):
+    for eid, t, s in zip(batch[0], batch[1].tolist(), batch[3].tolist()):
+        if s == s:
+            current[eid] = (t, s)
+        else:
+            current.pop(eid, None)
+
+
+def _check(ranking, current):
+    for eid in current:
+        got = ranking.percentile(eid)
+        assert (got["within_type"], got["overall"]) == _expected(current, eid)
+    ordered = sorted(((s, eid) for eid, (_, s) in current.items()), reverse=True)
+    assert [r["employee_id"] for r in ranking.top(10)["results"]] == [eid for _, eid in ordered[:10]]
+    assert [r["employee_id"] for r in ranking.top(10, bottom=True)["results"]] == [eid for _, eid in sorted(ordered)[:10]]
+    for code, name in enumerate(EMPLOYEE_TYPES):
+        in_type = sorted(((s, eid) for eid, (t, s) in current.items() if t == code), reverse=True)
+        assert [r["employee_id"] for r in ranking.top(5, employee_type=name)["results"]] == [eid for _, eid in in_type[:5]]
+
+
+def test_incremental_updates_match_brute_force():
+    rng = random.Random(0)
+    ranking, current = ProductivityRanking(), {}
+    for _ in range(20):
+        batch = _batch(rng, [f"e{rng.randrange(300)}" for _ in range(40)])
+        ranking.apply(*batch)
+        _fold(current, batch)
+    _check(ranking, current)
+    assert ranking.percentile("never-saved") is None
+
+
+def test_rebuild_replays_updates_made_while_it_ran():
+    rng = random.Random(1)
+    ranking, current = ProductivityRanking(), {}
+    ranking.apply(*_batch(rng, [f"stale{i}" for i in range(50)]))  # not in the repository any more
+
+    batches, concurrent = ranking.begin_rebuild(), []
+    for start in range(0, 500, 100):
+        page = _batch(rng, [f"e{i}" for i in range(start, start + 100)])
+        ranking.add_to_rebuild(batches, *page)
+        _fold(current, page)
+        concurrent.append(_batch(rng, [f"e{rng.randrange(600)}" for _ in range(10)]))
+        ranking.apply(*concurrent[-1])
+    ranking.finish_rebuild(batches, date(2024, 5, 20))
+
+    # saves made during the rebuild are newer than any page, so they win
+    for batch in concurrent:
+        _fold(current, batch)
+    assert ranking.as_of == date(2024, 5, 20)
+    assert ranking.percentile("stale0") is None
+    _check(ranking, current)
+
+
+def test_abort_rebuild_keeps_the_live_state():
+    rng = random.Random(2)
+    ranking = ProductivityRanking()
+    ranking.apply(*_batch(rng, ["a", "b", "c"]))
+    before = ranking.top(3)
+
+    batches = ranking.begin_rebuild()
+    ranking.add_to_rebuild(batches, *_batch(rng, ["x"]))
+    ranking.abort_rebuild()
+
+    assert ranking.top(3) == before
+
+
+@pytest.mark.parametrize("a, b", [(0.0, 0.0), (0.0, -0.0), (-1.5, -1.5)])
+def test_ties(a, b):
+    ranking = ProductivityRanking()
+    ranking.apply(["a", "b", "c"], np.zeros(3, dtype=np.int8), np.zeros(3, dtype=np.int8), np.array([a, b, -10.0]))
+    assert ranking.percentile("a")["within_type"] == {"rank": 1, "of": 3, "percentile": 100.0 * (1 + 2 / 2) / 3}
+
+
+def test_zero_denominator_employees_are_not_ranked(make_employees):
+    employees = make_employees(40)
+    for i, e in enumerate(employees):
+        e.id = f"e{i}"
+    manager = next(e for e in employees if e.__class__.__name__ == "Manager")
+    part_timer = next(e for e in employees if e.__class__.__name__ == "HourlyEmployee")
+    manager.base_pay = 0.0
+    part_timer.contractual_work_hours = 0.0
+
+    columns = EmployeeColumns.from_employees(employees)
+    scores = estimate_productivity_batch(columns, date(2024, 5, 20))
+    ids = [e.id for e in employees]
+    assert np.isinf(scores).sum() == 2
+
+    incremental, rebuilt = ProductivityRanking(), ProductivityRanking()
+    incremental.apply(ids, columns.employee_type, columns.employment_level, scores)
+    batches = rebuilt.begin_rebuild()
+    rebuilt.add_to_rebuild(batches, ids, columns.employee_type, columns.employment_level, scores)
+    rebuilt.finish_rebuild(batches, date(2024, 5, 20))
+
+    for ranking in (incremental, rebuilt):
+        assert ranking.percentile(manager.id) is None
+        assert ranking.percentile(part_timer.id) is None
+        everyone = ranking.top(len(employees))
+        assert len(everyone["results"]) == len(employees) - 2
+        json.dumps(everyone, allow_nan=False)
+        ranked = [eid for eid in ids if eid not in (manager.id, part_timer.id)]
+        json.dumps([ranking.percentile(eid) for eid in ranked], allow_nan=False)
@@ -0,0 +1,122 @@
+"""
+Request profiling: the stack sampler, cProfile capture and the /profiles endpoints.
+"""
+import cProfile
+import pstats
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from productivity.api.profiling import install_request_profiling
+from productivity.observability.profiling import RequestProfiler, _StackSampler
+
+
+def busy_handler_work(seconds=0.05):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(200))
+
+
+def _function_names(path):
+    return {name for _, _, name in pstats.Stats(str(path)).stats}
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+
+    @app.get("/work")
+    def work_view():
+        busy_handler_work()
+        return {"ok": True}, 200
+
+    @app.get("/boom")
+    def boom_view():
+        raise RuntimeError("boom")
+
+    profiler = RequestProfiler(tmp_path / "profiles", keep=2)
+    install_request_profiling(app, profiler)
+    return app
+
+
+def test_sampler_collects_the_target_threads_stack():
+    done = threading.Event()
+    worker = threading.Thread(target=lambda: (busy_handler_work(0.2), done.set()))
+    worker.start()
+    sampler = _StackSampler(worker.ident, interval=0.001)
+    sampler.start()
+    done.wait()
+    sampler.stop()
+    worker.join()
+
+    assert sum(sampler.counts.values()) > 0
+    assert any("busy_handler_work (test_profiling.py:" in stack.split(";")[-1] for stack in sampler.counts)
+
+
+@pytest.mark.parametrize("mode", ["deterministic", "sampling"])
+def test_triggered_profile_is_written(tmp_path, mode):
+    profiler = RequestProfiler(tmp_path, mode=mode, sample_interval=0.001)
+
+    assert profiler.start({}) is None
+    active = profiler.start({"X-Profile": "1"})
+    busy_handler_work()
+    record = active.finish("GET", "/work", "/work", 200)
+
+    assert record.mode == mode
+    path = profiler.path_of(record.id)
+    if mode == "deterministic":
+        assert "busy_handler_work" in _function_names(path)
+    else:
+        assert "busy_handler_work" in path.read_text()
+    assert profiler.recent() == [record.to_dict()]
+
+
+def test_busy_cprofile_falls_back_to_sampling(tmp_path, monkeypatch):
+    def taken(self):
+        raise ValueError("Another profiling tool is already active")
+
+    monkeypatch.setattr(cProfile.Profile, "enable", taken)
+    profiler = RequestProfiler(tmp_path)
+
+    active = profiler.start({"X-Profile": "deterministic"})
+    record = active.finish("GET", "/work", "/work", 200)
+
+    assert record.mode == "sampling"
+    assert record.file.endswith(".folded")
+
+
+def test_endpoint_profiles_a_request(app):
+    client = app.test_client()
+
+    response = client.get("/work", headers={"X-Profile": "deterministic"})
+    profile_id = response.headers["X-Profile-Id"]
+    listing = client.get("/profiles").get_json()
+    download = client.get(f"/profiles/{profile_id}")
+
+    assert [p["id"] for p in listing["profiles"]] == [profile_id]
+    assert listing["profiles"][0]["route"] == "/work"
+    assert download.status_code == 200
+    names = _function_names(app.config["PROFILER"].path_of(profile_id))
+    assert {"work_view", "busy_handler_work"} <= names
+    assert client.get("/profiles/missing").status_code == 404
+
+
+def test_endpoint_skips_untriggered_and_records_failures(app):
+    client = app.test_client()
+    assert "X-Profile-Id" not in client.get("/work").headers
+
+    app.testing = False  # let the view's exception become a 500
+    assert client.get("/boom", headers={"X-Profile": "1"}).status_code == 500
+
+    assert [(p["route"], p["status"]) for p in client.get("/profiles").get_json()["profiles"]] == [("/boom", 500)]
+
+
+def test_old_profiles_are_evicted(app):
+    client = app.test_client()
+    ids = [client.get("/work", headers={"X-Profile": "sampling"}).headers["X-Profile-Id"] for _ in range(3)]
+    profiler = app.config["PROFILER"]
+
+    assert [p["id"] for p in profiler.recent()] == ids[:0:-1]
+    assert len(list(profiler.directory.iterdir())) == 2
@@ -0,0 +1,46 @@
+"""
+ml.train_model: subsampled loading and seeded training on a generated dataset.
+"""
+from datetime import date
+
+import numpy as np
+import pytest
+
+from ml import train_model
+from ml.generate_dataset import sample_chunk
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    # sorted by bonus, so a sample that only takes the head of the file shows up as low bonuses
+    frame = sample_chunk(np.random.default_rng(0), 20_000, date(2024, 5, 20), noise_std=0.15)
+    path = tmp_path / "employees.csv"
+    frame.sort_values("bonus").to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("text, rows", [("a,b\n", 0), ("a,b\n1,2\n3,4\n", 2), ("a,b\n1,2\n3,4", 2), ("", 0)])
+def test_count_csv_rows(tmp_path, text, rows):
+    path = tmp_path / "rows.csv"
+    path.write_text(text)
+    assert train_model._count_csv_rows(path) == rows
+
+
+def test_csv_sample_spans_the_whole_file(csv_path, monkeypatch):
+    monkeypatch.setattr(train_model, "READ_CHUNK_ROWS", 1_000)
+    full = train_model.load_dataset(csv_path)
+
+    sample = train_model.load_dataset(csv_path, max_rows=2_000, seed=1)
+
+    assert 1_500 <= len(sample) <= 2_000
+    assert sample["bonus"].max() > full["bonus"].quantile(0.9)
+    assert sample.equals(train_model.load_dataset(csv_path, max_rows=2_000, seed=1))
+
+
+def test_seed_drives_split_and_model(csv_path, tmp_path):
+    def mae(seed):
+        # no max_rows: the seed only reaches the split and the forest
+        return train_model.train(csv_path, tmp_path / f"model-{seed}.pkl", n_jobs=1, n_estimators=5, seed=seed)["mae"]
+
+    assert mae(1) == mae(1)
+    assert mae(1) != mae(2)